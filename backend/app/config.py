@@ -1,7 +1,7 @@
 from functools import lru_cache
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -15,6 +15,28 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 60
     allowed_origins: List[str] = ["*"]
     cors_allow_credentials: bool = True
+    export_retention_max_age_days: Optional[int] = None
+    export_retention_max_total_bytes: Optional[int] = None
+    export_retention_keep_last: Optional[int] = None
+    export_retention_download_grace_minutes: int = 60
+    export_retention_interval_seconds: int = 3600
+    skill_index_ttl_seconds: int = 300
+    membership_cache_ttl_seconds: int = 300
+    # Memberships authorize requests: 0 re-checks the MembershipVersion row on every read.
+    membership_version_poll_seconds: Optional[int] = 0
+    auto_assign_interval_seconds: int = 60
+    auto_assign_max_active_per_user: int = 20
+    auto_assign_batch_size: int = 200
+    throughput_cache_seconds: int = 60
+    throughput_refresh_interval_seconds: int = 60
+    throughput_refresh_lag_seconds: int = 60
+    # Leases are opt-in: clients must renew them from the editor before they expire.
+    assignment_lease_minutes: Optional[int] = None
+    assignment_reaper_interval_seconds: int = 300
+    sentence_import_max_bytes: int = 200 * 1024 * 1024
+    near_duplicate_threshold: float = 0.8
+    idempotency_ttl_seconds: int = 24 * 3600
+    idempotency_sweep_interval_seconds: int = 3600
 
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
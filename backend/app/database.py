@@ -4,15 +4,19 @@ from typing import Iterator
 from sqlmodel import Session, SQLModel, create_engine
 
 from .config import get_settings
+from .migrations import add_missing_columns, install_search_index
 
 settings = get_settings()
 engine = create_engine(settings.database_url, echo=settings.database_echo, future=True)
 
 
 def init_db() -> None:
-    """Create database tables."""
+    """Create database tables, upgrade existing ones and install the full-text sentence index."""
 
     SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        add_missing_columns(connection)
+        install_search_index(connection)
 
 
 @contextmanager
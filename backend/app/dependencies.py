@@ -3,11 +3,12 @@ from typing import Optional
 
 from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlmodel import Session, select
+from sqlmodel import Session
 
 from .database import get_session
 from .enums import Role
-from .models import ProjectMembership, Sentence, User
+from .models import Sentence, User
+from .services.membership_cache import membership_cache
 from .services.security import decode_access_token
 
 
@@ -157,12 +158,8 @@ def _attach_project_context(
             project_id = None
 
     if project_id is not None and role not in {Role.ADMIN, Role.ASSIGNMENT_ENGINE}:
-        membership = session.exec(
-            select(ProjectMembership).where(
-                ProjectMembership.user_id == user.id, ProjectMembership.project_id == project_id
-            )
-        ).first()
-        if not membership or not membership.is_active or membership.approved_at is None:
+        membership = membership_cache.get(session, project_id).get(user.id)
+        if not membership or not membership.is_active or not membership.approved:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Proje üyeliği onaylanmamış veya pasif")
         project_role = membership.role
 
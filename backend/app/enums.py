@@ -14,6 +14,7 @@ class Role(str, Enum):
 class AssignmentStrategy(str, Enum):
     ROUND_ROBIN = "round_robin"
     SKILL_BASED = "skill_based"
+    THROUGHPUT = "throughput"
 
 
 class SentenceStatus(str, Enum):
@@ -55,3 +56,26 @@ class JobStatus(str, Enum):
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
+    EXPIRED = "expired"
+
+
+class SentenceImportFormat(str, Enum):
+    CSV = "csv"
+    JSON = "json"
+    TXT = "txt"
+
+
+class NearDuplicateMode(str, Enum):
+    IGNORE = "ignore"
+    FLAG = "flag"
+    SKIP = "skip"
+
+
+class CorpusImportMode(str, Enum):
+    ANNOTATED = "annotated"
+    GOLD = "gold"
+
+
+class SentenceOrder(str, Enum):
+    ID = "id"
+    UPDATED_AT = "updated_at"
@@ -1,9 +1,20 @@
-from fastapi import FastAPI
+import threading
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm.exc import StaleDataError
 
 from .config import get_settings
-from .database import init_db
+from .database import init_db, session_scope
 from .routers import audit, auth, export, health, projects, sentences
+from .services.auto_assign import start_auto_assign_scheduler
+from .services.export_retention import start_retention_sweeper
+from .services.idempotency import start_idempotency_sweeper
+from .services.leases import start_lease_reaper
+from .services.throughput import start_throughput_refresher
+from .services.workflow import STALE_SENTENCE_DETAIL
+from .services.workload import backfill_assignment_load
 
 settings = get_settings()
 app = FastAPI(title=settings.app_name)
@@ -17,9 +28,32 @@ app.add_middleware(
 )
 
 
+@app.exception_handler(StaleDataError)
+def stale_data_conflict(request: Request, exc: StaleDataError) -> JSONResponse:
+    # A versioned row changed between read and write; the client should reload and retry.
+    return JSONResponse(status_code=status.HTTP_409_CONFLICT, content={"detail": STALE_SENTENCE_DETAIL})
+
+
+_background_stop = threading.Event()
+
+
 @app.on_event("startup")
 def on_startup() -> None:
     init_db()
+    with session_scope() as session:
+        backfill_assignment_load(session)
+        session.commit()
+    _background_stop.clear()
+    start_retention_sweeper(settings, _background_stop)
+    start_auto_assign_scheduler(settings, _background_stop)
+    start_lease_reaper(settings, _background_stop)
+    start_idempotency_sweeper(settings, _background_stop)
+    start_throughput_refresher(settings, _background_stop)
+
+
+@app.on_event("shutdown")
+def on_shutdown() -> None:
+    _background_stop.set()
 
 
 app.include_router(health.router)
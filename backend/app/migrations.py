@@ -0,0 +1,101 @@
+"""Idempotent schema upgrades ``init_db`` runs on every start.
+
+Existing databases are brought up to the current models in place: new columns and indexes
+and the full-text sentence index. There is no per-release migration history.
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy import Column, event, inspect, literal, text
+from sqlalchemy.engine import Connection
+from sqlmodel import SQLModel
+
+from .models import Sentence
+
+# Letters the database tokenizers do not fold on their own; everything else (case, other
+# diacritics, punctuation) is handled by FTS5 ``unicode61 remove_diacritics 2`` or by the
+# Postgres ``simple`` configuration after ``translate``.
+_SQLITE_FOLDED = "replace(replace({column}, 'ı', 'i'), 'İ', 'i')"
+POSTGRES_SEARCH_VECTOR = (
+    "to_tsvector('simple', translate(sentence.text, 'IİıÇçĞğÖöŞşÜüÂâÎîÛû', 'iiiccggoossuuaaiiuu'))"
+)
+
+_SQLITE_DDL = [
+    """CREATE VIRTUAL TABLE sentence_fts USING fts5(body, tokenize = "unicode61 remove_diacritics 2")""",
+    f"""CREATE TRIGGER IF NOT EXISTS sentence_fts_insert AFTER INSERT ON sentence BEGIN
+           INSERT INTO sentence_fts(rowid, body) VALUES (new.id, {_SQLITE_FOLDED.format(column="new.text")});
+       END""",
+    f"""CREATE TRIGGER IF NOT EXISTS sentence_fts_update AFTER UPDATE OF text ON sentence BEGIN
+           UPDATE sentence_fts SET body = {_SQLITE_FOLDED.format(column="new.text")} WHERE rowid = new.id;
+       END""",
+    """CREATE TRIGGER IF NOT EXISTS sentence_fts_delete AFTER DELETE ON sentence BEGIN
+           DELETE FROM sentence_fts WHERE rowid = old.id;
+       END""",
+    # Sentences stored before the index existed.
+    f"INSERT INTO sentence_fts(rowid, body) SELECT id, {_SQLITE_FOLDED.format(column='text')} FROM sentence",
+]
+_POSTGRES_DDL = f"CREATE INDEX IF NOT EXISTS ix_sentence_search ON sentence USING GIN (({POSTGRES_SEARCH_VECTOR}))"
+
+
+def add_missing_columns(connection: Connection) -> list[str]:
+    """Add columns and indexes that models gained after their table was created.
+
+    ``create_all`` only creates missing tables, so upgraded databases would otherwise lack
+    new columns. Safe to run on every start; returns the added ``table.column`` names.
+    """
+
+    inspector = inspect(connection)
+    preparer = connection.dialect.identifier_preparer
+    added: list[str] = []
+    for table in SQLModel.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = (
+                f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {preparer.format_column(column)} "
+                f"{column.type.compile(dialect=connection.dialect)}"
+            )
+            default = _default_literal(connection, column)
+            if default is not None:
+                ddl += f" DEFAULT {default}"
+            if not column.nullable:
+                if default is None:
+                    raise RuntimeError(f"{table.name}.{column.name} is NOT NULL without a default")
+                ddl += " NOT NULL"
+            connection.execute(text(ddl))
+            added.append(f"{table.name}.{column.name}")
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+    return added
+
+
+def _default_literal(connection: Connection, column: Column) -> Optional[str]:
+    if column.server_default is not None:
+        value = column.server_default.arg
+        if not isinstance(value, str):
+            return str(value.compile(dialect=connection.dialect))
+    elif column.default is not None and column.default.is_scalar and column.default.arg is not None:
+        value = column.default.arg
+    else:
+        return None
+    return str(literal(value).compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True}))
+
+
+def install_search_index(connection: Connection) -> None:
+    """Create the full-text index and the machinery keeping it current; a no-op when present."""
+
+    if connection.dialect.name == "sqlite":
+        exists = connection.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sentence_fts'")
+        ).first()
+        if not exists:
+            for statement in _SQLITE_DDL:
+                connection.execute(text(statement))
+    elif connection.dialect.name == "postgresql":
+        connection.execute(text(_POSTGRES_DDL))
+
+
+@event.listens_for(Sentence.__table__, "after_create")
+def _create_search_index(target: Any, connection: Connection, **kwargs: Any) -> None:
+    install_search_index(connection)
@@ -1,27 +1,45 @@
 from .adjudication import Adjudication
+from .annotator_throughput import AnnotatorThroughput, ThroughputCursor
 from .annotation import Annotation
 from .assignment import Assignment
+from .assignment_load import AssignmentLoad
 from .audit import AuditLog
+from .corpus_import import CorpusImportCheckpoint
 from .failed_submission import FailedSubmission
+from .failure_rollup import FailureRollup
+from .idempotency import IdempotencyRecord
 from .export_job import ExportJob
 from .project import Project
 from .membership import ProjectMembership
+from .membership_version import MembershipVersion
 from .review import Review
 from .sentence import Sentence
+from .sentence_minhash import SentenceLshBucket, SentenceMinHash
 from .user_profile import UserProfile
 from .user import User
+from .validation_report_blob import ValidationReportBlob
 
 __all__ = [
     "Adjudication",
     "Annotation",
+    "AnnotatorThroughput",
     "Assignment",
+    "AssignmentLoad",
     "AuditLog",
+    "CorpusImportCheckpoint",
     "ExportJob",
     "FailedSubmission",
+    "FailureRollup",
+    "IdempotencyRecord",
+    "MembershipVersion",
     "ProjectMembership",
     "Project",
     "Review",
     "Sentence",
+    "SentenceLshBucket",
+    "SentenceMinHash",
+    "ThroughputCursor",
     "UserProfile",
     "User",
+    "ValidationReportBlob",
 ]
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+
+class AnnotatorThroughput(SQLModel, table=True):
+    """Running per-annotator totals derived from the audit log of a project."""
+
+    __table_args__ = (UniqueConstraint("project_id", "user_id", name="uq_annotator_throughput_key"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    project_id: int = Field(foreign_key="project.id", nullable=False)
+    user_id: int = Field(nullable=False)
+    submitted_count: int = Field(default=0, nullable=False)
+    total_latency_seconds: float = Field(default=0.0, nullable=False)
+    reviewed_count: int = Field(default=0, nullable=False)
+    approved_count: int = Field(default=0, nullable=False)
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow, nullable=False, sa_column_kwargs={"onupdate": datetime.utcnow}
+    )
+
+
+class ThroughputCursor(SQLModel, table=True):
+    """Last audit log id folded into ``AnnotatorThroughput`` for a project."""
+
+    project_id: int = Field(foreign_key="project.id", primary_key=True)
+    last_audit_id: int = Field(default=0, nullable=False)
@@ -1,18 +1,26 @@
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 from ..enums import Role
 
 
 class Assignment(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_assignment_active_lease", "is_active", "lease_expires_at"),
+        # "My tasks": a user's active assignments in keyset order.
+        Index("ix_assignment_user_active_id", "user_id", "is_active", "id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     sentence_id: int = Field(foreign_key="sentence.id", nullable=False, index=True)
     user_id: int = Field(nullable=False, index=True)
     role: Role = Field(default=Role.ANNOTATOR, nullable=False)
     is_blind: bool = Field(default=False, nullable=False)
     is_active: bool = Field(default=True, nullable=False)
+    lease_expires_at: Optional[datetime] = Field(default=None, nullable=True)
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
     updated_at: datetime = Field(
         default_factory=datetime.utcnow, nullable=False, sa_column_kwargs={"onupdate": datetime.utcnow}
@@ -0,0 +1,22 @@
+from typing import Optional
+
+from sqlalchemy import UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+from ..enums import Role
+
+
+class AssignmentLoad(SQLModel, table=True):
+    """Number of active assignments a user holds in a project for one role.
+
+    Maintained on write wherever ``Assignment.is_active`` changes so the assignment engine
+    can read workload without scanning assignment history.
+    """
+
+    __table_args__ = (UniqueConstraint("project_id", "role", "user_id", name="uq_assignment_load_key"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    project_id: int = Field(foreign_key="project.id", nullable=False)
+    role: Role = Field(nullable=False)
+    user_id: int = Field(nullable=False)
+    active_count: int = Field(default=0, nullable=False)
@@ -0,0 +1,35 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, Column, UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+from ..enums import CorpusImportMode, JobStatus
+
+
+class CorpusImportCheckpoint(SQLModel, table=True):
+    """Progress of a PENMAN corpus import so an interrupted run resumes where it stopped.
+
+    ``byte_offset`` points just past the last graph whose rows were committed together with
+    this checkpoint.
+    """
+
+    __table_args__ = (UniqueConstraint("project_id", "file_checksum", name="uq_corpus_import_project_file"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    project_id: int = Field(foreign_key="project.id", nullable=False, index=True)
+    source_name: str = Field(nullable=False, max_length=128)
+    file_checksum: str = Field(nullable=False, max_length=64)
+    mode: CorpusImportMode = Field(nullable=False)
+    status: JobStatus = Field(default=JobStatus.RUNNING, nullable=False)
+    created_by: Optional[int] = Field(default=None)
+    byte_offset: int = Field(default=0, nullable=False)
+    graphs_read: int = Field(default=0, nullable=False)
+    sentences_created: int = Field(default=0, nullable=False)
+    duplicates: int = Field(default=0, nullable=False)
+    invalid: int = Field(default=0, nullable=False)
+    errors: list[dict[str, Any]] = Field(default_factory=list, sa_column=Column(JSON, nullable=False))
+    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow, nullable=False, sa_column_kwargs={"onupdate": datetime.utcnow}
+    )
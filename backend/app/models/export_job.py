@@ -20,6 +20,10 @@ class ExportJob(SQLModel, table=True):
     include_failed: bool = Field(default=False, nullable=False)
     include_rejected: bool = Field(default=False, nullable=False)
     result_path: Optional[str] = Field(default=None, max_length=500)
+    checksum: Optional[str] = Field(default=None, max_length=64)
+    size_bytes: Optional[int] = Field(default=None)
+    last_downloaded_at: Optional[datetime] = Field(default=None)
+    expired_at: Optional[datetime] = Field(default=None)
     error_message: Optional[str] = Field(default=None, max_length=500)
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
     updated_at: datetime = Field(
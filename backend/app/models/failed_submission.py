@@ -1,13 +1,15 @@
 from datetime import datetime
 from typing import Any, Optional
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, Index
 from sqlmodel import Field, SQLModel
 
 JSONValue = Any
 
 
 class FailedSubmission(SQLModel, table=True):
+    __table_args__ = (Index("ix_failedsubmission_project_created", "project_id", "created_at"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     project_id: int = Field(foreign_key="project.id", nullable=False, index=True)
     sentence_id: int = Field(foreign_key="sentence.id", nullable=False, index=True)
@@ -22,4 +24,11 @@ class FailedSubmission(SQLModel, table=True):
     role_set_version: Optional[str] = Field(default=None, max_length=64)
     rule_version: Optional[str] = Field(default=None, max_length=64)
     submitted_penman: Optional[str] = Field(default=None)
+    penman_base_id: Optional[int] = Field(default=None, foreign_key="failedsubmission.id")
+    penman_delta: Optional[str] = Field(default=None)
+    penman_delta_depth: int = Field(default=0, nullable=False)
+    report_hash: Optional[str] = Field(default=None, foreign_key="validationreportblob.report_hash", max_length=64)
+    primary_error_code: Optional[str] = Field(default=None, index=True, max_length=64)
+    error_codes: Optional[str] = Field(default=None, max_length=500)
+    warning_codes: Optional[str] = Field(default=None, max_length=500)
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
@@ -0,0 +1,31 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import Index, UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+ALL_CODES = "*"
+
+
+class FailureRollup(SQLModel, table=True):
+    """Daily failure counters maintained on write.
+
+    ``error_code == ALL_CODES`` rows count failures; per-code rows count failures carrying
+    that code, so a failure with several codes contributes to several of them.
+    ``user_id`` is 0 when the failure has no author.
+    """
+
+    __table_args__ = (
+        UniqueConstraint(
+            "project_id", "bucket_date", "failure_type", "user_id", "error_code", name="uq_failure_rollup_key"
+        ),
+        Index("ix_failure_rollup_project_date", "project_id", "bucket_date"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    project_id: int = Field(foreign_key="project.id", nullable=False)
+    bucket_date: date = Field(nullable=False)
+    failure_type: str = Field(nullable=False, max_length=64)
+    user_id: int = Field(default=0, nullable=False)
+    error_code: str = Field(default=ALL_CODES, nullable=False, max_length=64)
+    count: int = Field(default=0, nullable=False)
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Any, Optional
+
+from sqlalchemy import JSON, Column, UniqueConstraint
+from sqlmodel import Field, SQLModel
+
+
+class IdempotencyRecord(SQLModel, table=True):
+    """Stored response of a mutation sent with an ``Idempotency-Key`` header."""
+
+    __table_args__ = (UniqueConstraint("user_id", "key", name="uq_idempotency_user_key"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    user_id: int = Field(nullable=False)
+    key: str = Field(nullable=False, max_length=255)
+    scope: str = Field(nullable=False, max_length=255)
+    request_hash: str = Field(nullable=False, max_length=64)
+    status_code: int = Field(nullable=False)
+    response_body: Any = Field(default=None, sa_column=Column(JSON))
+    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
+    expires_at: datetime = Field(nullable=False, index=True)
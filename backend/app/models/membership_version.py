@@ -0,0 +1,11 @@
+from sqlmodel import Field, SQLModel
+
+
+class MembershipVersion(SQLModel, table=True):
+    """Monotonic counter bumped whenever a project's memberships change.
+
+    Lets processes holding a cached membership snapshot notice writes made elsewhere.
+    """
+
+    project_id: int = Field(foreign_key="project.id", primary_key=True)
+    version: int = Field(default=0, nullable=False)
@@ -13,6 +13,10 @@ class Project(SQLModel, table=True):
     validation_rule_version: str = Field(default="v1", nullable=False, max_length=64)
     version_tag: str = Field(default="v1", nullable=False, max_length=64)
     description: Optional[str] = Field(default=None, max_length=500)
+    annotators_per_sentence: int = Field(default=1, nullable=False)
+    auto_assign_enabled: bool = Field(default=False, nullable=False)
+    # Annotators of a blind project do not see each other's work.
+    blind_annotation: bool = Field(default=False, nullable=False)
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
     updated_at: datetime = Field(
         default_factory=datetime.utcnow, nullable=False, sa_column_kwargs={"onupdate": datetime.utcnow}
@@ -1,18 +1,34 @@
 from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import Column, Index, Integer
 from sqlmodel import Field, SQLModel
 
 from ..enums import SentenceStatus
 
+# Bumped by every UPDATE; ORM flushes compare-and-set on it and raise StaleDataError on a mismatch.
+_version_column = Column("version", Integer, nullable=False, default=1, server_default="1")
+
 
 class Sentence(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_sentence_project_content_hash", "project_id", "content_hash"),
+        # Keyset pagination of project listings.
+        Index("ix_sentence_project_status_id", "project_id", "status", "id"),
+        Index("ix_sentence_project_updated_at_id", "project_id", "updated_at", "id"),
+    )
+    __mapper_args__ = {"version_id_col": _version_column}
+
     id: Optional[int] = Field(default=None, primary_key=True)
     project_id: int = Field(foreign_key="project.id", nullable=False, index=True)
     text: str = Field(nullable=False)
     source: Optional[str] = Field(default=None, max_length=128)
     difficulty_tag: Optional[str] = Field(default=None, max_length=64)
+    priority: int = Field(default=0, nullable=False)
+    content_hash: Optional[str] = Field(default=None, max_length=64)
+    external_id: Optional[str] = Field(default=None, max_length=128)
     status: SentenceStatus = Field(default=SentenceStatus.NEW, nullable=False, index=True)
+    version: int = Field(default=1, sa_column=_version_column)
     created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
     updated_at: datetime = Field(
         default_factory=datetime.utcnow, nullable=False, sa_column_kwargs={"onupdate": datetime.utcnow}
@@ -0,0 +1,24 @@
+from typing import Optional
+
+from sqlalchemy import JSON, BigInteger, Column, Index
+from sqlmodel import Field, SQLModel
+
+
+class SentenceMinHash(SQLModel, table=True):
+    """MinHash signature of a sentence's folded character shingles."""
+
+    sentence_id: int = Field(foreign_key="sentence.id", primary_key=True)
+    project_id: int = Field(foreign_key="project.id", nullable=False, index=True)
+    signature: list[int] = Field(default_factory=list, sa_column=Column(JSON, nullable=False))
+
+
+class SentenceLshBucket(SQLModel, table=True):
+    """One LSH band of a sentence's signature; sentences sharing a bucket are similarity candidates."""
+
+    __table_args__ = (Index("ix_sentence_lsh_bucket_lookup", "project_id", "band", "bucket"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    project_id: int = Field(foreign_key="project.id", nullable=False)
+    band: int = Field(nullable=False)
+    bucket: int = Field(sa_column=Column(BigInteger, nullable=False))
+    sentence_id: int = Field(foreign_key="sentence.id", nullable=False, index=True)
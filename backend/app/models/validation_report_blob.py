@@ -0,0 +1,15 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import JSON, Column
+from sqlmodel import Field, SQLModel
+
+JSONValue = Any
+
+
+class ValidationReportBlob(SQLModel, table=True):
+    """Content-addressed validation report shared by identical failed submissions."""
+
+    report_hash: str = Field(primary_key=True, max_length=64)
+    report: dict[str, JSONValue] = Field(sa_column=Column(JSON, nullable=False))
+    created_at: datetime = Field(default_factory=datetime.utcnow, nullable=False)
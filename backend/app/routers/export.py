@@ -1,17 +1,33 @@
 from __future__ import annotations
 
+import os
+from datetime import datetime, timedelta
+
 from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from pathlib import Path
+from starlette.background import BackgroundTasks
 from sqlmodel import Session
 
-from ..database import get_session
+from ..config import get_settings
+from ..database import get_session, session_scope
 from ..dependencies import CurrentUser, get_current_user
 from ..enums import ExportLevel, ExportFormat, PiiStrategy, Role, JobStatus
 from ..models import ExportJob, Project
 from ..schemas import ExportJobCreate, ExportJobPublic, ExportRequestParams
 from ..services.export import ExportRequest, ExportService, ExportAccessError, ExportNotFoundError
+from ..services.export_worker import ExportWorker
+from ..services.export_download import (
+    DownloadLease,
+    RangeNotSatisfiableError,
+    download_tracker,
+    etag_matches,
+    iter_leased_file,
+    parse_range,
+    strong_etag,
+)
 from ..services.job_queue import ExportJobQueue
+from ..services.preference_pairs import PreferencePairBuilder, PreferencePairRequest
 from ..services.workflow import require_roles
 
 router = APIRouter(prefix="/exports", tags=["exports"])
@@ -37,7 +53,10 @@ def _job_to_public(job: ExportJob) -> ExportJobPublic:
         include_failed=job.include_failed,
         include_rejected=job.include_rejected,
         result_path=job.result_path,
+        checksum=job.checksum,
+        size_bytes=job.size_bytes,
         error_message=job.error_message,
+        expired_at=job.expired_at,
         created_at=job.created_at,
         updated_at=job.updated_at,
     )
@@ -86,6 +105,36 @@ def download_export(
     return payload
 
 
+def _stream_preference_pairs(request: PreferencePairRequest):
+    # The request-scoped session is closed before streaming starts, so the stream owns its own.
+    with session_scope() as session:
+        yield from PreferencePairBuilder(session).iter_jsonl(request)
+
+
+@router.get("/project/{project_id}/preference-pairs")
+def download_preference_pairs(
+    project_id: int,
+    pii_strategy: PiiStrategy = PiiStrategy.ANONYMIZE,
+    include_failed: bool = True,
+    include_rejected: bool = True,
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user),
+) -> StreamingResponse:
+    require_roles(user, {Role.ADMIN, Role.CURATOR}, use_project_roles=True)
+    _ensure_project(session, project_id)
+    request = PreferencePairRequest(
+        project_id=project_id,
+        pii_strategy=pii_strategy,
+        include_failed=include_failed,
+        include_rejected=include_rejected,
+    )
+    return StreamingResponse(
+        _stream_preference_pairs(request),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="project-{project_id}-preference-pairs.jsonl"'},
+    )
+
+
 @router.post("/project/{project_id}/jobs", response_model=ExportJobPublic, status_code=status.HTTP_201_CREATED)
 def create_export_job(
     project_id: int,
@@ -126,6 +175,9 @@ def get_export_job(
 @router.get("/jobs/{job_id}/download")
 def download_export_job_result(
     job_id: int,
+    range_header: str | None = Header(default=None, alias="Range"),
+    if_range: str | None = Header(default=None, alias="If-Range"),
+    if_none_match: str | None = Header(default=None, alias="If-None-Match"),
     session: Session = Depends(get_session),
     user: CurrentUser = Depends(get_current_user),
 ):
@@ -133,12 +185,101 @@ def download_export_job_result(
     job = session.get(ExportJob, job_id)
     if not job:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export job bulunamadı")
+    if job.status == JobStatus.EXPIRED:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Export dosyası saklama süresi dolduğu için silindi")
     if job.status != JobStatus.COMPLETED or not job.result_path:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail="Job tamamlanmadı veya indirme yolu hazır değil"
         )
 
     path = Path(job.result_path)
-    if not path.exists() or not path.is_file():
+    # The file is opened under a lease before anything is decided or sent, so the retention
+    # sweeper cannot delete it between this check and the end of the stream.
+    try:
+        lease = download_tracker.open(path)
+    except OSError:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export dosyası bulunamadı")
-    return FileResponse(path, filename=path.name, media_type="application/octet-stream")
+    try:
+        return _stream_export(session, job, lease, path, range_header, if_range, if_none_match)
+    except BaseException:
+        lease.release()
+        raise
+
+
+def _stream_export(
+    session: Session,
+    job: ExportJob,
+    lease: DownloadLease,
+    path: Path,
+    range_header: str | None,
+    if_range: str | None,
+    if_none_match: str | None,
+) -> Response:
+    size = os.fstat(lease.file.fileno()).st_size
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Disposition": f'attachment; filename="{path.name}"',
+    }
+    background = BackgroundTasks()
+    background.add_task(lease.release)
+    # Jobs completed before checksums were recorded are served without a validator; the
+    # checksum is computed after the response so the first download is not held up hashing.
+    etag = strong_etag(job.checksum) if job.checksum else None
+    if etag is None:
+        background.add_task(_backfill_checksum, job.id)
+    else:
+        headers["ETag"] = etag
+
+    if etag is not None and etag_matches(if_none_match, etag):
+        lease.release()
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    # If-Range only accepts a strong validator; a stale or date-based value means "send everything".
+    byte_range = None
+    if if_range is None or (etag is not None and if_range.strip() == etag):
+        try:
+            byte_range = parse_range(range_header, size)
+        except RangeNotSatisfiableError:
+            lease.release()
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE, headers=headers)
+
+    _stamp_download(session, job)
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(
+            iter_leased_file(lease),
+            media_type="application/octet-stream",
+            headers=headers,
+            background=background,
+        )
+
+    headers["Content-Length"] = str(byte_range.length)
+    headers["Content-Range"] = byte_range.content_range(size)
+    return StreamingResponse(
+        iter_leased_file(lease, byte_range),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type="application/octet-stream",
+        headers=headers,
+        background=background,
+    )
+
+
+def _stamp_download(session: Session, job: ExportJob) -> None:
+    """Record a served body for the retention grace period, writing at most once per half grace.
+
+    Resuming clients fetch a file in many ranged requests; each one need not commit a write.
+    """
+
+    now = datetime.utcnow()
+    grace = timedelta(minutes=get_settings().export_retention_download_grace_minutes)
+    if job.last_downloaded_at is not None and job.last_downloaded_at > now - grace / 2:
+        return
+    job.last_downloaded_at = now
+    session.add(job)
+    session.commit()
+
+
+def _backfill_checksum(job_id: int) -> None:
+    with session_scope() as session:
+        ExportWorker(session).backfill_checksums([job_id])
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import func
@@ -9,14 +10,21 @@ from ..enums import Role, SentenceStatus
 from ..dependencies import admin_user, CurrentUser, get_current_user
 from ..models import Adjudication, Annotation, Assignment, Project, ProjectMembership, Review, Sentence, User
 from ..schemas import (
+    FailureAnalytics,
     ProjectCreate,
     ProjectMembershipPublic,
     ProjectMembershipRequest,
     ProjectMembershipUpdate,
     ProjectSummary,
+    ProjectUpdate,
 )
 from ..services.audit import log_action
+from ..services.failure_analytics import FailureAnalyticsService, rebuild_failure_rollups
+from ..services.membership_cache import mark_memberships_changed
+from ..services.near_duplicates import NearDuplicateIndex
+from ..services.rebalance import MemberRebalancer
 from ..services.workflow import require_roles
+from ..services.workload import rebuild_assignment_load
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
@@ -47,6 +55,53 @@ def create_project(
     return project
 
 
+@router.patch("/{project_id}", response_model=Project)
+def update_project(
+    project_id: int,
+    payload: ProjectUpdate,
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(admin_user),
+) -> Project:
+    project = session.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Proje bulunamadı")
+    # Only ``description`` can be cleared; other omitted or null fields stay unchanged.
+    requested = {
+        field: value
+        for field, value in payload.model_dump(exclude_unset=True).items()
+        if value is not None or field == "description"
+    }
+    changes = {
+        field: {"before": getattr(project, field), "after": value}
+        for field, value in requested.items()
+        if getattr(project, field) != value
+    }
+    if not changes:
+        return project
+    if "name" in changes:
+        existing = session.exec(
+            select(Project.id).where(Project.name == payload.name, Project.id != project_id)
+        ).first()
+        if existing is not None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Proje adı kullanılıyor")
+    for field, change in changes.items():
+        setattr(project, field, change["after"])
+    session.add(project)
+    log_action(
+        session,
+        actor_id=user.user_id,
+        actor_role=user.acting_role,
+        action="project_updated",
+        entity_type="project",
+        entity_id=project_id,
+        project_id=project_id,
+        metadata={"changes": changes},
+    )
+    session.commit()
+    session.refresh(project)
+    return project
+
+
 @router.get("", response_model=list[Project])
 def list_projects(session: Session = Depends(get_session)) -> list[Project]:
     return list(session.exec(select(Project)))
@@ -112,6 +167,99 @@ def project_summary(
     )
 
 
+@router.get("/{project_id}/failure-analytics", response_model=FailureAnalytics)
+def failure_analytics(
+    project_id: int,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    failure_type: Optional[str] = None,
+    user_id: Optional[int] = None,
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user),
+) -> FailureAnalytics:
+    project = session.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Proje bulunamadı")
+    require_roles(user, {Role.ADMIN, Role.CURATOR}, use_project_roles=True)
+    if start and end and start > end:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Başlangıç tarihi bitişten sonra olamaz")
+    return FailureAnalyticsService(session).summarize(
+        project_id=project_id, start=start, end=end, failure_type=failure_type, user_id=user_id
+    )
+
+
+@router.post("/{project_id}/failure-analytics/rebuild", response_model=FailureAnalytics)
+def rebuild_failure_analytics(
+    project_id: int,
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(admin_user),
+) -> FailureAnalytics:
+    project = session.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Proje bulunamadı")
+    failure_count = rebuild_failure_rollups(session, project_id)
+    log_action(
+        session,
+        actor_id=user.user_id,
+        actor_role=user.acting_role,
+        action="failure_rollups_rebuilt",
+        entity_type="project",
+        entity_id=project_id,
+        project_id=project_id,
+        metadata={"failure_count": failure_count},
+    )
+    session.commit()
+    return FailureAnalyticsService(session).summarize(project_id=project_id)
+
+
+@router.post("/{project_id}/workload/rebuild")
+def rebuild_workload_counters(
+    project_id: int,
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(admin_user),
+) -> dict[str, int]:
+    project = session.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Proje bulunamadı")
+    active_assignments = rebuild_assignment_load(session, project_id)
+    log_action(
+        session,
+        actor_id=user.user_id,
+        actor_role=user.acting_role,
+        action="assignment_load_rebuilt",
+        entity_type="project",
+        entity_id=project_id,
+        project_id=project_id,
+        metadata={"active_assignments": active_assignments},
+    )
+    session.commit()
+    return {"project_id": project_id, "active_assignments": active_assignments}
+
+
+@router.post("/{project_id}/near-duplicates/rebuild")
+def rebuild_near_duplicate_index(
+    project_id: int,
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(admin_user),
+) -> dict[str, int]:
+    project = session.get(Project, project_id)
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Proje bulunamadı")
+    indexed_sentences = NearDuplicateIndex(session).rebuild(project_id)
+    log_action(
+        session,
+        actor_id=user.user_id,
+        actor_role=user.acting_role,
+        action="near_duplicate_index_rebuilt",
+        entity_type="project",
+        entity_id=project_id,
+        project_id=project_id,
+        metadata={"indexed_sentences": indexed_sentences},
+    )
+    session.commit()
+    return {"project_id": project_id, "indexed_sentences": indexed_sentences}
+
+
 @router.get("/{project_id}/members", response_model=list[ProjectMembershipPublic])
 def list_project_members(
     project_id: int, session: Session = Depends(get_session), user: CurrentUser = Depends(get_current_user)
@@ -169,6 +317,7 @@ def add_project_member(
         project_id=project_id,
         metadata={"role": payload.role.value, "target_user_id": payload.user_id},
     )
+    mark_memberships_changed(session, project_id)
     session.commit()
     session.refresh(membership)
     return _membership_to_public(membership)
@@ -217,6 +366,7 @@ def approve_project_member(
         project_id=project_id,
         metadata={"role": membership.role.value, "target_user_id": member_user_id},
     )
+    mark_memberships_changed(session, project_id)
     session.commit()
     session.refresh(membership)
     return _membership_to_public(membership)
@@ -284,12 +434,22 @@ def update_project_member(
             project_id=project_id,
             metadata={"target_user_id": member_user_id},
         )
+        if not membership.is_active:
+            session.add(membership)
+            MemberRebalancer(session).rebalance(
+                project_id=project_id,
+                user_id=member_user_id,
+                actor_id=user.user_id,
+                actor_role=acting_role,
+                membership_id=membership.id,
+            )
         changes_applied = True
 
     if not changes_applied:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Güncellenecek değişiklik yok")
 
     session.add(membership)
+    mark_memberships_changed(session, project_id)
     session.commit()
     session.refresh(membership)
     return _membership_to_public(membership)
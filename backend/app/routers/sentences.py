@@ -1,25 +1,62 @@
-from typing import Any, Optional
+from collections import Counter
+from tempfile import SpooledTemporaryFile
+from typing import Any, BinaryIO, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
 from sqlmodel import Session, select
 
+from ..config import get_settings
 from ..database import get_session
 from ..dependencies import CurrentUser, get_current_user
-from ..enums import AssignmentStrategy, ReviewDecision, Role, SentenceStatus
+from ..enums import (
+    AssignmentStrategy,
+    NearDuplicateMode,
+    ReviewDecision,
+    Role,
+    SentenceImportFormat,
+    SentenceOrder,
+    SentenceStatus,
+)
 from ..models import Adjudication, Annotation, Assignment, FailedSubmission, Project, Review, Sentence
 from ..schemas import (
     AdjudicationSubmit,
     AnnotationSubmit,
     AssignmentRequest,
+    BatchAcceptRequest,
+    BatchReviewRequest,
+    BatchWorkflowResult,
+    BulkAssignmentRequest,
+    BulkAssignmentResult,
+    MyTaskPage,
     ReopenRequest,
     ReviewSubmit,
     SentenceCreate,
+    SentenceImportResult,
+    SentencePage,
+    SentenceWorkspace,
+    SimilarSentence,
+    TaskClaim,
     ValidationRequest,
 )
 from ..services.assignment_engine import AssignmentEngine
 from ..services.audit import log_action
+from ..services.batch_workflow import BatchWorkflow
+from ..services.bulk_assignment import BulkAssigner
+from ..services.failed_submissions import FailedSubmissionStore
+from ..services.idempotency import IDEMPOTENCY_HEADER, IdempotencyStore, request_hash
+from ..services.leases import lease_deadline, renew_lease
+from ..services.my_tasks import MyTaskLister
+from ..services.near_duplicates import NearDuplicateIndex, minhash_signature
+from ..services.pagination import MAX_PAGE_SIZE
+from ..services.sentence_import import SentenceImporter, SentenceImportError, content_hash
+from ..services.sentence_listing import SentenceFilters, SentenceLister, parse_fields
+from ..services.task_claim import TaskClaimer
 from ..services.validation import ValidationService
-from ..services.workflow import WorkflowGuard, require_roles
+from ..services.workflow import WorkflowGuard, apply_transition, require_roles
+from ..services.workload import adjust_assignment_load, track_deactivated
+from ..services.workspace import load_sentence_workspace
 
 router = APIRouter(prefix="/sentences", tags=["sentences"])
 
@@ -45,31 +82,27 @@ def _record_failed_submission(
     sentence: Sentence,
     failure_type: str,
     reason: str,
-    details: dict[str, Any],
+    details: Optional[dict[str, Any]] = None,
+    report: Optional[dict[str, Any]] = None,
     assignment_id: Optional[int] = None,
     annotation_id: Optional[int] = None,
     user_id: Optional[int] = None,
     reviewer_id: Optional[int] = None,
     penman_text: Optional[str] = None,
 ) -> FailedSubmission:
-    failure = FailedSubmission(
-        project_id=project.id,
-        sentence_id=sentence.id,
+    return FailedSubmissionStore(session).record(
+        project=project,
+        sentence=sentence,
+        failure_type=failure_type,
+        reason=reason,
+        details=details,
+        report=report,
         assignment_id=assignment_id,
         annotation_id=annotation_id,
         user_id=user_id,
         reviewer_id=reviewer_id,
-        failure_type=failure_type,
-        reason=reason,
-        details=details,
-        amr_version=project.amr_version,
-        role_set_version=project.role_set_version,
-        rule_version=project.validation_rule_version,
-        submitted_penman=penman_text,
+        penman_text=penman_text,
     )
-    session.add(failure)
-    session.flush()
-    return failure
 
 
 def _deactivate_assignments(
@@ -86,6 +119,8 @@ def _deactivate_assignments(
         assignment.is_active = False
         session.add(assignment)
         deactivated_ids.append(assignment.id)
+    if assignments:
+        track_deactivated(session, _get_sentence(session, sentence_id).project_id, assignments)
     return deactivated_ids
 
 
@@ -98,9 +133,10 @@ def create_sentence(
 ) -> Sentence:
     require_roles(user, {Role.ADMIN, Role.CURATOR}, use_project_roles=True)
     _get_project(session, project_id)
-    sentence = Sentence(project_id=project_id, **payload.dict())
+    sentence = Sentence(project_id=project_id, content_hash=content_hash(payload.text), **payload.dict())
     session.add(sentence)
     session.flush()
+    NearDuplicateIndex(session).add(project_id, {sentence.id: minhash_signature(sentence.text)})
     log_action(
         session,
         actor_id=user.user_id,
@@ -118,6 +154,83 @@ def create_sentence(
     return sentence
 
 
+# Request bodies up to this size stay in memory while spooled; larger ones go to disk.
+_IMPORT_SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+
+_IMPORT_CONTENT_TYPES = {
+    "text/csv": SentenceImportFormat.CSV,
+    "application/json": SentenceImportFormat.JSON,
+    "application/x-ndjson": SentenceImportFormat.JSON,
+    "application/jsonl": SentenceImportFormat.JSON,
+    "text/plain": SentenceImportFormat.TXT,
+}
+
+
+def _run_sentence_import(
+    session: Session,
+    user: CurrentUser,
+    acting_role: Role,
+    project_id: int,
+    stream: BinaryIO,
+    import_format: SentenceImportFormat,
+    source: Optional[str],
+    near_duplicates: NearDuplicateMode,
+) -> SentenceImportResult:
+    _get_project(session, project_id)
+    try:
+        result = SentenceImporter(session).run(
+            project_id=project_id,
+            stream=stream,
+            import_format=import_format,
+            actor_id=user.user_id,
+            actor_role=acting_role,
+            source=source,
+            near_duplicates=near_duplicates,
+        )
+    except SentenceImportError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return result
+
+
+@router.post(
+    "/project/{project_id}/import",
+    response_model=SentenceImportResult,
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_sentences(
+    project_id: int,
+    request: Request,
+    import_format: Optional[SentenceImportFormat] = Query(default=None, alias="format"),
+    source: Optional[str] = Query(default=None, max_length=128),
+    near_duplicates: NearDuplicateMode = NearDuplicateMode.FLAG,
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user),
+) -> SentenceImportResult:
+    """Import a raw CSV, JSON/JSON Lines or plain-text request body as new sentences."""
+
+    acting_role = require_roles(user, {Role.ADMIN, Role.CURATOR}, use_project_roles=True)
+    if import_format is None:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        import_format = _IMPORT_CONTENT_TYPES.get(content_type)
+        if import_format is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="İçe aktarma biçimi belirlenemedi")
+
+    max_bytes = get_settings().sentence_import_max_bytes
+    with SpooledTemporaryFile(max_size=_IMPORT_SPOOL_MEMORY_BYTES) as spool:
+        received = 0
+        async for chunk in request.stream():
+            received += len(chunk)
+            if received > max_bytes:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="İçe aktarma dosyası çok büyük"
+                )
+            spool.write(chunk)
+        spool.seek(0)
+        return await run_in_threadpool(
+            _run_sentence_import, session, user, acting_role, project_id, spool, import_format, source, near_duplicates
+        )
+
+
 @router.post("/{sentence_id}/assign", response_model=list[Assignment])
 def assign_sentence(
     sentence_id: int,
@@ -174,20 +287,20 @@ def assign_sentence(
             user_id=assignee_id,
             role=payload.role,
             is_blind=payload.is_blind,
+            lease_expires_at=lease_deadline(),
         )
         assignments.append(assignment)
         session.add(assignment)
+    adjust_assignment_load(
+        session,
+        project_id=sentence.project_id,
+        role=payload.role,
+        deltas=Counter(assignee_ids),
+    )
 
-    sentence.status = SentenceStatus.ASSIGNED
+    apply_transition(sentence, SentenceStatus.ASSIGNED)
     session.add(sentence)
     session.flush()
-    metadata = _assignment_log_metadata(
-        assignments=assignments,
-        assignee_ids=assignee_ids,
-        payload=payload,
-        requested_count=requested_count,
-        deactivated_assignment_ids=deactivated_assignments,
-    )
     log_action(
         session,
         actor_id=user.user_id,
@@ -217,13 +330,76 @@ def assign_sentence(
     return assignments
 
 
+@router.post("/project/{project_id}/assign-bulk", response_model=BulkAssignmentResult)
+def bulk_assign_sentences(
+    project_id: int,
+    payload: BulkAssignmentRequest,
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user),
+) -> BulkAssignmentResult:
+    acting_role = require_roles(
+        user, {Role.ADMIN, Role.CURATOR, Role.ASSIGNMENT_ENGINE}, use_project_roles=True
+    )
+    _get_project(session, project_id)
+    result = BulkAssigner(session).assign(
+        project_id=project_id,
+        actor_id=user.user_id,
+        actor_role=acting_role,
+        sentence_ids=payload.sentence_ids,
+        limit=payload.limit,
+        strategy=payload.strategy,
+        role=payload.role,
+        count=payload.count,
+        required_skills=payload.required_skills,
+        is_blind=payload.is_blind,
+    )
+    session.commit()
+    return result
+
+
+@router.post("/project/{project_id}/claim", response_model=TaskClaim)
+def claim_next_task(
+    project_id: int,
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user),
+) -> TaskClaim:
+    acting_role = require_roles(user, {Role.ANNOTATOR, Role.REVIEWER}, use_project_roles=True)
+    project = _get_project(session, project_id)
+    claim = TaskClaimer(session).claim(project=project, user_id=user.user_id, role=acting_role)
+    session.commit()
+    session.refresh(claim.sentence)
+    session.refresh(claim.assignment)
+    return claim
+
+
+@router.post("/{sentence_id}/lease/renew", response_model=Assignment)
+def renew_assignment_lease(
+    sentence_id: int,
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user),
+) -> Assignment:
+    _get_sentence(session, sentence_id)
+    require_roles(user, {Role.ANNOTATOR, Role.REVIEWER}, use_project_roles=True)
+    assignment = renew_lease(session, sentence_id=sentence_id, user_id=user.user_id)
+    session.commit()
+    session.refresh(assignment)
+    return assignment
+
+
 @router.post("/{sentence_id}/submit", response_model=Annotation, status_code=status.HTTP_201_CREATED)
 def submit_annotation(
     sentence_id: int,
     payload: AnnotationSubmit,
     session: Session = Depends(get_session),
     user: CurrentUser = Depends(get_current_user),
-) -> Annotation:
+    idempotency_key: Optional[str] = Header(default=None, alias=IDEMPOTENCY_HEADER),
+) -> Annotation | JSONResponse:
+    idempotency = IdempotencyStore(session)
+    scope = f"POST /sentences/{sentence_id}/submit"
+    fingerprint = request_hash(scope, payload)
+    replayed = idempotency.replay(user_id=user.user_id, key=idempotency_key, scope=scope, fingerprint=fingerprint)
+    if replayed is not None:
+        return replayed
     sentence = _get_sentence(session, sentence_id)
     project = _get_project(session, sentence.project_id)
     assignment = session.exec(
@@ -249,27 +425,13 @@ def submit_annotation(
     report_json = report.to_json()
 
     if not report.is_valid:
-        error_codes = [issue.code for issue in report.errors]
-        warning_codes = [issue.code for issue in report.warnings]
-        submission_versions = {
-            "rule_version": project.validation_rule_version,
-            "amr_version": project.amr_version,
-            "role_set_version": project.role_set_version,
-        }
         _record_failed_submission(
             session,
             project=project,
             sentence=sentence,
             failure_type="validation",
             reason="Validasyon başarısız.",
-            details={
-                "report": report.to_dict(),
-                "error_codes": error_codes,
-                "warning_codes": warning_codes,
-                "canonical_penman": report.canonical_penman,
-                "triple_count": report.triple_count,
-                **submission_versions,
-            },
+            report=report.to_dict(),
             assignment_id=assignment.id,
             user_id=user.user_id,
             penman_text=payload.penman_text,
@@ -296,8 +458,10 @@ def submit_annotation(
         penman_text=report.canonical_penman or payload.penman_text,
         validity_report=report_json,
     )
-    sentence.status = SentenceStatus.SUBMITTED
+    apply_transition(sentence, SentenceStatus.SUBMITTED)
+    assignment.lease_expires_at = None
     session.add(annotation)
+    session.add(assignment)
     session.add(sentence)
     session.flush()
     log_action(
@@ -312,6 +476,14 @@ def submit_annotation(
         project_id=sentence.project_id,
         metadata={"annotation_id": annotation.id, "assignment_id": assignment.id},
     )
+    idempotency.save(
+        user_id=user.user_id,
+        key=idempotency_key,
+        scope=scope,
+        fingerprint=fingerprint,
+        status_code=status.HTTP_201_CREATED,
+        response=annotation,
+    )
     session.commit()
     session.refresh(annotation)
     return annotation
@@ -342,7 +514,14 @@ def review_annotation(
     payload: ReviewSubmit,
     session: Session = Depends(get_session),
     user: CurrentUser = Depends(get_current_user),
-) -> Sentence:
+    idempotency_key: Optional[str] = Header(default=None, alias=IDEMPOTENCY_HEADER),
+) -> Sentence | JSONResponse:
+    idempotency = IdempotencyStore(session)
+    scope = f"POST /sentences/{sentence_id}/review"
+    fingerprint = request_hash(scope, payload)
+    replayed = idempotency.replay(user_id=user.user_id, key=idempotency_key, scope=scope, fingerprint=fingerprint)
+    if replayed is not None:
+        return replayed
     sentence = _get_sentence(session, sentence_id)
     project = _get_project(session, sentence.project_id)
     guard = WorkflowGuard(is_multi_annotator=payload.is_multi_annotator)
@@ -368,6 +547,18 @@ def review_annotation(
         )
     if guard.should_lock_assignments_for_target(target_status):
         deactivated_assignment_ids.update(_deactivate_assignments(session, sentence_id))
+    claimed_review_ids = set(
+        session.exec(
+            select(Assignment.id).where(
+                Assignment.sentence_id == sentence_id,
+                Assignment.user_id == user.user_id,
+                Assignment.role == Role.REVIEWER,
+                Assignment.is_active.is_(True),
+            )
+        ).all()
+    )
+    if claimed_review_ids:
+        deactivated_assignment_ids.update(_deactivate_assignments(session, sentence_id, claimed_review_ids))
 
     review = Review(
         annotation_id=payload.annotation_id,
@@ -377,7 +568,7 @@ def review_annotation(
         comment=payload.comment,
     )
 
-    sentence.status = target_status
+    apply_transition(sentence, target_status)
     session.add(review)
     session.add(sentence)
     session.flush()
@@ -390,12 +581,8 @@ def review_annotation(
             reason=payload.comment or "Reviewer tarafından reddedildi.",
             details={
                 "review_id": review.id,
-                "annotation_id": payload.annotation_id,
                 "decision": payload.decision.value,
                 "score": payload.score,
-                "rule_version": project.validation_rule_version,
-                "amr_version": project.amr_version,
-                "role_set_version": project.role_set_version,
             },
             annotation_id=annotation.id,
             assignment_id=annotation.assignment_id,
@@ -422,6 +609,14 @@ def review_annotation(
             "deactivated_assignment_ids": sorted(deactivated_assignment_ids),
         },
     )
+    idempotency.save(
+        user_id=user.user_id,
+        key=idempotency_key,
+        scope=scope,
+        fingerprint=fingerprint,
+        status_code=status.HTTP_200_OK,
+        response=sentence,
+    )
     session.commit()
     session.refresh(sentence)
     return sentence
@@ -433,7 +628,14 @@ def adjudicate_sentence(
     payload: AdjudicationSubmit,
     session: Session = Depends(get_session),
     user: CurrentUser = Depends(get_current_user),
-) -> Adjudication:
+    idempotency_key: Optional[str] = Header(default=None, alias=IDEMPOTENCY_HEADER),
+) -> Adjudication | JSONResponse:
+    idempotency = IdempotencyStore(session)
+    scope = f"POST /sentences/{sentence_id}/adjudicate"
+    fingerprint = request_hash(scope, payload)
+    replayed = idempotency.replay(user_id=user.user_id, key=idempotency_key, scope=scope, fingerprint=fingerprint)
+    if replayed is not None:
+        return replayed
     sentence = _get_sentence(session, sentence_id)
     require_roles(user, {Role.ADMIN, Role.CURATOR}, use_project_roles=True)
     before_status = sentence.status
@@ -453,7 +655,7 @@ def adjudicate_sentence(
         source_annotation_ids=payload.source_annotation_ids,
     )
     deactivated_assignment_ids = _deactivate_assignments(session, sentence_id)
-    sentence.status = SentenceStatus.ADJUDICATED
+    apply_transition(sentence, SentenceStatus.ADJUDICATED)
     session.add(adjudication)
     session.add(sentence)
     session.flush()
@@ -474,6 +676,14 @@ def adjudicate_sentence(
             "deactivated_assignment_ids": deactivated_assignment_ids,
         },
     )
+    idempotency.save(
+        user_id=user.user_id,
+        key=idempotency_key,
+        scope=scope,
+        fingerprint=fingerprint,
+        status_code=status.HTTP_201_CREATED,
+        response=adjudication,
+    )
     session.commit()
     session.refresh(adjudication)
     return adjudication
@@ -491,7 +701,7 @@ def accept_sentence(
     guard.ensure_transition(sentence.status, SentenceStatus.ACCEPTED, user.acting_role)
     before_status = sentence.status
     deactivated_assignment_ids = _deactivate_assignments(session, sentence_id)
-    sentence.status = SentenceStatus.ACCEPTED
+    apply_transition(sentence, SentenceStatus.ACCEPTED)
     session.add(sentence)
     log_action(
         session,
@@ -510,6 +720,40 @@ def accept_sentence(
     return sentence
 
 
+@router.post("/project/{project_id}/review-batch", response_model=BatchWorkflowResult)
+def review_batch(
+    project_id: int,
+    payload: BatchReviewRequest,
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user),
+) -> BatchWorkflowResult:
+    """Record many reviews at once; invalid items are reported per item and skipped."""
+
+    _get_project(session, project_id)
+    require_roles(user, {Role.ADMIN, Role.CURATOR, Role.REVIEWER}, use_project_roles=True)
+    result = BatchWorkflow(session).review(
+        project_id=project_id, items=payload.items, actor=user, is_multi_annotator=payload.is_multi_annotator
+    )
+    session.commit()
+    return result
+
+
+@router.post("/project/{project_id}/accept-batch", response_model=BatchWorkflowResult)
+def accept_batch(
+    project_id: int,
+    payload: BatchAcceptRequest,
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user),
+) -> BatchWorkflowResult:
+    """Accept many adjudicated sentences at once; invalid items are reported per item and skipped."""
+
+    _get_project(session, project_id)
+    require_roles(user, {Role.ADMIN, Role.CURATOR}, use_project_roles=True)
+    result = BatchWorkflow(session).accept(project_id=project_id, sentence_ids=payload.sentence_ids, actor=user)
+    session.commit()
+    return result
+
+
 @router.post("/{sentence_id}/reopen", response_model=Sentence)
 def reopen_adjudication(
     sentence_id: int,
@@ -527,7 +771,7 @@ def reopen_adjudication(
     guard = WorkflowGuard()
     guard.ensure_transition(sentence.status, SentenceStatus.IN_REVIEW, user.acting_role)
     before_status = sentence.status
-    sentence.status = SentenceStatus.IN_REVIEW
+    apply_transition(sentence, SentenceStatus.IN_REVIEW)
     session.add(sentence)
     log_action(
         session,
@@ -546,6 +790,29 @@ def reopen_adjudication(
     return sentence
 
 
+@router.get("/tasks/mine", response_model=MyTaskPage)
+def list_my_tasks(
+    project_id: Optional[int] = None,
+    role: Optional[Role] = None,
+    statuses: Optional[list[SentenceStatus]] = Query(default=None, alias="status"),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user),
+) -> MyTaskPage:
+    """The caller's active assignments with sentence text and status, plus per-status counts."""
+
+    require_roles(user, {Role.ADMIN, Role.CURATOR, Role.REVIEWER, Role.ANNOTATOR})
+    return MyTaskLister(session).page(
+        user.user_id,
+        limit=limit,
+        cursor=cursor,
+        project_id=project_id,
+        role=role,
+        statuses=statuses or (),
+    )
+
+
 @router.get("/{sentence_id}", response_model=Sentence)
 def get_sentence(
     sentence_id: int, session: Session = Depends(get_session), user: CurrentUser = Depends(get_current_user)
@@ -555,6 +822,45 @@ def get_sentence(
     return sentence
 
 
+@router.get("/{sentence_id}/workspace", response_model=SentenceWorkspace)
+def get_sentence_workspace(
+    sentence_id: int, session: Session = Depends(get_session), user: CurrentUser = Depends(get_current_user)
+) -> SentenceWorkspace:
+    """Sentence, annotations, reviews, adjudication and active assignments in one response."""
+
+    sentence = _get_sentence(session, sentence_id)
+    role = require_roles(user, {Role.ADMIN, Role.CURATOR, Role.REVIEWER, Role.ANNOTATOR}, use_project_roles=True)
+    return load_sentence_workspace(session, sentence, user, role)
+
+
+@router.get("/{sentence_id}/similar", response_model=list[SimilarSentence])
+def list_similar_sentences(
+    sentence_id: int,
+    limit: int = Query(default=10, ge=1, le=100),
+    threshold: Optional[float] = Query(default=None, ge=0, le=1),
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user),
+) -> list[SimilarSentence]:
+    require_roles(user, {Role.ADMIN, Role.CURATOR}, use_project_roles=True)
+    sentence = _get_sentence(session, sentence_id)
+    index = NearDuplicateIndex(session, threshold=threshold)
+    matches = index.similar(
+        sentence.project_id, index.signature_of(sentence), exclude_id=sentence.id, limit=limit
+    )
+    sentences = {
+        row.id: row for row in session.exec(select(Sentence).where(Sentence.id.in_([m.sentence_id for m in matches])))
+    }
+    return [
+        SimilarSentence(
+            sentence_id=match.sentence_id,
+            text=sentences[match.sentence_id].text,
+            status=sentences[match.sentence_id].status,
+            similarity=match.similarity,
+        )
+        for match in matches
+    ]
+
+
 @router.get("/{sentence_id}/annotations", response_model=list[Annotation])
 def list_annotations(
     sentence_id: int, session: Session = Depends(get_session), user: CurrentUser = Depends(get_current_user)
@@ -600,10 +906,69 @@ def get_adjudication(
     ).first()
 
 
-@router.get("/project/{project_id}", response_model=list[Sentence])
+@router.get("/project/{project_id}", response_model=SentencePage)
 def list_sentences(
-    project_id: int, session: Session = Depends(get_session), user: CurrentUser = Depends(get_current_user)
-) -> list[Sentence]:
+    project_id: int,
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    order_by: SentenceOrder = SentenceOrder.ID,
+    descending: bool = False,
+    statuses: Optional[list[SentenceStatus]] = Query(default=None, alias="status"),
+    difficulty_tag: Optional[str] = None,
+    source: Optional[str] = None,
+    assignee_id: Optional[int] = None,
+    fields: Optional[str] = Query(default=None, description="Comma separated sentence fields to return"),
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user),
+) -> SentencePage:
+    """List a project's sentences one keyset page at a time; pass ``next_cursor`` back as ``cursor``."""
+
     _get_project(session, project_id)
     require_roles(user, {Role.ADMIN, Role.CURATOR, Role.REVIEWER, Role.ANNOTATOR}, use_project_roles=True)
-    return list(session.exec(select(Sentence).where(Sentence.project_id == project_id)))
+    return SentenceLister(session).page(
+        project_id,
+        limit=limit,
+        cursor=cursor,
+        order_by=order_by,
+        descending=descending,
+        filters=SentenceFilters(
+            statuses=statuses or (),
+            difficulty_tag=difficulty_tag,
+            source=source,
+            assignee_id=assignee_id,
+        ),
+        fields=parse_fields(fields),
+    )
+
+
+@router.get("/project/{project_id}/search", response_model=SentencePage)
+def search_sentences(
+    project_id: int,
+    q: str = Query(min_length=1, max_length=500),
+    limit: int = Query(default=50, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    descending: bool = False,
+    statuses: Optional[list[SentenceStatus]] = Query(default=None, alias="status"),
+    difficulty_tag: Optional[str] = None,
+    source: Optional[str] = None,
+    fields: Optional[str] = Query(default=None, description="Comma separated sentence fields to return"),
+    session: Session = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user),
+) -> SentencePage:
+    """Sentences containing the phrase ``q``, ignoring case, Turkish dotted/dotless i and diacritics."""
+
+    _get_project(session, project_id)
+    require_roles(user, {Role.ADMIN, Role.CURATOR}, use_project_roles=True)
+    return SentenceLister(session).page(
+        project_id,
+        limit=limit,
+        cursor=cursor,
+        descending=descending,
+        filters=SentenceFilters(
+            statuses=statuses or (),
+            difficulty_tag=difficulty_tag,
+            source=source,
+            search=q,
+        ),
+        fields=parse_fields(fields),
+    )
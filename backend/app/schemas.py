@@ -1,10 +1,22 @@
-from datetime import datetime
-from typing import Optional
-
-from sqlmodel import SQLModel
-
-from .enums import AssignmentStrategy, ExportFormat, ExportLevel, JobStatus, PiiStrategy, ReviewDecision, Role
-from .models import AuditLog
+from datetime import date, datetime
+from typing import Any, Optional
+
+from sqlmodel import Field, SQLModel
+
+from .enums import (
+    AssignmentStrategy,
+    ExportFormat,
+    ExportLevel,
+    JobStatus,
+    NearDuplicateMode,
+    PiiStrategy,
+    ReviewDecision,
+    Role,
+    SentenceImportFormat,
+    SentenceOrder,
+    SentenceStatus,
+)
+from .models import Adjudication, Annotation, Assignment, AuditLog, Review, Sentence
 
 
 class ProjectCreate(SQLModel):
@@ -14,12 +26,98 @@ class ProjectCreate(SQLModel):
     amr_version: str = "1.0"
     role_set_version: str = "tr-propbank"
     validation_rule_version: str = "v1"
+    annotators_per_sentence: int = Field(default=1, ge=1)
+    auto_assign_enabled: bool = False
+    blind_annotation: bool = False
+
+
+class ProjectUpdate(SQLModel):
+    name: Optional[str] = None
+    description: Optional[str] = None
+    annotators_per_sentence: Optional[int] = Field(default=None, ge=1)
+    auto_assign_enabled: Optional[bool] = None
+    blind_annotation: Optional[bool] = None
 
 
 class SentenceCreate(SQLModel):
     text: str
     source: Optional[str] = None
     difficulty_tag: Optional[str] = None
+    priority: int = 0
+
+
+class SentenceImportRowError(SQLModel):
+    line: int
+    reason: str
+
+
+class SentenceImportNearDuplicate(SQLModel):
+    line: int
+    similarity: float
+    sentence_id: Optional[int] = None
+    duplicate_of_line: Optional[int] = None
+
+
+class SentenceImportResult(SQLModel):
+    project_id: int
+    format: SentenceImportFormat
+    total_rows: int
+    created: int
+    duplicates_in_file: int
+    duplicates_existing: int
+    invalid: int
+    errors: list[SentenceImportRowError]
+    near_duplicate_mode: NearDuplicateMode
+    near_duplicates: int
+    near_duplicate_matches: list[SentenceImportNearDuplicate]
+
+
+class SentencePage(SQLModel):
+    """One keyset page; items hold only the requested ``fields`` (plus ``id``)."""
+
+    limit: int
+    order_by: SentenceOrder
+    next_cursor: Optional[str] = None
+    items: list[dict[str, Any]]
+
+
+class MyTask(SQLModel):
+    assignment_id: int
+    sentence_id: int
+    project_id: int
+    role: Role
+    is_blind: bool
+    assigned_at: datetime
+    lease_expires_at: Optional[datetime] = None
+    text: str
+    status: SentenceStatus
+    priority: int
+    difficulty_tag: Optional[str] = None
+
+
+class MyTaskPage(SQLModel):
+    """Keyset page of the caller's active assignments; ``status_counts`` covers all pages."""
+
+    limit: int
+    next_cursor: Optional[str] = None
+    status_counts: dict[str, int]
+    items: list[MyTask]
+
+
+class SentenceWorkspace(SQLModel):
+    sentence: Sentence
+    annotations: list[Annotation]
+    reviews: list[Review]
+    adjudication: Optional[Adjudication] = None
+    assignments: list[Assignment]
+    is_blind: bool
+
+
+class SimilarSentence(SQLModel):
+    sentence_id: int
+    text: str
+    status: SentenceStatus
+    similarity: float
 
 
 class AssignmentRequest(SQLModel):
@@ -33,6 +131,34 @@ class AssignmentRequest(SQLModel):
     is_blind: bool = False
 
 
+class BulkAssignmentRequest(SQLModel):
+    sentence_ids: Optional[list[int]] = None
+    limit: int = Field(default=1000, ge=1, le=50_000)
+    strategy: AssignmentStrategy = AssignmentStrategy.ROUND_ROBIN
+    count: int = Field(default=1, ge=1)
+    required_skills: Optional[list[str]] = None
+    role: Role = Role.ANNOTATOR
+    is_blind: bool = False
+
+
+class BulkAssignmentSkip(SQLModel):
+    sentence_id: int
+    reason: str
+
+
+class BulkAssignmentResult(SQLModel):
+    project_id: int
+    assigned_sentence_ids: list[int]
+    assignment_count: int
+    assignments_per_user: dict[int, int]
+    skipped: list[BulkAssignmentSkip]
+
+
+class TaskClaim(SQLModel):
+    sentence: Sentence
+    assignment: Assignment
+
+
 class AnnotationSubmit(SQLModel):
     penman_text: str
     validity_report: Optional[str] = None
@@ -50,6 +176,40 @@ class ReviewSubmit(SQLModel):
     is_multi_annotator: bool = False
 
 
+class BatchReviewItem(SQLModel):
+    sentence_id: int
+    annotation_id: int
+    decision: ReviewDecision
+    score: Optional[float] = None
+    comment: Optional[str] = None
+
+
+class BatchReviewRequest(SQLModel):
+    items: list[BatchReviewItem] = Field(min_length=1, max_length=1000)
+    is_multi_annotator: bool = False
+
+
+class BatchAcceptRequest(SQLModel):
+    sentence_ids: list[int] = Field(min_length=1, max_length=5000)
+
+
+class BatchItemResult(SQLModel):
+    sentence_id: int
+    applied: bool
+    before_status: Optional[SentenceStatus] = None
+    after_status: Optional[SentenceStatus] = None
+    review_id: Optional[int] = None
+    error_code: Optional[int] = None
+    error: Optional[str] = None
+
+
+class BatchWorkflowResult(SQLModel):
+    project_id: int
+    applied: int
+    failed: int
+    items: list[BatchItemResult]
+
+
 class AdjudicationSubmit(SQLModel):
     final_penman: str
     decision_note: Optional[str] = None
@@ -149,6 +309,32 @@ class ExportJobPublic(SQLModel):
     include_failed: bool
     include_rejected: bool
     result_path: Optional[str] = None
+    checksum: Optional[str] = None
+    size_bytes: Optional[int] = None
     error_message: Optional[str] = None
+    expired_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
+
+
+class FailureUserCount(SQLModel):
+    user_id: Optional[int] = None
+    failure_type: str
+    count: int
+
+
+class FailureDailyCount(SQLModel):
+    day: date
+    failure_type: str
+    count: int
+
+
+class FailureAnalytics(SQLModel):
+    project_id: int
+    start: Optional[date] = None
+    end: Optional[date] = None
+    total: int
+    by_failure_type: dict[str, int]
+    by_error_code: dict[str, int]
+    by_user: list[FailureUserCount]
+    by_day: list[FailureDailyCount]
@@ -1,12 +1,15 @@
+import heapq
 from collections import Counter
-from typing import Iterable, Sequence
+from typing import Iterable, Mapping, Sequence
 
 from fastapi import HTTPException, status
-from sqlalchemy import func
-from sqlmodel import Session, select
+from sqlmodel import Session
 
 from ..enums import AssignmentStrategy, Role
-from ..models import Assignment, ProjectMembership, Sentence, UserProfile
+from .membership_cache import membership_cache
+from .skill_index import skill_index_cache
+from .throughput import throughput_cache
+from .workload import read_assignment_load
 
 
 class AssignmentEngine:
@@ -53,6 +56,7 @@ class AssignmentEngine:
         strategy_fn = {
             AssignmentStrategy.ROUND_ROBIN: self._round_robin,
             AssignmentStrategy.SKILL_BASED: self._skill_based,
+            AssignmentStrategy.THROUGHPUT: self._throughput,
         }.get(strategy)
 
         if strategy_fn is None:
@@ -79,27 +83,10 @@ class AssignmentEngine:
         return assignee_ids
 
     def _eligible_member_ids(self, *, project_id: int, role: Role) -> set[int]:
-        rows = self.session.exec(
-            select(ProjectMembership.user_id).where(
-                ProjectMembership.project_id == project_id,
-                ProjectMembership.role == role,
-                ProjectMembership.is_active.is_(True),
-            )
-        ).all()
-        return {user_id for (user_id,) in rows}
-
-    def _assignment_load(self, *, project_id: int, role: Role) -> Counter:
-        rows = self.session.exec(
-            select(Assignment.user_id, func.count())
-            .join(Sentence, Sentence.id == Assignment.sentence_id)
-            .where(
-                Sentence.project_id == project_id,
-                Assignment.role == role,
-                Assignment.is_active.is_(True),
-            )
-            .group_by(Assignment.user_id)
-        ).all()
-        return Counter({user_id: count for user_id, count in rows})
+        return set(membership_cache.get(self.session, project_id).active_ids(role))
+
+    def _assignment_load(self, *, project_id: int, role: Role, user_ids: Iterable[int]) -> Counter:
+        return read_assignment_load(self.session, project_id=project_id, role=role, user_ids=user_ids)
 
     def _round_robin(
         self,
@@ -111,8 +98,8 @@ class AssignmentEngine:
         required_skills: Sequence[str] | None,
         exclude_user_ids: set[int],
     ) -> list[int]:
-        load = self._assignment_load(project_id=project_id, role=role)
         candidates = [user_id for user_id in eligible_user_ids if user_id not in exclude_user_ids]
+        load = self._assignment_load(project_id=project_id, role=role, user_ids=candidates)
         sorted_candidates = sorted(candidates, key=lambda uid: (load.get(uid, 0), uid))
         return sorted_candidates[:count]
 
@@ -136,36 +123,149 @@ class AssignmentEngine:
                 exclude_user_ids=exclude_user_ids,
             )
 
-        profiles = self.session.exec(
-            select(UserProfile).where(
-                UserProfile.user_id.in_(eligible_user_ids),
-                UserProfile.is_active.is_(True),
-            )
-        ).all()
-        if not profiles:
+        scored_profiles = self._skill_candidates(
+            project_id=project_id,
+            eligible_user_ids=eligible_user_ids,
+            required_skills=required_skills,
+            exclude_user_ids=exclude_user_ids,
+        )
+        load = self._assignment_load(
+            project_id=project_id, role=role, user_ids=(user_id for _, user_id in scored_profiles)
+        )
+        sorted_candidates = sorted(
+            scored_profiles,
+            key=lambda candidate: (-candidate[0], load.get(candidate[1], 0), candidate[1]),
+        )
+        return [user_id for _, user_id in sorted_candidates][:count]
+
+    def _throughput(
+        self,
+        *,
+        project_id: int,
+        role: Role,
+        count: int,
+        eligible_user_ids: set[int],
+        required_skills: Sequence[str] | None,
+        exclude_user_ids: set[int],
+    ) -> list[int]:
+        """Pick the users who would finish one more task soonest given their measured rate."""
+
+        candidates = [user_id for user_id in eligible_user_ids if user_id not in exclude_user_ids]
+        load = self._assignment_load(project_id=project_id, role=role, user_ids=candidates)
+        rates = throughput_cache.rates(self.session, project_id, candidates)
+        sorted_candidates = sorted(candidates, key=lambda uid: ((load.get(uid, 0) + 1) / rates[uid], uid))
+        return sorted_candidates[:count]
+
+    def _skill_candidates(
+        self,
+        *,
+        project_id: int,
+        eligible_user_ids: set[int],
+        required_skills: Sequence[str],
+        exclude_user_ids: set[int],
+    ) -> list[tuple[int, int]]:
+        """Return ``(overlap, user_id)`` for eligible users sharing at least one required skill."""
+
+        index = skill_index_cache.get(self.session, project_id)
+        if not index.profiled_user_ids & eligible_user_ids:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Bu rol için aktif kullanıcı profili bulunamadı.",
             )
 
-        required_set = {skill.lower() for skill in required_skills}
-        load = self._assignment_load(project_id=project_id, role=role)
-        scored_profiles: list[tuple[int, int]] = []
-        for profile in profiles:
-            profile_skills = {skill.lower() for skill in profile.skills or []}
-            overlap = len(required_set & profile_skills)
-            if overlap and profile.user_id not in exclude_user_ids:
-                scored_profiles.append((overlap, profile.user_id))
-
-        if not scored_profiles:
+        overlaps = index.overlaps(required_skills, eligible_user_ids - exclude_user_ids)
+        if not overlaps:
             skills = ", ".join(required_skills)
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Gerekli becerilere sahip kullanıcı bulunamadı: {skills}.",
             )
+        return [(overlap, user_id) for user_id, overlap in overlaps.items()]
 
-        sorted_candidates = sorted(
-            scored_profiles,
-            key=lambda candidate: (-candidate[0], load.get(candidate[1], 0), candidate[1]),
+    def plan_bulk(
+        self,
+        *,
+        project_id: int,
+        strategy: AssignmentStrategy,
+        role: Role,
+        sentence_ids: Sequence[int],
+        count: int,
+        required_skills: Sequence[str] | None,
+        existing_assignees: Mapping[int, set[int]] | None = None,
+        max_active_per_user: int | None = None,
+    ) -> dict[int, list[int]]:
+        """Distribute ``count`` assignees to each sentence with a single eligibility and load lookup.
+
+        Candidates live in a min-heap keyed by load, so every pick is O(log users) and the load
+        of earlier picks in the batch is taken into account. With the throughput strategy the
+        key is the expected completion time of one more task, ``(load + 1) / rate``. Skill
+        overlap only decides who is eligible and breaks ties between equally loaded users;
+        ranking it first would send the whole batch to one person. Users reaching ``max_active_per_user`` active assignments leave
+        the heap. Sentences that cannot get ``count`` distinct assignees are left out of the plan.
+        """
+
+        if count < 1:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="En az bir atama yapılmalıdır."
+            )
+        if strategy not in {
+            AssignmentStrategy.ROUND_ROBIN,
+            AssignmentStrategy.SKILL_BASED,
+            AssignmentStrategy.THROUGHPUT,
+        }:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Geçersiz atama stratejisi.")
+
+        eligible_members = self._eligible_member_ids(project_id=project_id, role=role)
+        if not eligible_members:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Bu rol için aktif proje üyesi bulunamadı.",
+            )
+
+        if strategy == AssignmentStrategy.SKILL_BASED and required_skills:
+            candidates = self._skill_candidates(
+                project_id=project_id,
+                eligible_user_ids=eligible_members,
+                required_skills=required_skills,
+                exclude_user_ids=set(),
+            )
+        else:
+            candidates = [(0, user_id) for user_id in eligible_members]
+
+        load = self._assignment_load(
+            project_id=project_id, role=role, user_ids=(user_id for _, user_id in candidates)
         )
-        return [user_id for _, user_id in sorted_candidates][:count]
+        rates: dict[int, float] | None = None
+        if strategy == AssignmentStrategy.THROUGHPUT:
+            rates = throughput_cache.rates(self.session, project_id, (user_id for _, user_id in candidates))
+        overlaps = {user_id: overlap for overlap, user_id in candidates}
+
+        def heap_entry(user_load: int, user_id: int) -> tuple[float, int, int, int]:
+            expected = (user_load + 1) / rates[user_id] if rates is not None else 0.0
+            return (expected, user_load, -overlaps[user_id], user_id)
+
+        heap = [
+            heap_entry(load.get(user_id, 0), user_id)
+            for _, user_id in candidates
+            if max_active_per_user is None or load.get(user_id, 0) < max_active_per_user
+        ]
+        heapq.heapify(heap)
+        existing_assignees = existing_assignees or {}
+        plan: dict[int, list[int]] = {}
+        for sentence_id in sentence_ids:
+            excluded = existing_assignees.get(sentence_id, set())
+            picked: list[tuple[float, int, int, int]] = []
+            skipped: list[tuple[float, int, int, int]] = []
+            while heap and len(picked) < count:
+                entry = heapq.heappop(heap)
+                (skipped if entry[3] in excluded else picked).append(entry)
+            if len(picked) == count:
+                plan[sentence_id] = [user_id for _, _, _, user_id in picked]
+                picked = [
+                    heap_entry(user_load + 1, user_id)
+                    for _, user_load, _, user_id in picked
+                    if max_active_per_user is None or user_load + 1 < max_active_per_user
+                ]
+            for entry in picked + skipped:
+                heapq.heappush(heap, entry)
+        return plan
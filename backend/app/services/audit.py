@@ -1,7 +1,8 @@
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
+from sqlalchemy import insert
 from sqlmodel import Session
 
 from ..enums import Role, SentenceStatus
@@ -67,3 +68,39 @@ def log_action(
         meta=_normalize_metadata(metadata),
     )
     session.add(entry)
+
+
+def log_actions_bulk(
+    session: Session,
+    *,
+    actor_id: Optional[int],
+    actor_role: Optional[Role],
+    action: str,
+    entity_type: str,
+    entries: Iterable[dict[str, Any]],
+    project_id: Optional[int] = None,
+) -> int:
+    """Insert many audit entries sharing actor/action in one statement without committing.
+
+    Each entry may carry ``entity_id``, ``before_status``, ``after_status`` and ``metadata``.
+    """
+
+    created_at = datetime.utcnow()
+    rows = [
+        {
+            "actor_id": actor_id,
+            "actor_role": actor_role.value if actor_role else None,
+            "action": action,
+            "entity_type": entity_type,
+            "entity_id": entry.get("entity_id"),
+            "before_status": _normalize_status(entry.get("before_status")),
+            "after_status": _normalize_status(entry.get("after_status")),
+            "project_id": entry.get("project_id", project_id),
+            "meta": _normalize_metadata(entry.get("metadata")),
+            "created_at": created_at,
+        }
+        for entry in entries
+    ]
+    if rows:
+        session.execute(insert(AuditLog), rows)
+    return len(rows)
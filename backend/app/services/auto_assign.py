@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+
+from fastapi import HTTPException
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session, select
+
+from ..config import Settings
+from ..database import session_scope
+from ..enums import AssignmentStrategy, Role
+from ..models import Project
+from ..schemas import BulkAssignmentResult
+from .bulk_assignment import BulkAssigner
+from .membership_cache import membership_cache
+from .workload import read_assignment_load
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AutoAssignPolicy:
+    max_active_per_user: int = 20
+    batch_size: int = 200
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> AutoAssignPolicy:
+        return cls(
+            max_active_per_user=settings.auto_assign_max_active_per_user,
+            batch_size=settings.auto_assign_batch_size,
+        )
+
+
+class AutoAssignScheduler:
+    """Top up annotator queues of projects with ``auto_assign_enabled``.
+
+    Acts as ``Role.ASSIGNMENT_ENGINE``: NEW sentences are taken in priority order and
+    assigned through ``BulkAssigner`` with the project's ``annotators_per_sentence``, never
+    pushing an annotator past ``max_active_per_user`` open assignments.
+    """
+
+    def __init__(self, session: Session, policy: AutoAssignPolicy) -> None:
+        self.session = session
+        self.policy = policy
+
+    def run_once(self) -> dict[int, BulkAssignmentResult]:
+        results: dict[int, BulkAssignmentResult] = {}
+        project_ids = self.session.exec(select(Project.id).where(Project.auto_assign_enabled.is_(True))).all()
+        for project_id in project_ids:
+            try:
+                result = self.top_up(project_id)
+                self.session.commit()
+            except HTTPException as exc:
+                self.session.rollback()
+                logger.info("Auto-assignment skipped for project %s: %s", project_id, exc.detail)
+                continue
+            except SQLAlchemyError:
+                # A concurrent assign or claim touched the same rows; retry on the next tick.
+                self.session.rollback()
+                logger.warning("Auto-assignment failed for project %s", project_id, exc_info=True)
+                continue
+            if result is not None:
+                results[project_id] = result
+        return results
+
+    def top_up(self, project_id: int) -> BulkAssignmentResult | None:
+        project = self.session.get(Project, project_id)
+        if project is None:
+            return None
+        per_sentence = max(project.annotators_per_sentence, 1)
+        limit = min(self.policy.batch_size, self._headroom(project_id) // per_sentence)
+        if limit < 1:
+            return None
+        return BulkAssigner(self.session).assign(
+            project_id=project_id,
+            actor_id=None,
+            actor_role=Role.ASSIGNMENT_ENGINE,
+            limit=limit,
+            strategy=AssignmentStrategy.ROUND_ROBIN,
+            role=Role.ANNOTATOR,
+            count=per_sentence,
+            is_blind=project.blind_annotation,
+            max_active_per_user=self.policy.max_active_per_user,
+            audit_action="sentence_auto_assigned",
+        )
+
+    def _headroom(self, project_id: int) -> int:
+        annotator_ids = membership_cache.get(self.session, project_id).active_ids(Role.ANNOTATOR)
+        load = read_assignment_load(self.session, project_id=project_id, role=Role.ANNOTATOR, user_ids=annotator_ids)
+        return sum(max(self.policy.max_active_per_user - load.get(user_id, 0), 0) for user_id in annotator_ids)
+
+
+def start_auto_assign_scheduler(settings: Settings, stop_event: threading.Event) -> threading.Thread | None:
+    """Run the scheduler periodically in a daemon thread until ``stop_event`` is set."""
+
+    interval = settings.auto_assign_interval_seconds
+    if interval <= 0:
+        return None
+
+    policy = AutoAssignPolicy.from_settings(settings)
+
+    def _loop() -> None:
+        while not stop_event.wait(interval):
+            try:
+                with session_scope() as session:
+                    results = AutoAssignScheduler(session, policy).run_once()
+                for project_id, result in results.items():
+                    if result.assignment_count:
+                        logger.info(
+                            "Auto-assigned %d sentences in project %s",
+                            len(result.assigned_sentence_ids),
+                            project_id,
+                        )
+            except Exception:  # noqa: BLE001
+                logger.exception("Auto-assignment run failed")
+
+    thread = threading.Thread(target=_loop, name="auto-assign-scheduler", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable, Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import insert, update
+from sqlmodel import Session, select
+
+from ..dependencies import CurrentUser
+from ..enums import ReviewDecision, Role, SentenceStatus
+from ..models import Annotation, Assignment, Project, Review, Sentence
+from ..schemas import BatchItemResult, BatchReviewItem, BatchWorkflowResult
+from .audit import log_actions_bulk
+from .batching import chunked
+from .failed_submissions import REVIEW_REJECT, FailedSubmissionStore
+from .workflow import WorkflowGuard, transition_many
+from .workload import track_deactivated
+
+
+def _failure(sentence_id: int, exc: HTTPException, sentence: Optional[Sentence] = None) -> BatchItemResult:
+    return BatchItemResult(
+        sentence_id=sentence_id,
+        applied=False,
+        before_status=sentence.status if sentence else None,
+        error_code=exc.status_code,
+        error=str(exc.detail),
+    )
+
+
+def _not_found() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cümle bulunamadı")
+
+
+class BatchWorkflow:
+    """Review or accept many sentences of a project in one transaction.
+
+    Every item is checked against ``WorkflowGuard`` before anything is written. Items that
+    fail are reported with the error the single-item endpoint would have returned and are
+    left untouched; the rest are applied with bulk statements for status changes,
+    assignment deactivations, reviews and audit rows. Callers own the commit.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def accept(self, *, project_id: int, sentence_ids: Sequence[int], actor: CurrentUser) -> BatchWorkflowResult:
+        guard = WorkflowGuard()
+        sentences = self._load_sentences(project_id, sentence_ids)
+        results: list[BatchItemResult] = []
+        accepted: list[Sentence] = []
+        for sentence_id in dict.fromkeys(sentence_ids):
+            sentence = sentences.get(sentence_id)
+            try:
+                if sentence is None:
+                    raise _not_found()
+                guard.ensure_transition(sentence.status, SentenceStatus.ACCEPTED, actor.acting_role)
+            except HTTPException as exc:
+                results.append(_failure(sentence_id, exc, sentence))
+                continue
+            accepted.append(sentence)
+            results.append(
+                BatchItemResult(
+                    sentence_id=sentence_id,
+                    applied=True,
+                    before_status=sentence.status,
+                    after_status=SentenceStatus.ACCEPTED,
+                )
+            )
+
+        active = self._active_assignments([sentence.id for sentence in accepted])
+        self._deactivate(project_id, [assignment for assignments in active.values() for assignment in assignments])
+        before = {sentence.id: sentence.status for sentence in accepted}
+        self._set_status({SentenceStatus.ACCEPTED: accepted})
+        log_actions_bulk(
+            self.session,
+            actor_id=actor.user_id,
+            actor_role=actor.acting_role,
+            action="sentence_accepted",
+            entity_type="sentence",
+            project_id=project_id,
+            entries=(
+                {
+                    "entity_id": sentence_id,
+                    "before_status": before_status,
+                    "after_status": SentenceStatus.ACCEPTED,
+                    "metadata": {
+                        "deactivated_assignment_ids": [assignment.id for assignment in active.get(sentence_id, [])],
+                        "batch": True,
+                    },
+                }
+                for sentence_id, before_status in before.items()
+            ),
+        )
+        return self._result(project_id, results)
+
+    def review(
+        self,
+        *,
+        project_id: int,
+        items: Sequence[BatchReviewItem],
+        actor: CurrentUser,
+        is_multi_annotator: bool = False,
+    ) -> BatchWorkflowResult:
+        guard = WorkflowGuard(is_multi_annotator=is_multi_annotator)
+        sentences = self._load_sentences(project_id, [item.sentence_id for item in items])
+        annotations = self._load_annotations([item.annotation_id for item in items])
+
+        results: list[BatchItemResult] = []
+        planned: list[tuple[BatchReviewItem, Sentence, Annotation, BatchItemResult]] = []
+        seen: set[int] = set()
+        for item in items:
+            sentence = sentences.get(item.sentence_id)
+            annotation = annotations.get(item.annotation_id)
+            try:
+                target = self._check_review(guard, item, sentence, annotation, seen, actor.acting_role)
+            except HTTPException as exc:
+                results.append(_failure(item.sentence_id, exc, sentence))
+                continue
+            seen.add(item.sentence_id)
+            result = BatchItemResult(
+                sentence_id=item.sentence_id, applied=True, before_status=sentence.status, after_status=target
+            )
+            results.append(result)
+            planned.append((item, sentence, annotation, result))
+
+        active = self._active_assignments([sentence.id for _, sentence, _, _ in planned])
+        deactivated: dict[int, list[Assignment]] = {}
+        for item, sentence, annotation, result in planned:
+            close = guard.should_close_assignment_for_review(item.decision)
+            lock = guard.should_lock_assignments_for_target(result.after_status)
+            deactivated[sentence.id] = [
+                assignment
+                for assignment in active.get(sentence.id, [])
+                if lock
+                or (close and assignment.id == annotation.assignment_id)
+                or (assignment.user_id == actor.user_id and assignment.role == Role.REVIEWER)
+            ]
+        self._deactivate(project_id, [assignment for assignments in deactivated.values() for assignment in assignments])
+
+        now = datetime.utcnow()
+        review_ids: dict[int, int] = {}
+        for chunk in chunked(planned, 1000):
+            review_ids.update(
+                (annotation_id, review_id)
+                for review_id, annotation_id in self.session.execute(
+                    insert(Review).returning(Review.id, Review.annotation_id),
+                    [
+                        {
+                            "annotation_id": item.annotation_id,
+                            "reviewer_id": actor.user_id,
+                            "decision": item.decision,
+                            "score": item.score,
+                            "comment": item.comment,
+                            "created_at": now,
+                        }
+                        for item, _, _, _ in chunk
+                    ],
+                )
+            )
+        targets: dict[SentenceStatus, list[Sentence]] = defaultdict(list)
+        for item, sentence, _, result in planned:
+            result.review_id = review_ids[item.annotation_id]
+            targets[result.after_status].append(sentence)
+        self._set_status(targets, now)
+        self._record_rejections(project_id, planned, actor)
+
+        log_actions_bulk(
+            self.session,
+            actor_id=actor.user_id,
+            actor_role=actor.acting_role,
+            action="review_recorded",
+            entity_type="sentence",
+            project_id=project_id,
+            entries=(
+                {
+                    "entity_id": sentence.id,
+                    "before_status": result.before_status,
+                    "after_status": result.after_status,
+                    "metadata": {
+                        "review_id": result.review_id,
+                        "annotation_id": item.annotation_id,
+                        "decision": item.decision.value,
+                        "score": item.score,
+                        "is_multi_annotator": is_multi_annotator,
+                        "deactivated_assignment_ids": sorted(assignment.id for assignment in deactivated[sentence.id]),
+                        "batch": True,
+                    },
+                }
+                for item, sentence, _, result in planned
+            ),
+        )
+        return self._result(project_id, results)
+
+    @staticmethod
+    def _check_review(
+        guard: WorkflowGuard,
+        item: BatchReviewItem,
+        sentence: Optional[Sentence],
+        annotation: Optional[Annotation],
+        seen: set[int],
+        role: Role,
+    ) -> SentenceStatus:
+        """Run the checks of the single review endpoint and return the target status."""
+
+        if sentence is None:
+            raise _not_found()
+        if sentence.id in seen:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Cümle bu istekte birden fazla kez yer alıyor"
+            )
+        target = guard.review_to_target(item.decision)
+        current = sentence.status
+        if current == SentenceStatus.SUBMITTED:
+            guard.ensure_transition(current, SentenceStatus.IN_REVIEW, role)
+            current = SentenceStatus.IN_REVIEW
+        if current != target:
+            guard.ensure_transition(current, target, role)
+        if not annotation or annotation.sentence_id != sentence.id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Geçersiz anotasyon")
+        return target
+
+    def _record_rejections(
+        self,
+        project_id: int,
+        planned: Iterable[tuple[BatchReviewItem, Sentence, Annotation, BatchItemResult]],
+        actor: CurrentUser,
+    ) -> None:
+        rejected = [entry for entry in planned if entry[0].decision == ReviewDecision.REJECT]
+        if not rejected:
+            return
+        project = self.session.get(Project, project_id)
+        store = FailedSubmissionStore(self.session)
+        for item, sentence, annotation, result in rejected:
+            store.record(
+                project=project,
+                sentence=sentence,
+                failure_type=REVIEW_REJECT,
+                reason=item.comment or "Reviewer tarafından reddedildi.",
+                details={"review_id": result.review_id, "decision": item.decision.value, "score": item.score},
+                annotation_id=annotation.id,
+                assignment_id=annotation.assignment_id,
+                user_id=annotation.author_id,
+                reviewer_id=actor.user_id,
+                penman_text=annotation.penman_text,
+            )
+
+    def _load_sentences(self, project_id: int, sentence_ids: Sequence[int]) -> dict[int, Sentence]:
+        sentences: dict[int, Sentence] = {}
+        for chunk in chunked(list(dict.fromkeys(sentence_ids))):
+            sentences.update(
+                (sentence.id, sentence)
+                for sentence in self.session.exec(
+                    select(Sentence)
+                    .where(Sentence.project_id == project_id, Sentence.id.in_(chunk))
+                    .with_for_update()
+                )
+            )
+        return sentences
+
+    def _load_annotations(self, annotation_ids: Sequence[int]) -> dict[int, Annotation]:
+        annotations: dict[int, Annotation] = {}
+        for chunk in chunked(list(dict.fromkeys(annotation_ids))):
+            annotations.update(
+                (annotation.id, annotation)
+                for annotation in self.session.exec(select(Annotation).where(Annotation.id.in_(chunk)))
+            )
+        return annotations
+
+    def _active_assignments(self, sentence_ids: Sequence[int]) -> dict[int, list[Assignment]]:
+        active: dict[int, list[Assignment]] = defaultdict(list)
+        for chunk in chunked(sentence_ids):
+            for assignment in self.session.exec(
+                select(Assignment)
+                .where(Assignment.sentence_id.in_(chunk), Assignment.is_active.is_(True))
+                .order_by(Assignment.id)
+            ):
+                active[assignment.sentence_id].append(assignment)
+        return active
+
+    def _deactivate(self, project_id: int, assignments: Sequence[Assignment]) -> None:
+        if not assignments:
+            return
+        now = datetime.utcnow()
+        for chunk in chunked([assignment.id for assignment in assignments]):
+            self.session.execute(
+                update(Assignment).where(Assignment.id.in_(chunk)).values(is_active=False, updated_at=now)
+            )
+        track_deactivated(self.session, project_id, assignments)
+
+    def _set_status(self, targets: dict[SentenceStatus, list[Sentence]], now: Optional[datetime] = None) -> None:
+        for target, sentences in targets.items():
+            transition_many(self.session, sentences, target, now)
+
+    @staticmethod
+    def _result(project_id: int, results: list[BatchItemResult]) -> BatchWorkflowResult:
+        applied = sum(result.applied for result in results)
+        return BatchWorkflowResult(project_id=project_id, applied=applied, failed=len(results) - applied, items=results)
@@ -0,0 +1,11 @@
+from typing import Iterator, Sequence, TypeVar
+
+# Keeps IN (...) lists under the bind-parameter limits of SQLite and Postgres.
+IN_CHUNK_SIZE = 500
+
+T = TypeVar("T")
+
+
+def chunked(items: Sequence[T], size: int = IN_CHUNK_SIZE) -> Iterator[Sequence[T]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
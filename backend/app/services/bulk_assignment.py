@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from datetime import datetime
+from typing import Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from ..enums import AssignmentStrategy, Role, SentenceStatus
+from ..models import Assignment, Sentence
+from ..schemas import BulkAssignmentResult, BulkAssignmentSkip
+from .assignment_engine import AssignmentEngine
+from .audit import log_actions_bulk
+from .batching import chunked
+from .leases import lease_deadline
+from .workflow import WorkflowGuard, transition_many
+from .workload import adjust_assignment_load
+
+MAX_BULK_SENTENCES = 50_000
+
+
+class BulkAssigner:
+    """Assign many sentences of a project in one transaction.
+
+    Eligibility and workload are read once, the distribution is planned in memory by
+    ``AssignmentEngine.plan_bulk`` and assignments, status changes and audit rows are written
+    with bulk statements. Callers own the commit.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+        self.engine = AssignmentEngine(session)
+
+    def assign(
+        self,
+        *,
+        project_id: int,
+        actor_id: Optional[int],
+        actor_role: Role,
+        sentence_ids: Optional[Sequence[int]] = None,
+        limit: int = 1000,
+        strategy: AssignmentStrategy = AssignmentStrategy.ROUND_ROBIN,
+        role: Role = Role.ANNOTATOR,
+        count: int = 1,
+        required_skills: Optional[Sequence[str]] = None,
+        is_blind: bool = False,
+        max_active_per_user: Optional[int] = None,
+        audit_action: str = "sentence_assigned",
+    ) -> BulkAssignmentResult:
+        if sentence_ids is not None and len(sentence_ids) > MAX_BULK_SENTENCES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Tek istekte en fazla {MAX_BULK_SENTENCES} cümle atanabilir.",
+            )
+
+        skipped: list[BulkAssignmentSkip] = []
+        sentences = self._load_sentences(project_id, sentence_ids, limit)
+        if sentence_ids is not None:
+            found = {sentence.id for sentence in sentences}
+            skipped.extend(
+                BulkAssignmentSkip(sentence_id=sentence_id, reason="not_found")
+                for sentence_id in dict.fromkeys(sentence_ids)
+                if sentence_id not in found
+            )
+
+        guard = WorkflowGuard()
+        active = self._sentences_with_active_assignments([sentence.id for sentence in sentences])
+        candidates: list[Sentence] = []
+        checked_statuses: set[SentenceStatus] = set()
+        for sentence in sentences:
+            if sentence.status not in {SentenceStatus.NEW, SentenceStatus.ASSIGNED}:
+                skipped.append(BulkAssignmentSkip(sentence_id=sentence.id, reason="invalid_status"))
+                continue
+            if sentence.id in active:
+                skipped.append(BulkAssignmentSkip(sentence_id=sentence.id, reason="active_assignments"))
+                continue
+            if sentence.status not in checked_statuses:
+                guard.ensure_transition(sentence.status, SentenceStatus.ASSIGNED, actor_role)
+                checked_statuses.add(sentence.status)
+            candidates.append(sentence)
+
+        plan: dict[int, list[int]] = {}
+        if candidates:
+            plan = self.engine.plan_bulk(
+                project_id=project_id,
+                strategy=strategy,
+                role=role,
+                sentence_ids=[sentence.id for sentence in candidates],
+                count=count,
+                required_skills=required_skills,
+                max_active_per_user=max_active_per_user,
+            )
+        skipped.extend(
+            BulkAssignmentSkip(sentence_id=sentence.id, reason="insufficient_assignees")
+            for sentence in candidates
+            if sentence.id not in plan
+        )
+
+        assigned = [sentence for sentence in candidates if sentence.id in plan]
+        self._write(
+            project_id=project_id,
+            sentences=assigned,
+            plan=plan,
+            role=role,
+            is_blind=is_blind,
+            actor_id=actor_id,
+            actor_role=actor_role,
+            audit_metadata={
+                "assignee_role": role.value,
+                "strategy": strategy.value,
+                "requested_count": count,
+                "is_blind": is_blind,
+                "required_skills": list(required_skills) if required_skills else None,
+                "bulk": True,
+            },
+            audit_action=audit_action,
+        )
+
+        per_user: Counter[int] = Counter(user_id for user_ids in plan.values() for user_id in user_ids)
+        return BulkAssignmentResult(
+            project_id=project_id,
+            assigned_sentence_ids=[sentence.id for sentence in assigned],
+            assignment_count=sum(per_user.values()),
+            assignments_per_user=dict(per_user),
+            skipped=skipped,
+        )
+
+    def _load_sentences(
+        self, project_id: int, sentence_ids: Optional[Sequence[int]], limit: int
+    ) -> list[Sentence]:
+        if sentence_ids is None:
+            # Concurrent assigners (e.g. schedulers in several workers) pick disjoint rows.
+            return list(
+                self.session.exec(
+                    select(Sentence)
+                    .where(Sentence.project_id == project_id, Sentence.status == SentenceStatus.NEW)
+                    .order_by(Sentence.priority.desc(), Sentence.id)
+                    .limit(limit)
+                    .with_for_update(skip_locked=True)
+                )
+            )
+        unique_ids = list(dict.fromkeys(sentence_ids))
+        sentences: dict[int, Sentence] = {}
+        for chunk in chunked(unique_ids):
+            for sentence in self.session.exec(
+                select(Sentence).where(Sentence.project_id == project_id, Sentence.id.in_(chunk))
+            ):
+                sentences[sentence.id] = sentence
+        return [sentences[sentence_id] for sentence_id in unique_ids if sentence_id in sentences]
+
+    def _sentences_with_active_assignments(self, sentence_ids: Sequence[int]) -> set[int]:
+        active: set[int] = set()
+        for chunk in chunked(sentence_ids):
+            active.update(
+                self.session.exec(
+                    select(Assignment.sentence_id)
+                    .where(Assignment.sentence_id.in_(chunk), Assignment.is_active.is_(True))
+                    .distinct()
+                ).all()
+            )
+        return active
+
+    def _write(
+        self,
+        *,
+        project_id: int,
+        sentences: Sequence[Sentence],
+        plan: dict[int, list[int]],
+        role: Role,
+        is_blind: bool,
+        actor_id: Optional[int],
+        actor_role: Role,
+        audit_metadata: dict,
+        audit_action: str,
+    ) -> None:
+        if not sentences:
+            return
+        now = datetime.utcnow()
+        assignment_rows = [
+            {
+                "sentence_id": sentence.id,
+                "user_id": user_id,
+                "role": role,
+                "is_blind": is_blind,
+                "is_active": True,
+                "lease_expires_at": lease_deadline(now),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for sentence in sentences
+            for user_id in plan[sentence.id]
+        ]
+        for chunk in chunked(assignment_rows, 5_000):
+            self.session.execute(insert(Assignment), list(chunk))
+        adjust_assignment_load(
+            self.session,
+            project_id=project_id,
+            role=role,
+            deltas=Counter(row["user_id"] for row in assignment_rows),
+        )
+
+        by_status: dict[SentenceStatus, list[int]] = defaultdict(list)
+        for sentence in sentences:
+            by_status[sentence.status].append(sentence.id)
+        transition_many(self.session, sentences, SentenceStatus.ASSIGNED, now)
+
+        log_actions_bulk(
+            self.session,
+            actor_id=actor_id,
+            actor_role=actor_role,
+            action=audit_action,
+            entity_type="sentence",
+            project_id=project_id,
+            entries=(
+                {
+                    "entity_id": sentence_id,
+                    "before_status": before_status,
+                    "after_status": SentenceStatus.ASSIGNED,
+                    "metadata": {**audit_metadata, "assignee_ids": plan[sentence_id]},
+                }
+                for before_status, ids in by_status.items()
+                for sentence_id in ids
+            ),
+        )
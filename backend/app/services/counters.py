@@ -0,0 +1,36 @@
+from typing import Any
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, SQLModel
+
+
+def increment_counter(
+    session: Session,
+    model: type[SQLModel],
+    key: dict[str, Any],
+    *,
+    field: str = "count",
+    delta: int = 1,
+) -> None:
+    """Add ``delta`` to the counter row identified by ``key``, creating it if needed.
+
+    The row is updated in place first; a missing row is inserted inside a savepoint so a
+    concurrent insert of the same key (unique constraint) falls back to the update.
+    Does not commit.
+    """
+
+    column = getattr(model, field)
+    increment = (
+        update(model)
+        .where(*(getattr(model, name) == value for name, value in key.items()))
+        .values({field: column + delta})
+        .execution_options(synchronize_session=False)
+    )
+    if session.execute(increment).rowcount:
+        return
+    try:
+        with session.begin_nested():
+            session.add(model(**key, **{field: delta}))
+    except IntegrityError:
+        session.execute(increment)
@@ -20,6 +20,7 @@ from ..models import (
     Review,
     Sentence,
 )
+from ..services.failed_submissions import ExpandedFailure, FailedSubmissionStore
 from ..services.validation import ValidationService
 
 
@@ -77,6 +78,13 @@ class PiiFilter:
             return None
         return "0.0.0.0"
 
+    def apply_text(self, text: str | None) -> str | None:
+        """Free text (review comments, failure reasons) can quote anything, so only ``include`` keeps it."""
+
+        if self.strategy == PiiStrategy.INCLUDE:
+            return text
+        return None
+
     def cleanse_details(self, details: dict | None) -> dict | None:
         if details is None:
             return None
@@ -247,14 +255,14 @@ class ExportService:
             return []
         query = select(FailedSubmission).where(FailedSubmission.project_id == project_id)
         rows = self.session.exec(query).all()
-        payload: list[dict] = []
-        for failure in rows:
-            if not include_failed and failure.failure_type != "review_reject":
-                continue
-            if not include_rejected and failure.failure_type == "review_reject":
-                continue
-            payload.append(self._serialize_failed(failure, pii))
-        return payload
+        selected = [
+            failure
+            for failure in rows
+            if (include_failed or failure.failure_type == "review_reject")
+            and (include_rejected or failure.failure_type != "review_reject")
+        ]
+        expanded = FailedSubmissionStore(self.session).expand(selected)
+        return [self._serialize_failed(failure, expanded[failure.id], pii) for failure in selected]
 
     def _serialize_sentence(self, sentence: Sentence, pii: PiiFilter) -> dict:
         return {
@@ -307,7 +315,7 @@ class ExportService:
             "created_at": adjudication.created_at.isoformat() if adjudication.created_at else None,
         }
 
-    def _serialize_failed(self, failure: FailedSubmission, pii: PiiFilter) -> dict:
+    def _serialize_failed(self, failure: FailedSubmission, expanded: ExpandedFailure, pii: PiiFilter) -> dict:
         return {
             "id": failure.id,
             "sentence_id": failure.sentence_id,
@@ -317,11 +325,11 @@ class ExportService:
             "reviewer_id": pii.apply_user(failure.reviewer_id),
             "failure_type": failure.failure_type,
             "reason": failure.reason,
-            "details": pii.cleanse_details(failure.details),
+            "details": pii.cleanse_details(expanded.details),
             "amr_version": failure.amr_version,
             "role_set_version": failure.role_set_version,
             "rule_version": failure.rule_version,
-            "submitted_penman": failure.submitted_penman,
+            "submitted_penman": expanded.submitted_penman,
             "created_at": failure.created_at.isoformat() if failure.created_at else None,
         }
 
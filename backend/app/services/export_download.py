@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class RangeNotSatisfiableError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class ByteRange:
+    start: int
+    end: int
+
+    @property
+    def length(self) -> int:
+        return self.end - self.start + 1
+
+    def content_range(self, size: int) -> str:
+        return f"bytes {self.start}-{self.end}/{size}"
+
+
+def file_checksum(path: str | Path, *, chunk_size: int = CHUNK_SIZE) -> str:
+    """Return the hex SHA-256 digest of a file without loading it into memory."""
+
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as fp:
+        for chunk in iter(lambda: fp.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def strong_etag(checksum: str) -> str:
+    return f'"{checksum}"'
+
+
+def etag_matches(header: str | None, etag: str) -> bool:
+    """Strong comparison of an If-None-Match style header against ``etag``."""
+
+    if not header:
+        return False
+    candidates = {candidate.strip() for candidate in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def parse_range(header: str | None, size: int) -> ByteRange | None:
+    """Parse a single ``bytes=`` range.
+
+    Returns ``None`` when the full representation should be served: no header, an
+    unknown unit, a multi-range request or a syntactically invalid range (all of which
+    the server is allowed to ignore). Only a well-formed range that does not overlap the
+    file raises ``RangeNotSatisfiableError``.
+    """
+
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or not spec:
+        return None
+    if "," in spec:
+        return None
+
+    first, sep, last = (part.strip() for part in spec.strip().partition("-"))
+    if not sep or not (first or last) or not all(_is_digits(part) for part in (first, last) if part):
+        return None
+    if not first:
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise RangeNotSatisfiableError("İstenen aralık dosya boyutu dışında")
+        return ByteRange(start=max(size - suffix, 0), end=size - 1)
+
+    start = int(first)
+    end = int(last) if last else size - 1
+    if last and end < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiableError("İstenen aralık dosya boyutu dışında")
+    return ByteRange(start=start, end=min(end, size - 1))
+
+
+def _is_digits(value: str) -> bool:
+    return value.isascii() and value.isdigit()
+
+
+def iter_file_range(
+    fp: BinaryIO, byte_range: ByteRange | None = None, *, chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    if byte_range is None:
+        yield from iter(lambda: fp.read(chunk_size), b"")
+        return
+    fp.seek(byte_range.start)
+    remaining = byte_range.length
+    while remaining > 0:
+        chunk = fp.read(min(chunk_size, remaining))
+        if not chunk:
+            break
+        remaining -= len(chunk)
+        yield chunk
+
+
+class DownloadTracker:
+    """Thread-safe reference counts of artifacts that are currently being streamed.
+
+    Opening a file for download and deleting an idle one both happen under the same lock, so
+    within a process the sweeper can never remove a file between the existence check and the
+    first byte of a response.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._active: Counter[str] = Counter()
+
+    @staticmethod
+    def _key(path: str | Path) -> str:
+        return str(Path(path).resolve())
+
+    def acquire(self, path: str | Path) -> DownloadLease:
+        key = self._key(path)
+        with self._lock:
+            self._active[key] += 1
+        return DownloadLease(self, key)
+
+    def open(self, path: str | Path) -> DownloadLease:
+        """Open ``path`` under a lease; raises ``OSError`` when it is missing or unreadable."""
+
+        key = self._key(path)
+        with self._lock:
+            fp = Path(path).open("rb")
+            self._active[key] += 1
+        return DownloadLease(self, key, fp)
+
+    def unlink_if_idle(self, path: str | Path) -> bool:
+        """Delete ``path`` unless a download holds it; returns whether it was deleted."""
+
+        key = self._key(path)
+        with self._lock:
+            if self._active.get(key, 0) > 0:
+                return False
+            Path(path).unlink(missing_ok=True)
+            return True
+
+    def _release(self, key: str) -> None:
+        with self._lock:
+            self._active[key] -= 1
+            if self._active[key] <= 0:
+                del self._active[key]
+
+    def is_active(self, path: str | Path) -> bool:
+        with self._lock:
+            return self._active.get(self._key(path), 0) > 0
+
+
+class DownloadLease:
+    def __init__(self, tracker: DownloadTracker, key: str, file: Optional[BinaryIO] = None) -> None:
+        self._tracker = tracker
+        self._key = key
+        self.file = file
+        self._released = False
+        self._lock = threading.Lock()
+
+    def release(self) -> None:
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        if self.file is not None:
+            self.file.close()
+        self._tracker._release(self._key)
+
+
+download_tracker = DownloadTracker()
+
+
+def iter_leased_file(lease: DownloadLease, byte_range: ByteRange | None = None) -> Iterator[bytes]:
+    try:
+        yield from iter_file_range(lease.file, byte_range)
+    finally:
+        lease.release()
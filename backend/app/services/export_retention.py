@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlmodel import Session, select
+
+from ..config import Settings
+from ..database import session_scope
+from ..enums import JobStatus
+from ..models import ExportJob
+from .audit import log_action
+from .export_download import DownloadTracker, download_tracker
+from .job_queue import ExportJobQueue
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RetentionPolicy:
+    max_age: timedelta | None = None
+    max_total_bytes: int | None = None
+    keep_last: int | None = None
+    download_grace: timedelta = timedelta(minutes=60)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> RetentionPolicy:
+        max_age_days = settings.export_retention_max_age_days
+        return cls(
+            max_age=timedelta(days=max_age_days) if max_age_days else None,
+            max_total_bytes=settings.export_retention_max_total_bytes,
+            keep_last=settings.export_retention_keep_last,
+            download_grace=timedelta(minutes=settings.export_retention_download_grace_minutes),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_age is not None or self.max_total_bytes is not None or self.keep_last is not None
+
+
+@dataclass
+class SweepResult:
+    expired_job_ids: list[int] = field(default_factory=list)
+    skipped_in_use_job_ids: list[int] = field(default_factory=list)
+    freed_bytes: int = 0
+
+
+class ExportRetentionSweeper:
+    """Delete export artifacts that fall outside the retention policy and expire their jobs."""
+
+    def __init__(
+        self,
+        session: Session,
+        policy: RetentionPolicy,
+        *,
+        tracker: DownloadTracker = download_tracker,
+    ) -> None:
+        self.session = session
+        self.policy = policy
+        self.tracker = tracker
+        self.queue = ExportJobQueue(session)
+
+    def sweep(self, *, now: datetime | None = None) -> SweepResult:
+        now = now or datetime.utcnow()
+        jobs = self.session.exec(
+            select(ExportJob)
+            .where(ExportJob.status == JobStatus.COMPLETED, ExportJob.result_path.is_not(None))
+            .order_by(ExportJob.created_at.desc(), ExportJob.id.desc())
+        ).all()
+
+        reasons: dict[int, str] = {}
+        sizes: dict[int, int] = {}
+        per_project: dict[int, int] = defaultdict(int)
+        for job in jobs:
+            path = Path(job.result_path)
+            if not path.is_file():
+                reasons[job.id] = "missing"
+                sizes[job.id] = 0
+                continue
+            sizes[job.id] = job.size_bytes if job.size_bytes is not None else path.stat().st_size
+            per_project[job.project_id] += 1
+            if self.policy.keep_last is not None and per_project[job.project_id] > self.policy.keep_last:
+                reasons[job.id] = "keep_last"
+            elif self.policy.max_age is not None and job.created_at < now - self.policy.max_age:
+                reasons[job.id] = "max_age"
+
+        if self.policy.max_total_bytes is not None:
+            retained = [job for job in jobs if job.id not in reasons]
+            total = sum(sizes[job.id] for job in retained)
+            for job in reversed(retained):
+                if total <= self.policy.max_total_bytes:
+                    break
+                reasons[job.id] = "max_total_bytes"
+                total -= sizes[job.id]
+
+        result = SweepResult()
+        for job in jobs:
+            reason = reasons.get(job.id)
+            if reason is None:
+                continue
+            # The row may have been downloaded or expired since the sweep started; re-read it, and
+            # let the tracker refuse the unlink if a download opened the file in the meantime.
+            self.session.refresh(job)
+            if job.status != JobStatus.COMPLETED or job.result_path is None:
+                continue
+            if self._in_use(job, now) or not self.tracker.unlink_if_idle(job.result_path):
+                result.skipped_in_use_job_ids.append(job.id)
+                continue
+            log_action(
+                self.session,
+                actor_id=None,
+                actor_role=None,
+                action="export_job_expired",
+                entity_type="export_job",
+                entity_id=job.id,
+                before_status=job.status.value,
+                after_status=JobStatus.EXPIRED.value,
+                project_id=job.project_id,
+                metadata={"reason": reason, "result_path": job.result_path, "freed_bytes": sizes[job.id]},
+            )
+            self.queue.mark_expired(job)
+            result.expired_job_ids.append(job.id)
+            result.freed_bytes += sizes[job.id]
+        return result
+
+    def _in_use(self, job: ExportJob, now: datetime) -> bool:
+        if self.tracker.is_active(job.result_path):
+            return True
+        # Downloads served by other processes are only visible through the timestamp.
+        return job.last_downloaded_at is not None and job.last_downloaded_at >= now - self.policy.download_grace
+
+
+def start_retention_sweeper(settings: Settings, stop_event: threading.Event) -> threading.Thread | None:
+    """Run the sweeper periodically in a daemon thread until ``stop_event`` is set."""
+
+    interval = settings.export_retention_interval_seconds
+    policy = RetentionPolicy.from_settings(settings)
+    # Deleting artifacts is opt-in: nothing runs until a retention limit is configured.
+    if interval <= 0 or not policy.enabled:
+        return None
+
+    def _loop() -> None:
+        while not stop_event.wait(interval):
+            try:
+                with session_scope() as session:
+                    result = ExportRetentionSweeper(session, policy).sweep()
+                if result.expired_job_ids:
+                    logger.info(
+                        "Expired %d export jobs, freed %d bytes",
+                        len(result.expired_job_ids),
+                        result.freed_bytes,
+                    )
+            except Exception:  # noqa: BLE001
+                logger.exception("Export retention sweep failed")
+
+    thread = threading.Thread(target=_loop, name="export-retention-sweeper", daemon=True)
+    thread.start()
+    return thread
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Iterable, Optional
 
+from sqlalchemy import update
 from sqlmodel import Session, select
 
 from ..enums import JobStatus, Role
 from ..models import ExportJob
 from .export import ExportRequest, ExportService, ExportValidationError
+from .export_download import download_tracker, file_checksum
 from .job_queue import ExportJobQueue
 
 
@@ -44,8 +47,48 @@ class ExportWorker:
         try:
             payload = self.service.export(request, actor_role=Role.ADMIN)
             path = self.service.write_export_file(payload, request, directory=self.output_dir, job_id=job.id)
+            checksum = file_checksum(path)
+            size_bytes = Path(path).stat().st_size
         except (ExportValidationError, Exception) as exc:  # noqa: BLE001
             return self.queue.mark_failed(job, error_message=str(exc))
 
-        return self.queue.mark_completed(job, result_path=path)
+        return self.queue.mark_completed(job, result_path=path, checksum=checksum, size_bytes=size_bytes)
 
+
+    def backfill_checksums(self, job_ids: Optional[Iterable[int]] = None) -> int:
+        """Record checksums of completed jobs that finished before checksums were stored.
+
+        Files are hashed under a download lease so the retention sweeper cannot remove them
+        meanwhile; a job whose file changed hands or disappeared is skipped. Returns how many
+        jobs were updated.
+        """
+
+        query = select(ExportJob.id, ExportJob.result_path).where(
+            ExportJob.status == JobStatus.COMPLETED,
+            ExportJob.checksum.is_(None),
+            ExportJob.result_path.is_not(None),
+        )
+        if job_ids is not None:
+            query = query.where(ExportJob.id.in_(list(job_ids)))
+        updated = 0
+        for job_id, result_path in self.session.execute(query).all():
+            try:
+                lease = download_tracker.open(Path(result_path))
+            except OSError:
+                continue
+            try:
+                checksum = file_checksum(result_path)
+            finally:
+                lease.release()
+            result = self.session.execute(
+                update(ExportJob)
+                .where(
+                    ExportJob.id == job_id,
+                    ExportJob.checksum.is_(None),
+                    ExportJob.result_path == result_path,
+                )
+                .values(checksum=checksum)
+            )
+            self.session.commit()
+            updated += result.rowcount
+        return updated
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Any, Iterable, Optional, Sequence
+
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from ..models import Annotation, FailedSubmission, Project, Sentence, ValidationReportBlob
+from .failure_analytics import CODE_SEPARATOR, increment_failure_rollups, split_codes
+
+REVIEW_REJECT = "review_reject"
+VALIDATION = "validation"
+
+# Every Nth attempt in a retry chain stores the full text so reconstruction stays cheap.
+KEYFRAME_INTERVAL = 8
+
+_KEEP, _DELETE, _INSERT = 0, 1, 2
+
+
+def report_hash(report: dict[str, Any]) -> str:
+    canonical = json.dumps(report, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def encode_delta(base: str, target: str) -> str:
+    """Encode ``target`` as keep/delete/insert operations against ``base``."""
+
+    ops: list[list[Any]] = []
+    matcher = SequenceMatcher(None, base, target, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([_KEEP, i2 - i1])
+            continue
+        if tag in {"delete", "replace"}:
+            ops.append([_DELETE, i2 - i1])
+        if tag in {"insert", "replace"}:
+            ops.append([_INSERT, target[j1:j2]])
+    return json.dumps(ops, ensure_ascii=False, separators=(",", ":"))
+
+
+def apply_delta(base: str, delta: str) -> str:
+    parts: list[str] = []
+    position = 0
+    for op, value in json.loads(delta):
+        if op == _KEEP:
+            parts.append(base[position : position + value])
+            position += value
+        elif op == _DELETE:
+            position += value
+        else:
+            parts.append(value)
+    return "".join(parts)
+
+
+def _join_codes(codes: Sequence[str]) -> Optional[str]:
+    # One entry per distinct code, in report order, so broken graphs fit the column.
+    return CODE_SEPARATOR.join(dict.fromkeys(codes)) if codes else None
+
+
+@dataclass
+class ExpandedFailure:
+    details: Optional[dict[str, Any]]
+    submitted_penman: Optional[str]
+
+
+class FailedSubmissionStore:
+    """Persist failed submissions compactly and expand them back for readers.
+
+    Validation reports are stored once per content hash, error/warning codes are promoted
+    to columns, retried PENMAN is stored as a delta against the user's previous attempt on
+    the same sentence and review rejections reference the annotation instead of copying it.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def record(
+        self,
+        *,
+        project: Project,
+        sentence: Sentence,
+        failure_type: str,
+        reason: str,
+        details: Optional[dict[str, Any]] = None,
+        report: Optional[dict[str, Any]] = None,
+        assignment_id: Optional[int] = None,
+        annotation_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        reviewer_id: Optional[int] = None,
+        penman_text: Optional[str] = None,
+    ) -> FailedSubmission:
+        failure = FailedSubmission(
+            project_id=project.id,
+            sentence_id=sentence.id,
+            assignment_id=assignment_id,
+            annotation_id=annotation_id,
+            user_id=user_id,
+            reviewer_id=reviewer_id,
+            failure_type=failure_type,
+            reason=reason,
+            details=details or None,
+            amr_version=project.amr_version,
+            role_set_version=project.role_set_version,
+            rule_version=project.validation_rule_version,
+        )
+        if report is not None:
+            error_codes = [issue["code"] for issue in report.get("errors", [])]
+            warning_codes = [issue["code"] for issue in report.get("warnings", [])]
+            failure.report_hash = self._store_report(report)
+            failure.primary_error_code = error_codes[0] if error_codes else None
+            failure.error_codes = _join_codes(error_codes)
+            failure.warning_codes = _join_codes(warning_codes)
+
+        if penman_text is not None and not (annotation_id is not None and failure_type == REVIEW_REJECT):
+            self._store_penman(failure, penman_text)
+
+        self.session.add(failure)
+        self.session.flush()
+        increment_failure_rollups(self.session, failure)
+        return failure
+
+    def expand(self, failures: Sequence[FailedSubmission]) -> dict[int, ExpandedFailure]:
+        """Rebuild the legacy ``details``/``submitted_penman`` view with batched lookups."""
+
+        reports = self._load_reports({f.report_hash for f in failures if f.report_hash})
+        annotation_penman = self._load_annotation_penman(
+            {f.annotation_id for f in failures if f.annotation_id is not None and f.failure_type == REVIEW_REJECT}
+        )
+        known = {failure.id: failure for failure in failures}
+        resolved: dict[int, Optional[str]] = {}
+
+        expanded: dict[int, ExpandedFailure] = {}
+        for failure in failures:
+            penman_text = self._resolve_penman(failure, known, resolved)
+            if penman_text is None and failure.failure_type == REVIEW_REJECT:
+                penman_text = annotation_penman.get(failure.annotation_id)
+            expanded[failure.id] = ExpandedFailure(
+                details=self._expand_details(failure, reports.get(failure.report_hash)),
+                submitted_penman=penman_text,
+            )
+        return expanded
+
+    def _expand_details(
+        self, failure: FailedSubmission, report: Optional[dict[str, Any]]
+    ) -> Optional[dict[str, Any]]:
+        if report is None and failure.failure_type != REVIEW_REJECT:
+            return failure.details
+        details: dict[str, Any] = dict(failure.details or {})
+        if report is not None:
+            details.setdefault("report", report)
+            details.setdefault("error_codes", split_codes(failure.error_codes))
+            details.setdefault("warning_codes", split_codes(failure.warning_codes))
+            details.setdefault("canonical_penman", report.get("canonical_penman"))
+            details.setdefault("triple_count", report.get("triple_count"))
+        if failure.failure_type == REVIEW_REJECT:
+            details.setdefault("annotation_id", failure.annotation_id)
+        details.setdefault("rule_version", failure.rule_version)
+        details.setdefault("amr_version", failure.amr_version)
+        details.setdefault("role_set_version", failure.role_set_version)
+        return details
+
+    def _store_report(self, report: dict[str, Any]) -> str:
+        digest = report_hash(report)
+        if self.session.get(ValidationReportBlob, digest) is not None:
+            return digest
+        try:
+            with self.session.begin_nested():
+                self.session.add(ValidationReportBlob(report_hash=digest, report=report))
+        except IntegrityError:
+            # A concurrent writer stored the same report first.
+            pass
+        return digest
+
+    def _store_penman(self, failure: FailedSubmission, penman_text: str) -> None:
+        previous = None
+        if failure.user_id is not None:
+            previous = self.session.exec(
+                select(FailedSubmission)
+                .where(
+                    FailedSubmission.sentence_id == failure.sentence_id,
+                    FailedSubmission.user_id == failure.user_id,
+                    FailedSubmission.failure_type == failure.failure_type,
+                )
+                .order_by(FailedSubmission.id.desc())
+                .limit(1)
+            ).first()
+        if previous is not None and previous.penman_delta_depth + 1 < KEYFRAME_INTERVAL:
+            base_text = self.expand([previous])[previous.id].submitted_penman
+            if base_text is not None:
+                delta = encode_delta(base_text, penman_text)
+                if len(delta) < len(penman_text):
+                    failure.penman_base_id = previous.id
+                    failure.penman_delta = delta
+                    failure.penman_delta_depth = previous.penman_delta_depth + 1
+                    return
+        failure.submitted_penman = penman_text
+
+    def _resolve_penman(
+        self,
+        failure: FailedSubmission,
+        known: dict[int, FailedSubmission],
+        resolved: dict[int, Optional[str]],
+    ) -> Optional[str]:
+        chain: list[FailedSubmission] = []
+        current: Optional[FailedSubmission] = failure
+        text: Optional[str] = None
+        while current is not None:
+            if current.id in resolved:
+                text = resolved[current.id]
+                break
+            if current.penman_delta is None or current.penman_base_id is None:
+                text = current.submitted_penman
+                resolved[current.id] = text
+                break
+            chain.append(current)
+            base = known.get(current.penman_base_id) or self.session.get(FailedSubmission, current.penman_base_id)
+            if base is not None:
+                known[base.id] = base
+            current = base
+        for link in reversed(chain):
+            text = apply_delta(text, link.penman_delta) if text is not None else None
+            resolved[link.id] = text
+        return text
+
+    def _load_reports(self, hashes: Iterable[str]) -> dict[str, dict[str, Any]]:
+        hashes = set(hashes)
+        if not hashes:
+            return {}
+        rows = self.session.exec(select(ValidationReportBlob).where(ValidationReportBlob.report_hash.in_(hashes)))
+        return {row.report_hash: row.report for row in rows}
+
+    def _load_annotation_penman(self, annotation_ids: set[int]) -> dict[int, str]:
+        if not annotation_ids:
+            return {}
+        rows = self.session.exec(
+            select(Annotation.id, Annotation.penman_text).where(Annotation.id.in_(annotation_ids))
+        ).all()
+        return {annotation_id: penman_text for annotation_id, penman_text in rows}
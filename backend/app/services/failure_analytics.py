@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import date
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, func
+from sqlmodel import Session, select
+
+from ..models import FailedSubmission, FailureRollup
+from ..models.failure_rollup import ALL_CODES
+from ..schemas import FailureAnalytics, FailureDailyCount, FailureUserCount
+from .counters import increment_counter
+
+RollupKey = tuple[int, date, str, int, str]
+
+CODE_SEPARATOR = ","
+
+
+def split_codes(codes: Optional[str]) -> list[str]:
+    return codes.split(CODE_SEPARATOR) if codes else []
+
+
+def _failure_codes(failure: FailedSubmission) -> list[str]:
+    if failure.error_codes is not None or failure.report_hash is not None:
+        codes = split_codes(failure.error_codes)
+    else:
+        # Rows written before the codes were promoted to columns.
+        codes = list((failure.details or {}).get("error_codes") or [])
+    return list(dict.fromkeys(codes))
+
+
+def _rollup_keys(failure: FailedSubmission) -> list[RollupKey]:
+    base = (failure.project_id, failure.created_at.date(), failure.failure_type, failure.user_id or 0)
+    return [(*base, code) for code in [ALL_CODES, *_failure_codes(failure)]]
+
+
+def increment_failure_rollups(session: Session, failure: FailedSubmission) -> None:
+    """Add ``failure`` to its daily rollup rows without committing."""
+
+    for project_id, bucket_date, failure_type, user_id, error_code in _rollup_keys(failure):
+        increment_counter(
+            session,
+            FailureRollup,
+            {
+                "project_id": project_id,
+                "bucket_date": bucket_date,
+                "failure_type": failure_type,
+                "user_id": user_id,
+                "error_code": error_code,
+            },
+        )
+
+
+def rebuild_failure_rollups(session: Session, project_id: int, *, batch_size: int = 1000) -> int:
+    """Recompute a project's rollups from FailedSubmission and return the number of failures seen."""
+
+    counts: Counter[RollupKey] = Counter()
+    seen = 0
+    last_id = 0
+    while True:
+        batch = session.exec(
+            select(FailedSubmission)
+            .where(FailedSubmission.project_id == project_id, FailedSubmission.id > last_id)
+            .order_by(FailedSubmission.id)
+            .limit(batch_size)
+        ).all()
+        if not batch:
+            break
+        for failure in batch:
+            counts.update(_rollup_keys(failure))
+        seen += len(batch)
+        last_id = batch[-1].id
+        session.expunge_all()
+
+    session.execute(delete(FailureRollup).where(FailureRollup.project_id == project_id))
+    session.add_all(
+        FailureRollup(
+            project_id=key[0],
+            bucket_date=key[1],
+            failure_type=key[2],
+            user_id=key[3],
+            error_code=key[4],
+            count=count,
+        )
+        for key, count in counts.items()
+    )
+    session.flush()
+    return seen
+
+
+class FailureAnalyticsService:
+    """Read failure breakdowns from the rollup table; cost is independent of failure volume."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def summarize(
+        self,
+        *,
+        project_id: int,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        failure_type: Optional[str] = None,
+        user_id: Optional[int] = None,
+    ) -> FailureAnalytics:
+        conditions = [FailureRollup.project_id == project_id]
+        if start is not None:
+            conditions.append(FailureRollup.bucket_date >= start)
+        if end is not None:
+            conditions.append(FailureRollup.bucket_date <= end)
+        if failure_type is not None:
+            conditions.append(FailureRollup.failure_type == failure_type)
+        if user_id is not None:
+            conditions.append(FailureRollup.user_id == user_id)
+        totals_only = [*conditions, FailureRollup.error_code == ALL_CODES]
+
+        by_failure_type = self._grouped(totals_only, FailureRollup.failure_type)
+        by_error_code = self._grouped([*conditions, FailureRollup.error_code != ALL_CODES], FailureRollup.error_code)
+        by_user = [
+            FailureUserCount(user_id=uid or None, failure_type=ftype, count=count)
+            for uid, ftype, count in self._grouped_rows(totals_only, FailureRollup.user_id, FailureRollup.failure_type)
+        ]
+        by_day = [
+            FailureDailyCount(day=day, failure_type=ftype, count=count)
+            for day, ftype, count in self._grouped_rows(
+                totals_only, FailureRollup.bucket_date, FailureRollup.failure_type
+            )
+        ]
+        return FailureAnalytics(
+            project_id=project_id,
+            start=start,
+            end=end,
+            total=sum(by_failure_type.values()),
+            by_failure_type=by_failure_type,
+            by_error_code=by_error_code,
+            by_user=sorted(by_user, key=lambda row: (-row.count, row.user_id or 0)),
+            by_day=by_day,
+        )
+
+    def _grouped(self, conditions: Iterable, column) -> dict[str, int]:
+        return {key: count for key, count in self._grouped_rows(conditions, column)}
+
+    def _grouped_rows(self, conditions: Iterable, *columns) -> list[tuple]:
+        rows = self.session.exec(
+            select(*columns, func.sum(FailureRollup.count))
+            .where(*conditions)
+            .group_by(*columns)
+            .order_by(*columns)
+        ).all()
+        return [(*row[:-1], int(row[-1])) for row in rows]
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, SQLModel, select
+
+from ..config import Settings, get_settings
+from ..database import session_scope
+from ..models import IdempotencyRecord
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+
+def request_hash(scope: str, payload: Optional[BaseModel] = None) -> str:
+    body = payload.model_dump(mode="json") if payload is not None else None
+    canonical = json.dumps([scope, body], sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class IdempotencyStore:
+    """Replay the stored response of a mutation retried with the same ``Idempotency-Key``.
+
+    Keys are per user. The response is saved in the mutation's own transaction, so a request
+    either commits its changes together with the stored response or leaves no record and can
+    be retried. Only successful responses are stored; a key reused for a different request
+    is rejected with 422. Records expire after ``idempotency_ttl_seconds``.
+    """
+
+    def __init__(self, session: Session, *, ttl_seconds: Optional[int] = None) -> None:
+        self.session = session
+        self.ttl_seconds = get_settings().idempotency_ttl_seconds if ttl_seconds is None else ttl_seconds
+
+    def replay(self, *, user_id: int, key: Optional[str], scope: str, fingerprint: str) -> Optional[JSONResponse]:
+        if key is None:
+            return None
+        if not key.strip() or len(key) > MAX_KEY_LENGTH:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{IDEMPOTENCY_HEADER} 1-{MAX_KEY_LENGTH} karakter olmalı",
+            )
+        record = self.session.exec(
+            select(IdempotencyRecord).where(
+                IdempotencyRecord.user_id == user_id,
+                IdempotencyRecord.key == key,
+                IdempotencyRecord.expires_at > datetime.utcnow(),
+            )
+        ).first()
+        if record is None:
+            return None
+        if record.scope != scope or record.request_hash != fingerprint:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"{IDEMPOTENCY_HEADER} farklı bir istek için kullanılmış",
+            )
+        return JSONResponse(
+            status_code=record.status_code, content=record.response_body, headers={REPLAYED_HEADER: "true"}
+        )
+
+    def save(
+        self,
+        *,
+        user_id: int,
+        key: Optional[str],
+        scope: str,
+        fingerprint: str,
+        status_code: int,
+        response: SQLModel,
+    ) -> None:
+        """Store ``response`` as it will be returned; call after the mutation is flushed, before commit."""
+
+        if key is None:
+            return
+        now = datetime.utcnow()
+        self.session.execute(
+            delete(IdempotencyRecord).where(
+                IdempotencyRecord.user_id == user_id,
+                IdempotencyRecord.key == key,
+                IdempotencyRecord.expires_at <= now,
+            )
+        )
+        self.session.flush()
+        self.session.refresh(response)
+        self.session.add(
+            IdempotencyRecord(
+                user_id=user_id,
+                key=key,
+                scope=scope,
+                request_hash=fingerprint,
+                status_code=status_code,
+                response_body=jsonable_encoder(response),
+                created_at=now,
+                expires_at=now + timedelta(seconds=self.ttl_seconds),
+            )
+        )
+        try:
+            self.session.flush()
+        except IntegrityError as exc:
+            # A concurrent request with the same key won; its response is replayed on retry.
+            self.session.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Aynı {IDEMPOTENCY_HEADER} ile başka bir istek işlendi; isteği yineleyin",
+            ) from exc
+
+    def purge_expired(self) -> int:
+        result = self.session.execute(
+            delete(IdempotencyRecord).where(IdempotencyRecord.expires_at <= datetime.utcnow())
+        )
+        return result.rowcount
+
+
+def start_idempotency_sweeper(settings: Settings, stop_event: threading.Event) -> threading.Thread | None:
+    """Delete expired idempotency records periodically in a daemon thread until ``stop_event`` is set."""
+
+    interval = settings.idempotency_sweep_interval_seconds
+    if interval <= 0:
+        return None
+
+    def _loop() -> None:
+        while not stop_event.wait(interval):
+            try:
+                with session_scope() as session:
+                    purged = IdempotencyStore(session).purge_expired()
+                    session.commit()
+                if purged:
+                    logger.info("Purged %d expired idempotency records", purged)
+            except Exception:  # noqa: BLE001
+                logger.exception("Idempotency record sweep failed")
+
+    thread = threading.Thread(target=_loop, name="idempotency-sweeper", daemon=True)
+    thread.start()
+    return thread
@@ -51,15 +51,34 @@ class ExportJobQueue:
         self.session.refresh(job)
         return job
 
-    def mark_completed(self, job: ExportJob, *, result_path: str) -> ExportJob:
+    def mark_completed(
+        self,
+        job: ExportJob,
+        *,
+        result_path: str,
+        checksum: Optional[str] = None,
+        size_bytes: Optional[int] = None,
+    ) -> ExportJob:
         job.status = JobStatus.COMPLETED
         job.result_path = result_path
+        job.checksum = checksum
+        job.size_bytes = size_bytes
         job.updated_at = datetime.utcnow()
         self.session.add(job)
         self.session.commit()
         self.session.refresh(job)
         return job
 
+    def mark_expired(self, job: ExportJob) -> ExportJob:
+        job.status = JobStatus.EXPIRED
+        job.result_path = None
+        job.expired_at = datetime.utcnow()
+        job.updated_at = job.expired_at
+        self.session.add(job)
+        self.session.commit()
+        self.session.refresh(job)
+        return job
+
     def mark_failed(self, job: ExportJob, *, error_message: str) -> ExportJob:
         job.status = JobStatus.FAILED
         job.error_message = error_message
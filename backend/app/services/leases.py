@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import exists, update
+from sqlmodel import Session, select
+
+from ..config import Settings, get_settings
+from ..database import session_scope
+from ..enums import Role, SentenceStatus
+from ..models import Annotation, Assignment, Sentence
+from .audit import log_actions_bulk
+from .batching import chunked
+from .workload import adjust_assignment_load
+
+logger = logging.getLogger(__name__)
+
+# Where a sentence goes back to once its last lease of the role has been released.
+REQUEUE_TRANSITIONS = {
+    Role.ANNOTATOR: (SentenceStatus.ASSIGNED, SentenceStatus.NEW),
+    Role.REVIEWER: (SentenceStatus.IN_REVIEW, SentenceStatus.SUBMITTED),
+}
+
+
+def lease_deadline(now: Optional[datetime] = None) -> Optional[datetime]:
+    """Expiry for a lease starting at ``now``; ``None`` when leases are disabled."""
+
+    minutes = get_settings().assignment_lease_minutes
+    if not minutes or minutes <= 0:
+        return None
+    return (now or datetime.utcnow()) + timedelta(minutes=minutes)
+
+
+def renew_lease(session: Session, *, sentence_id: int, user_id: int) -> Assignment:
+    """Extend the caller's active lease on a sentence; used as the editor heartbeat."""
+
+    assignment = session.exec(
+        select(Assignment).where(
+            Assignment.sentence_id == sentence_id,
+            Assignment.user_id == user_id,
+            Assignment.is_active.is_(True),
+        )
+    ).first()
+    if not assignment:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Aktif atama bulunamadı")
+    assignment.lease_expires_at = lease_deadline()
+    session.add(assignment)
+    return assignment
+
+
+@dataclass
+class ReapResult:
+    released_assignment_ids: list[int] = field(default_factory=list)
+    requeued_sentence_ids: list[int] = field(default_factory=list)
+
+
+class AssignmentLeaseReaper:
+    """Release expired leases on unfinished work and put their sentences back in the pool.
+
+    Expired assignments are found through the ``(is_active, lease_expires_at)`` index,
+    deactivated in bulk and, when no other lease of the same role remains, the sentence moves
+    back to NEW (annotation) or SUBMITTED (review) so claims and auto-assignment pick it up.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def reap(self, now: Optional[datetime] = None, *, limit: int = 1000) -> ReapResult:
+        now = now or datetime.utcnow()
+        result = ReapResult()
+        rows = self.session.exec(
+            select(Assignment.id, Assignment.sentence_id, Assignment.user_id, Assignment.role, Sentence.project_id)
+            .join(Sentence, Sentence.id == Assignment.sentence_id)
+            .where(
+                Assignment.is_active.is_(True),
+                Assignment.lease_expires_at < now,
+                ~exists().where(Annotation.assignment_id == Assignment.id),
+            )
+            .order_by(Assignment.lease_expires_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True, of=Assignment)
+        ).all()
+        if not rows:
+            return result
+
+        result.released_assignment_ids = [row[0] for row in rows]
+        for chunk in chunked(result.released_assignment_ids):
+            self.session.execute(
+                update(Assignment)
+                .where(Assignment.id.in_(chunk), Assignment.is_active.is_(True))
+                .values(is_active=False, updated_at=now)
+                .execution_options(synchronize_session=False)
+            )
+        loads: dict[tuple[int, Role], Counter[int]] = {}
+        for _, _, user_id, role, project_id in rows:
+            loads.setdefault((project_id, role), Counter())[user_id] -= 1
+        for (project_id, role), deltas in loads.items():
+            adjust_assignment_load(self.session, project_id=project_id, role=role, deltas=deltas)
+
+        before: dict[int, SentenceStatus] = {}
+        for role, (held, released) in REQUEUE_TRANSITIONS.items():
+            sentence_ids = list({row[1] for row in rows if row[3] == role})
+            for chunk in chunked(sentence_ids):
+                before.update(
+                    self.session.exec(select(Sentence.id, Sentence.status).where(Sentence.id.in_(chunk))).all()
+                )
+                self.session.execute(
+                    update(Sentence)
+                    .where(
+                        Sentence.id.in_(chunk),
+                        Sentence.status == held,
+                        ~exists().where(
+                            Assignment.sentence_id == Sentence.id,
+                            Assignment.role == role,
+                            Assignment.is_active.is_(True),
+                        ),
+                    )
+                    .values(status=released, updated_at=now, version=Sentence.version + 1)
+                    .execution_options(synchronize_session=False)
+                )
+        after = dict(
+            self.session.exec(select(Sentence.id, Sentence.status).where(Sentence.id.in_(list(before)))).all()
+        )
+        result.requeued_sentence_ids = sorted(
+            sentence_id for sentence_id, status_before in before.items() if after.get(sentence_id) != status_before
+        )
+
+        for project_id in {row[4] for row in rows}:
+            log_actions_bulk(
+                self.session,
+                actor_id=None,
+                actor_role=Role.ASSIGNMENT_ENGINE,
+                action="assignment_lease_expired",
+                entity_type="sentence",
+                project_id=project_id,
+                entries=(
+                    {
+                        "entity_id": sentence_id,
+                        "before_status": before.get(sentence_id),
+                        "after_status": after.get(sentence_id),
+                        "metadata": {"assignment_id": assignment_id, "user_id": user_id, "role": role.value},
+                    }
+                    for assignment_id, sentence_id, user_id, role, row_project_id in rows
+                    if row_project_id == project_id
+                ),
+            )
+        return result
+
+
+def start_lease_reaper(settings: Settings, stop_event: threading.Event) -> threading.Thread | None:
+    """Run the reaper periodically in a daemon thread until ``stop_event`` is set."""
+
+    interval = settings.assignment_reaper_interval_seconds
+    if interval <= 0 or not settings.assignment_lease_minutes:
+        return None
+
+    def _loop() -> None:
+        while not stop_event.wait(interval):
+            try:
+                with session_scope() as session:
+                    result = AssignmentLeaseReaper(session).reap()
+                    session.commit()
+                if result.released_assignment_ids:
+                    logger.info(
+                        "Released %d expired assignment leases, requeued %d sentences",
+                        len(result.released_assignment_ids),
+                        len(result.requeued_sentence_ids),
+                    )
+            except Exception:  # noqa: BLE001
+                logger.exception("Assignment lease reaping failed")
+
+    thread = threading.Thread(target=_loop, name="assignment-lease-reaper", daemon=True)
+    thread.start()
+    return thread
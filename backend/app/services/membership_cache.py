@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, replace
+from itertools import chain
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+
+from ..config import get_settings
+from ..enums import Role
+from ..models import MembershipVersion, ProjectMembership
+from .counters import increment_counter
+
+
+@dataclass(frozen=True)
+class MemberEntry:
+    role: Role
+    is_active: bool
+    approved: bool
+
+
+@dataclass(frozen=True)
+class ProjectMembers:
+    """Snapshot of a project's memberships keyed by user id."""
+
+    members: dict[int, MemberEntry]
+    active_by_role: dict[Role, frozenset[int]]
+
+    def get(self, user_id: int) -> Optional[MemberEntry]:
+        return self.members.get(user_id)
+
+    def active_ids(self, role: Role) -> frozenset[int]:
+        return self.active_by_role.get(role, frozenset())
+
+
+def build_project_members(session: Session, project_id: int) -> ProjectMembers:
+    rows = session.exec(
+        select(
+            ProjectMembership.user_id,
+            ProjectMembership.role,
+            ProjectMembership.is_active,
+            ProjectMembership.approved_at,
+        ).where(ProjectMembership.project_id == project_id)
+    ).all()
+    members = {
+        user_id: MemberEntry(role=role, is_active=is_active, approved=approved_at is not None)
+        for user_id, role, is_active, approved_at in rows
+    }
+    active_by_role: dict[Role, set[int]] = {}
+    for user_id, entry in members.items():
+        if entry.is_active:
+            active_by_role.setdefault(entry.role, set()).add(user_id)
+    return ProjectMembers(
+        members=members,
+        active_by_role={role: frozenset(user_ids) for role, user_ids in active_by_role.items()},
+    )
+
+
+def read_membership_version(session: Session, project_id: int) -> int:
+    version = session.exec(select(MembershipVersion.version).where(MembershipVersion.project_id == project_id)).first()
+    return version or 0
+
+
+@dataclass(frozen=True)
+class _Entry:
+    generation: int
+    local_version: int
+    db_version: Optional[int]
+    built_at: float
+    checked_at: float
+    members: ProjectMembers
+
+
+class MembershipCache:
+    """Per-project membership snapshots shared by all sessions of the process.
+
+    Each project carries a local version bumped when a commit changes its memberships. With
+    ``version_poll_seconds`` set, entries older than that are also checked against the
+    ``MembershipVersion`` row so writes from other processes are seen; the default of 0 makes
+    every read check that single row, so revoked access never outlives the request that sees
+    it. Only with polling disabled (``None``) does the TTL bound how long such writes go
+    unnoticed. Sessions with uncommitted membership changes for a project always read it from
+    the database.
+    """
+
+    def __init__(self, ttl_seconds: float, version_poll_seconds: Optional[float] = None) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.version_poll_seconds = version_poll_seconds
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._local_versions: dict[int, int] = {}
+        self._entries: dict[int, _Entry] = {}
+
+    def get(self, session: Session, project_id: int) -> ProjectMembers:
+        if _has_pending_changes(session, project_id):
+            return build_project_members(session, project_id)
+
+        with self._lock:
+            generation = self._generation
+            local_version = self._local_versions.get(project_id, 0)
+            entry = self._entries.get(project_id)
+        now = time.monotonic()
+        if (
+            entry is not None
+            and entry.generation == generation
+            and entry.local_version == local_version
+            and now - entry.built_at < self.ttl_seconds
+        ):
+            if self.version_poll_seconds is None or now - entry.checked_at < self.version_poll_seconds:
+                return entry.members
+            if read_membership_version(session, project_id) == entry.db_version:
+                self._store(project_id, replace(entry, checked_at=now))
+                return entry.members
+
+        db_version = read_membership_version(session, project_id) if self.version_poll_seconds is not None else None
+        members = build_project_members(session, project_id)
+        now = time.monotonic()
+        self._store(project_id, _Entry(generation, local_version, db_version, now, now, members))
+        return members
+
+    def _store(self, project_id: int, entry: _Entry) -> None:
+        with self._lock:
+            # A rebuild that raced with an invalidation is returned but not cached.
+            if entry.generation == self._generation and entry.local_version == self._local_versions.get(project_id, 0):
+                self._entries[project_id] = entry
+
+    def invalidate(self, project_id: Optional[int] = None) -> None:
+        with self._lock:
+            if project_id is None:
+                self._generation += 1
+                self._entries.clear()
+            else:
+                self._local_versions[project_id] = self._local_versions.get(project_id, 0) + 1
+                self._entries.pop(project_id, None)
+
+
+_settings = get_settings()
+membership_cache = MembershipCache(
+    ttl_seconds=_settings.membership_cache_ttl_seconds,
+    version_poll_seconds=_settings.membership_version_poll_seconds,
+)
+
+_DIRTY_KEY = "membership_cache_dirty"
+
+
+def mark_memberships_changed(session: Session, project_id: int) -> None:
+    """Bump the project's membership version; the local cache entry is dropped on commit."""
+
+    increment_counter(session, MembershipVersion, {"project_id": project_id}, field="version")
+    session.info.setdefault(_DIRTY_KEY, set()).add(project_id)
+
+
+def _has_pending_changes(session: Session, project_id: int) -> bool:
+    if project_id in session.info.get(_DIRTY_KEY, ()):
+        return True
+    return any(
+        isinstance(obj, ProjectMembership) and obj.project_id == project_id
+        for obj in chain(session.new, session.dirty, session.deleted)
+    )
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _mark_membership_cache_dirty(session: OrmSession, flush_context) -> None:
+    touched = {
+        obj.project_id
+        for obj in chain(session.new, session.dirty, session.deleted)
+        if isinstance(obj, ProjectMembership)
+    }
+    if touched:
+        session.info.setdefault(_DIRTY_KEY, set()).update(touched)
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _invalidate_membership_cache(session: OrmSession) -> None:
+    for project_id in session.info.pop(_DIRTY_KEY, ()):
+        membership_cache.invalidate(project_id)
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _discard_membership_cache_flags(session: OrmSession) -> None:
+    session.info.pop(_DIRTY_KEY, None)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from ..enums import Role, SentenceStatus
+from ..models import Assignment, Sentence
+from ..schemas import MyTask, MyTaskPage
+from .pagination import decode_cursor, encode_cursor
+
+
+class MyTaskLister:
+    """The caller's active assignments joined with their sentences.
+
+    Items come from one join driven by ``ix_assignment_user_active_id`` and continue from the
+    last assignment id of the previous page, oldest assignment first. Status counts ignore
+    the status filter and the cursor so the tabs of the task screen stay stable while paging.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def page(
+        self,
+        user_id: int,
+        *,
+        limit: int,
+        cursor: Optional[str] = None,
+        project_id: Optional[int] = None,
+        role: Optional[Role] = None,
+        statuses: Sequence[SentenceStatus] = (),
+    ) -> MyTaskPage:
+        scope: list[Any] = [Assignment.user_id == user_id, Assignment.is_active.is_(True)]
+        if project_id is not None:
+            scope.append(Sentence.project_id == project_id)
+        if role is not None:
+            scope.append(Assignment.role == role)
+
+        conditions = list(scope)
+        if statuses:
+            conditions.append(Sentence.status.in_(list(statuses)))
+        after = decode_cursor(cursor, {"id": int})
+        if after:
+            conditions.append(Assignment.id > after["id"])
+
+        rows = self.session.exec(
+            select(
+                Assignment.id.label("assignment_id"),
+                Assignment.sentence_id,
+                Sentence.project_id,
+                Assignment.role,
+                Assignment.is_blind,
+                Assignment.created_at.label("assigned_at"),
+                Assignment.lease_expires_at,
+                Sentence.text,
+                Sentence.status,
+                Sentence.priority,
+                Sentence.difficulty_tag,
+            )
+            .join(Sentence, Sentence.id == Assignment.sentence_id)
+            .where(*conditions)
+            .order_by(Assignment.id)
+            .limit(limit + 1)
+        ).all()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor({"id": rows[-1][0]})
+
+        counts = self.session.exec(
+            select(Sentence.status, func.count())
+            .select_from(Assignment)
+            .join(Sentence, Sentence.id == Assignment.sentence_id)
+            .where(*scope)
+            .group_by(Sentence.status)
+        ).all()
+
+        return MyTaskPage(
+            limit=limit,
+            next_cursor=next_cursor,
+            status_counts={status.value: count for status, count in counts},
+            items=[MyTask(**row._mapping) for row in rows],
+        )
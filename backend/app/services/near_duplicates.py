@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import struct
+import unicodedata
+from dataclasses import dataclass
+from hashlib import blake2b
+from itertools import chain
+from typing import Mapping, Optional, Sequence
+
+from sqlalchemy import delete, exists, insert
+from sqlmodel import Session, select
+
+from ..config import get_settings
+from ..models import Sentence, SentenceLshBucket, SentenceMinHash
+from .batching import chunked
+
+SHINGLE_SIZE = 3
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+BACKFILL_BATCH_SIZE = 1000
+
+# Each salted 64-byte BLAKE2b digest yields 16 independent 32-bit hash functions.
+_UNPACK = struct.Struct("<16I").unpack
+_SALTS = [index.to_bytes(16, "big") for index in range(NUM_PERM // 16)]
+
+BucketKey = tuple[int, int]
+
+
+def fold_turkish(text: str) -> str:
+    """Lower-case with Turkish dotted/dotless I rules and drop punctuation and symbols."""
+
+    text = unicodedata.normalize("NFC", text).replace("I", "ı").replace("İ", "i").lower()
+    text = "".join(" " if unicodedata.category(char)[0] in "PS" else char for char in text)
+    return " ".join(text.split())
+
+
+def shingles(text: str) -> set[str]:
+    folded = fold_turkish(text)
+    if len(folded) <= SHINGLE_SIZE:
+        return {folded} if folded else set()
+    return {folded[start : start + SHINGLE_SIZE] for start in range(len(folded) - SHINGLE_SIZE + 1)}
+
+
+def _shingle_hashes(shingle: str) -> tuple[int, ...]:
+    data = shingle.encode("utf-8")
+    return tuple(chain.from_iterable(_UNPACK(blake2b(data, digest_size=64, salt=salt).digest()) for salt in _SALTS))
+
+
+def minhash_signature(text: str) -> Optional[list[int]]:
+    """MinHash of the folded character shingles; ``None`` when nothing is left after folding."""
+
+    rows = [_shingle_hashes(shingle) for shingle in shingles(text)]
+    if not rows:
+        return None
+    return [min(column) for column in zip(*rows)]
+
+
+def band_buckets(signature: Sequence[int]) -> list[BucketKey]:
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS_PER_BAND : (band + 1) * ROWS_PER_BAND]
+        digest = blake2b(b"".join(value.to_bytes(4, "big") for value in rows), digest_size=8).digest()
+        # Kept within a signed BIGINT.
+        keys.append((band, int.from_bytes(digest, "big") >> 1))
+    return keys
+
+
+def estimate_similarity(left: Sequence[int], right: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of the shingle sets behind two signatures."""
+
+    if not left or not right:
+        return 0.0
+    return sum(a == b for a, b in zip(left, right)) / NUM_PERM
+
+
+@dataclass(frozen=True)
+class NearDuplicateMatch:
+    sentence_id: int
+    similarity: float
+
+
+class NearDuplicateIndex:
+    """Per-project MinHash/LSH index over ``SentenceMinHash`` and ``SentenceLshBucket``.
+
+    A signature is split into bands; sentences sharing any band bucket are candidates, and
+    candidates are kept when their estimated similarity reaches the threshold. Lookups read
+    a bounded number of buckets instead of scanning the project. Does not commit.
+    """
+
+    def __init__(self, session: Session, *, threshold: Optional[float] = None) -> None:
+        self.session = session
+        self.threshold = get_settings().near_duplicate_threshold if threshold is None else threshold
+
+    def add(self, project_id: int, signatures: Mapping[int, Optional[list[int]]]) -> None:
+        if not signatures:
+            return
+        self.session.execute(
+            insert(SentenceMinHash),
+            [
+                {"sentence_id": sentence_id, "project_id": project_id, "signature": signature or []}
+                for sentence_id, signature in signatures.items()
+            ],
+        )
+        buckets = [
+            {"project_id": project_id, "band": band, "bucket": bucket, "sentence_id": sentence_id}
+            for sentence_id, signature in signatures.items()
+            if signature
+            for band, bucket in band_buckets(signature)
+        ]
+        if buckets:
+            self.session.execute(insert(SentenceLshBucket), buckets)
+
+    def match_many(
+        self, project_id: int, signatures: Sequence[Optional[list[int]]]
+    ) -> list[Optional[NearDuplicateMatch]]:
+        """Best indexed match at or above the threshold for each signature."""
+
+        keys = [band_buckets(signature) if signature else [] for signature in signatures]
+        members = self._bucket_members(project_id, {key for row in keys for key in row})
+        candidates = [set().union(*(members.get(key, ()) for key in row)) for row in keys]
+        stored = self._signatures(set().union(*candidates))
+
+        matches: list[Optional[NearDuplicateMatch]] = []
+        for signature, candidate_ids in zip(signatures, candidates):
+            scored = [
+                NearDuplicateMatch(sentence_id, estimate_similarity(signature, stored.get(sentence_id, [])))
+                for sentence_id in candidate_ids
+            ]
+            best = max(scored, key=lambda match: (match.similarity, -match.sentence_id), default=None)
+            matches.append(best if best and best.similarity >= self.threshold else None)
+        return matches
+
+    def similar(
+        self, project_id: int, signature: Optional[list[int]], *, exclude_id: Optional[int] = None, limit: int = 10
+    ) -> list[NearDuplicateMatch]:
+        if not signature:
+            return []
+        members = self._bucket_members(project_id, set(band_buckets(signature)))
+        candidate_ids = set().union(*members.values()) - {exclude_id}
+        stored = self._signatures(candidate_ids)
+        matches = [
+            NearDuplicateMatch(sentence_id, estimate_similarity(signature, stored.get(sentence_id, [])))
+            for sentence_id in candidate_ids
+        ]
+        matches = [match for match in matches if match.similarity >= self.threshold]
+        matches.sort(key=lambda match: (-match.similarity, match.sentence_id))
+        return matches[:limit]
+
+    def signature_of(self, sentence: Sentence) -> Optional[list[int]]:
+        stored = self.session.get(SentenceMinHash, sentence.id)
+        return stored.signature if stored else minhash_signature(sentence.text)
+
+    def backfill(self, project_id: int, *, batch_size: int = BACKFILL_BATCH_SIZE) -> int:
+        """Index the project's sentences that have no signature yet; returns how many."""
+
+        indexed = 0
+        last_id = 0
+        while True:
+            rows = self.session.exec(
+                select(Sentence.id, Sentence.text)
+                .where(
+                    Sentence.project_id == project_id,
+                    Sentence.id > last_id,
+                    ~exists().where(SentenceMinHash.sentence_id == Sentence.id),
+                )
+                .order_by(Sentence.id)
+                .limit(batch_size)
+            ).all()
+            if not rows:
+                return indexed
+            self.add(project_id, {sentence_id: minhash_signature(text) for sentence_id, text in rows})
+            indexed += len(rows)
+            last_id = rows[-1][0]
+
+    def rebuild(self, project_id: int) -> int:
+        self.session.execute(delete(SentenceLshBucket).where(SentenceLshBucket.project_id == project_id))
+        self.session.execute(delete(SentenceMinHash).where(SentenceMinHash.project_id == project_id))
+        return self.backfill(project_id)
+
+    def _bucket_members(self, project_id: int, keys: set[BucketKey]) -> dict[BucketKey, set[int]]:
+        members: dict[BucketKey, set[int]] = {}
+        # Separate IN lists on band and bucket let SQLite seek on all of
+        # ix_sentence_lsh_bucket_lookup; row-value IN only seeks on project_id. The few
+        # cross pairs this also matches are dropped below.
+        for chunk in chunked(sorted(keys)):
+            rows = self.session.exec(
+                select(SentenceLshBucket.band, SentenceLshBucket.bucket, SentenceLshBucket.sentence_id).where(
+                    SentenceLshBucket.project_id == project_id,
+                    SentenceLshBucket.band.in_({band for band, _ in chunk}),
+                    SentenceLshBucket.bucket.in_({bucket for _, bucket in chunk}),
+                )
+            ).all()
+            for band, bucket, sentence_id in rows:
+                if (band, bucket) in keys:
+                    members.setdefault((band, bucket), set()).add(sentence_id)
+        return members
+
+    def _signatures(self, sentence_ids: set[int]) -> dict[int, list[int]]:
+        signatures: dict[int, list[int]] = {}
+        for chunk in chunked(sorted(sentence_ids)):
+            signatures.update(
+                self.session.exec(
+                    select(SentenceMinHash.sentence_id, SentenceMinHash.signature).where(
+                        SentenceMinHash.sentence_id.in_(chunk)
+                    )
+                ).all()
+            )
+        return signatures
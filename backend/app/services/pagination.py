@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional
+
+from fastapi import HTTPException, status
+
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(values: dict[str, Any]) -> str:
+    """Opaque, URL-safe cursor holding the sort key of the last row of a page."""
+
+    payload = {key: value.isoformat() if isinstance(value, datetime) else value for key, value in values.items()}
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], keys: dict[str, type]) -> Optional[dict[str, Any]]:
+    """Decode ``cursor`` and check it carries exactly ``keys`` with values of the given types."""
+
+    if cursor is None:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        if not isinstance(payload, dict) or set(payload) != set(keys):
+            raise ValueError(cursor)
+        values = {}
+        for key, kind in keys.items():
+            value = payload[key]
+            if kind is datetime:
+                value = datetime.fromisoformat(value)
+            elif not isinstance(value, kind) or isinstance(value, bool):
+                raise ValueError(cursor)
+            values[key] = value
+        return values
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Geçersiz sayfa imleci") from exc
@@ -0,0 +1,369 @@
+"""Import legacy AMR releases (``# ::snt``-annotated PENMAN files) into a project."""
+
+from __future__ import annotations
+
+import argparse
+import re
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Sequence
+
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from ..enums import CorpusImportMode, JobStatus, Role, SentenceStatus
+from ..models import Adjudication, Annotation, CorpusImportCheckpoint, Project, Sentence
+from .audit import log_action
+from .batching import chunked
+from .export_download import file_checksum
+from .near_duplicates import NearDuplicateIndex, minhash_signature
+from .sentence_import import content_hash, normalize_sentence_text
+from .validation import ValidationService
+
+PARSE_BATCH_SIZE = 500
+# Blocks sent to a worker per task; large enough to amortize pickling overhead.
+WORKER_CHUNK_SIZE = 50
+MAX_REPORTED_ERRORS = 100
+
+_METADATA = re.compile(r"::(\S+)[ \t]*((?:(?!\s::\S).)*)")
+
+_SENTENCE_STATUS = {
+    CorpusImportMode.ANNOTATED: SentenceStatus.SUBMITTED,
+    CorpusImportMode.GOLD: SentenceStatus.ACCEPTED,
+}
+
+
+class CorpusImportError(ValueError):
+    """The corpus cannot be imported into the requested project."""
+
+
+@dataclass(frozen=True)
+class PenmanBlock:
+    end_offset: int
+    text: str
+
+
+@dataclass
+class ParsedGraph:
+    is_header: bool = False
+    external_id: Optional[str] = None
+    text: Optional[str] = None
+    content_hash: Optional[str] = None
+    penman: Optional[str] = None
+    validity_report: Optional[str] = None
+    signature: Optional[list[int]] = None
+    error: Optional[str] = None
+
+
+def iter_penman_blocks(stream: BinaryIO, start_offset: int = 0) -> Iterator[PenmanBlock]:
+    """Yield blank-line separated blocks with the byte offset just past each one."""
+
+    stream.seek(start_offset)
+    offset = start_offset
+    lines: list[bytes] = []
+    for raw in stream:
+        offset += len(raw)
+        if raw.strip():
+            lines.append(raw)
+        elif lines:
+            yield PenmanBlock(end_offset=offset, text=b"".join(lines).decode("utf-8"))
+            lines = []
+    if lines:
+        yield PenmanBlock(end_offset=offset, text=b"".join(lines).decode("utf-8"))
+
+
+def parse_metadata(lines: Iterable[str]) -> dict[str, str]:
+    """Collect ``# ::key value`` pairs; a line may carry several (``# ::id x ::date y``)."""
+
+    metadata: dict[str, str] = {}
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            for key, value in _METADATA.findall(stripped):
+                metadata.setdefault(key, value.strip())
+    return metadata
+
+
+_worker_validator: Optional[ValidationService] = None
+
+
+def _init_worker(amr_version: str, role_set_version: str, rule_version: str) -> None:
+    global _worker_validator
+    _worker_validator = ValidationService(
+        amr_version=amr_version, role_set_version=role_set_version, rule_version=rule_version
+    )
+
+
+def parse_penman_block(block: str) -> ParsedGraph:
+    """Parse and validate one graph; runs inside pool workers."""
+
+    lines = block.splitlines()
+    graph_lines = [line for line in lines if line.strip() and not line.lstrip().startswith("#")]
+    metadata = parse_metadata(lines)
+    if not graph_lines:
+        return ParsedGraph(is_header=True)
+    parsed = ParsedGraph(external_id=(metadata.get("id") or None))
+    sentence = normalize_sentence_text(metadata.get("snt", ""))
+    if not sentence:
+        parsed.error = "`# ::snt` satırı eksik"
+        return parsed
+    report = _worker_validator.validate("\n".join(graph_lines))
+    if not report.is_valid:
+        parsed.error = "; ".join(issue.message for issue in report.errors)
+        return parsed
+    parsed.text = sentence
+    parsed.content_hash = content_hash(sentence)
+    parsed.penman = report.canonical_penman
+    parsed.validity_report = report.to_json()
+    parsed.signature = minhash_signature(sentence)
+    return parsed
+
+
+def _parse_chunk(blocks: Sequence[str]) -> list[ParsedGraph]:
+    return [parse_penman_block(block) for block in blocks]
+
+
+class PenmanCorpusImporter:
+    """Stream a multi-graph PENMAN file into Sentence, Annotation and Adjudication rows.
+
+    Graphs are parsed and validated in a process pool (``workers`` > 1) while the previous
+    batch is written. Each batch is inserted in bulk and committed together with the
+    ``CorpusImportCheckpoint``, so rerunning the same file into the same project continues
+    after the last committed graph. Sentences carry the release name in ``source`` and the
+    graph's ``::id`` in ``external_id``; ``gold`` imports are accepted with an adjudication,
+    ``annotated`` imports wait for review. Sentences already in the project are skipped.
+    """
+
+    def __init__(self, session: Session, *, workers: int = 0, batch_size: int = PARSE_BATCH_SIZE) -> None:
+        self.session = session
+        self.workers = workers
+        self.batch_size = batch_size
+
+    def run(
+        self,
+        *,
+        project_id: int,
+        path: Path,
+        mode: CorpusImportMode,
+        actor_id: int,
+        actor_role: Role = Role.ADMIN,
+        source_name: Optional[str] = None,
+    ) -> CorpusImportCheckpoint:
+        project = self.session.get(Project, project_id)
+        if not project:
+            raise CorpusImportError("Proje bulunamadı")
+        checkpoint = self._checkpoint(project_id, path, mode, actor_id, source_name or path.stem)
+        if checkpoint.status == JobStatus.COMPLETED:
+            return checkpoint
+
+        validator_args = (project.amr_version, project.role_set_version, project.validation_rule_version)
+        executor = None
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(self.workers, initializer=_init_worker, initargs=validator_args)
+        else:
+            _init_worker(*validator_args)
+        index = NearDuplicateIndex(self.session)
+        try:
+            with path.open("rb") as stream:
+                blocks = iter_penman_blocks(stream, checkpoint.byte_offset)
+                pending = None
+                while batch := list(islice(blocks, self.batch_size)):
+                    parsing = self._parse(executor, batch)
+                    if pending:
+                        self._write(checkpoint, index, *pending)
+                    pending = (batch, parsing)
+                if pending:
+                    self._write(checkpoint, index, *pending)
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+
+        checkpoint.status = JobStatus.COMPLETED
+        self.session.add(checkpoint)
+        log_action(
+            self.session,
+            actor_id=actor_id,
+            actor_role=actor_role,
+            action="corpus_imported",
+            entity_type="project",
+            entity_id=project_id,
+            project_id=project_id,
+            metadata={
+                "checkpoint_id": checkpoint.id,
+                "source": checkpoint.source_name,
+                "mode": mode,
+                "file_checksum": checkpoint.file_checksum,
+                "graphs_read": checkpoint.graphs_read,
+                "sentences_created": checkpoint.sentences_created,
+                "duplicates": checkpoint.duplicates,
+                "invalid": checkpoint.invalid,
+            },
+        )
+        self.session.commit()
+        self.session.refresh(checkpoint)
+        return checkpoint
+
+    def _checkpoint(
+        self, project_id: int, path: Path, mode: CorpusImportMode, actor_id: int, source_name: str
+    ) -> CorpusImportCheckpoint:
+        checksum = file_checksum(path)
+        checkpoint = self.session.exec(
+            select(CorpusImportCheckpoint).where(
+                CorpusImportCheckpoint.project_id == project_id, CorpusImportCheckpoint.file_checksum == checksum
+            )
+        ).first()
+        if checkpoint:
+            if checkpoint.mode != mode:
+                raise CorpusImportError("Bu dosya projeye farklı bir kipte içe aktarılmış")
+            return checkpoint
+        checkpoint = CorpusImportCheckpoint(
+            project_id=project_id,
+            source_name=source_name[:128],
+            file_checksum=checksum,
+            mode=mode,
+            created_by=actor_id,
+        )
+        self.session.add(checkpoint)
+        self.session.commit()
+        self.session.refresh(checkpoint)
+        return checkpoint
+
+    @staticmethod
+    def _parse(executor: Optional[ProcessPoolExecutor], batch: list[PenmanBlock]) -> list[Any]:
+        texts = [block.text for block in batch]
+        if executor is None:
+            return [_parse_chunk(texts)]
+        return [executor.submit(_parse_chunk, chunk) for chunk in chunked(texts, WORKER_CHUNK_SIZE)]
+
+    def _write(
+        self,
+        checkpoint: CorpusImportCheckpoint,
+        index: NearDuplicateIndex,
+        batch: list[PenmanBlock],
+        parsing: list[Any],
+    ) -> None:
+        parsed = list(
+            chain.from_iterable(part.result() if isinstance(part, Future) else part for part in parsing)
+        )
+        graphs = [graph for graph in parsed if not graph.is_header]
+        valid: dict[str, ParsedGraph] = {}
+        for graph_number, graph in enumerate(graphs, start=checkpoint.graphs_read + 1):
+            if graph.error:
+                checkpoint.invalid += 1
+                if len(checkpoint.errors) < MAX_REPORTED_ERRORS:
+                    checkpoint.errors = [
+                        *checkpoint.errors,
+                        {"graph": graph_number, "id": graph.external_id, "reason": graph.error},
+                    ]
+            elif graph.content_hash in valid:
+                checkpoint.duplicates += 1
+            else:
+                valid[graph.content_hash] = graph
+        for chunk in chunked(list(valid)):
+            for digest in self.session.exec(
+                select(Sentence.content_hash).where(
+                    Sentence.project_id == checkpoint.project_id, Sentence.content_hash.in_(chunk)
+                )
+            ).all():
+                valid.pop(digest, None)
+                checkpoint.duplicates += 1
+
+        if valid:
+            self._insert(checkpoint, index, list(valid.values()))
+        checkpoint.graphs_read += len(graphs)
+        checkpoint.byte_offset = batch[-1].end_offset
+        self.session.add(checkpoint)
+        self.session.commit()
+
+    def _insert(self, checkpoint: CorpusImportCheckpoint, index: NearDuplicateIndex, graphs: list[ParsedGraph]) -> None:
+        now = datetime.utcnow()
+        sentence_ids = {
+            digest: sentence_id
+            for sentence_id, digest in self.session.execute(
+                insert(Sentence).returning(Sentence.id, Sentence.content_hash),
+                [
+                    {
+                        "project_id": checkpoint.project_id,
+                        "text": graph.text,
+                        "source": checkpoint.source_name,
+                        "external_id": graph.external_id[:128] if graph.external_id else None,
+                        "content_hash": graph.content_hash,
+                        "status": _SENTENCE_STATUS[checkpoint.mode],
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for graph in graphs
+                ],
+            ).all()
+        }
+        annotation_ids = dict(
+            self.session.execute(
+                insert(Annotation).returning(Annotation.sentence_id, Annotation.id),
+                [
+                    {
+                        "sentence_id": sentence_ids[graph.content_hash],
+                        "author_id": checkpoint.created_by,
+                        "penman_text": graph.penman,
+                        "validity_report": graph.validity_report,
+                        "created_at": now,
+                    }
+                    for graph in graphs
+                ],
+            ).all()
+        )
+        if checkpoint.mode == CorpusImportMode.GOLD:
+            self.session.execute(
+                insert(Adjudication),
+                [
+                    {
+                        "sentence_id": sentence_ids[graph.content_hash],
+                        "curator_id": checkpoint.created_by,
+                        "final_penman": graph.penman,
+                        "decision_note": f"Derlem içe aktarımı: {checkpoint.source_name}",
+                        "source_annotation_ids": [annotation_ids[sentence_ids[graph.content_hash]]],
+                        "created_at": now,
+                    }
+                    for graph in graphs
+                ],
+            )
+        index.add(
+            checkpoint.project_id, {sentence_ids[graph.content_hash]: graph.signature for graph in graphs}
+        )
+        checkpoint.sentences_created += len(graphs)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    from ..database import init_db, session_scope
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--project-id", type=int, required=True)
+    parser.add_argument("--actor-id", type=int, required=True, help="User recorded as author and curator.")
+    parser.add_argument(
+        "--mode", choices=[mode.value for mode in CorpusImportMode], default=CorpusImportMode.GOLD.value
+    )
+    parser.add_argument("--source", help="Release name stored as the sentences' source (default: file name).")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=PARSE_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    init_db()
+    with session_scope() as session:
+        checkpoint = PenmanCorpusImporter(session, workers=args.workers, batch_size=args.batch_size).run(
+            project_id=args.project_id,
+            path=args.path,
+            mode=CorpusImportMode(args.mode),
+            actor_id=args.actor_id,
+            source_name=args.source,
+        )
+        print(
+            f"{checkpoint.graphs_read} graphs read, {checkpoint.sentences_created} sentences created, "
+            f"{checkpoint.duplicates} duplicates, {checkpoint.invalid} invalid"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Iterator
+
+from sqlmodel import Session, select
+
+from ..enums import PiiStrategy, ReviewDecision, SentenceStatus
+from ..models import Adjudication, Annotation, FailedSubmission, Review, Sentence
+from .export import PiiFilter
+from .failed_submissions import FailedSubmissionStore
+
+FINAL_STATUSES = (SentenceStatus.ADJUDICATED, SentenceStatus.ACCEPTED)
+
+
+@dataclass
+class PreferencePairRequest:
+    project_id: int
+    pii_strategy: PiiStrategy = PiiStrategy.ANONYMIZE
+    include_failed: bool = True
+    include_rejected: bool = True
+    batch_size: int = 500
+
+
+class PreferencePairBuilder:
+    """Stream (prompt, chosen, rejected) pairs for DPO-style training.
+
+    Failed submissions are read in keyset-paginated batches and joined with the final
+    PENMAN of their sentence batch by batch, so memory stays bounded by ``batch_size``
+    regardless of project size.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def iter_pairs(self, request: PreferencePairRequest) -> Iterator[dict]:
+        pii = PiiFilter(request.pii_strategy)
+        store = FailedSubmissionStore(self.session)
+        for failures in self._iter_failure_batches(request):
+            sentence_ids = {failure.sentence_id for failure in failures}
+            sentences = self._final_sentences(sentence_ids)
+            chosen = self._chosen_penman(set(sentences))
+            expanded = store.expand(failures)
+            for failure in failures:
+                sentence = sentences.get(failure.sentence_id)
+                final = chosen.get(failure.sentence_id)
+                rejected = expanded[failure.id].submitted_penman
+                if sentence is None or final is None or not rejected:
+                    continue
+                penman_text, chosen_source = final
+                if rejected.strip() == penman_text.strip():
+                    continue
+                yield {
+                    "prompt": sentence.text,
+                    "chosen": penman_text,
+                    "rejected": rejected,
+                    "meta": {
+                        "failure_id": failure.id,
+                        "sentence_id": sentence.id,
+                        "failure_type": failure.failure_type,
+                        "reason": pii.apply_text(failure.reason),
+                        "chosen_source": chosen_source,
+                        "user_id": pii.apply_user(failure.user_id),
+                        "reviewer_id": pii.apply_user(failure.reviewer_id),
+                        "source": pii.apply_source(sentence.source),
+                        "amr_version": failure.amr_version,
+                        "role_set_version": failure.role_set_version,
+                        "rule_version": failure.rule_version,
+                    },
+                }
+
+    def iter_jsonl(self, request: PreferencePairRequest) -> Iterator[str]:
+        for pair in self.iter_pairs(request):
+            yield json.dumps(pair, ensure_ascii=False) + "\n"
+
+    def _iter_failure_batches(self, request: PreferencePairRequest) -> Iterator[list[FailedSubmission]]:
+        if not (request.include_failed or request.include_rejected):
+            return
+        query = select(FailedSubmission).where(FailedSubmission.project_id == request.project_id)
+        if not request.include_failed:
+            query = query.where(FailedSubmission.failure_type == "review_reject")
+        elif not request.include_rejected:
+            query = query.where(FailedSubmission.failure_type != "review_reject")
+
+        last_id = 0
+        while True:
+            batch = list(
+                self.session.exec(
+                    query.where(FailedSubmission.id > last_id)
+                    .order_by(FailedSubmission.id)
+                    .limit(request.batch_size)
+                )
+            )
+            if not batch:
+                return
+            yield batch
+            last_id = batch[-1].id
+            # Keep the identity map from growing with every batch.
+            self.session.expunge_all()
+
+    def _final_sentences(self, sentence_ids: set[int]) -> dict[int, Sentence]:
+        if not sentence_ids:
+            return {}
+        rows = self.session.exec(
+            select(Sentence).where(Sentence.id.in_(sentence_ids), Sentence.status.in_(FINAL_STATUSES))
+        ).all()
+        return {sentence.id: sentence for sentence in rows}
+
+    def _chosen_penman(self, sentence_ids: set[int]) -> dict[int, tuple[str, str]]:
+        """Latest adjudication per sentence, falling back to the latest approved annotation."""
+
+        if not sentence_ids:
+            return {}
+        chosen: dict[int, tuple[str, str]] = {}
+        adjudications = self.session.exec(
+            select(Adjudication.sentence_id, Adjudication.final_penman)
+            .where(Adjudication.sentence_id.in_(sentence_ids))
+            .order_by(Adjudication.created_at, Adjudication.id)
+        ).all()
+        for sentence_id, final_penman in adjudications:
+            chosen[sentence_id] = (final_penman, "adjudication")
+
+        remaining = sentence_ids - set(chosen)
+        if remaining:
+            approved = self.session.exec(
+                select(Annotation.sentence_id, Annotation.penman_text)
+                .join(Review, Review.annotation_id == Annotation.id)
+                .where(Annotation.sentence_id.in_(remaining), Review.decision == ReviewDecision.APPROVE)
+                .order_by(Review.created_at, Review.id)
+            ).all()
+            for sentence_id, penman_text in approved:
+                chosen[sentence_id] = (penman_text, "approved_annotation")
+        return chosen
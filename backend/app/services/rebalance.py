@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from fastapi import HTTPException
+from sqlalchemy import exists, insert, update
+from sqlmodel import Session, select
+
+from ..enums import AssignmentStrategy, Role, SentenceStatus
+from ..models import Annotation, Assignment, Sentence
+from .assignment_engine import AssignmentEngine
+from .audit import log_action, log_actions_bulk
+from .batching import chunked
+from .leases import REQUEUE_TRANSITIONS, lease_deadline
+from .workflow import WorkflowGuard, transition_many
+from .workload import adjust_assignment_load
+
+# Statuses in which an assignment of the given role still represents pending work.
+_OPEN_WORK = {
+    Role.ANNOTATOR: {SentenceStatus.NEW, SentenceStatus.ASSIGNED},
+    Role.REVIEWER: {SentenceStatus.SUBMITTED, SentenceStatus.IN_REVIEW},
+}
+
+
+@dataclass
+class RebalanceResult:
+    deactivated_assignment_ids: list[int] = field(default_factory=list)
+    reassigned: dict[int, int] = field(default_factory=dict)
+    unassigned_sentence_ids: list[int] = field(default_factory=list)
+    requeued_sentence_ids: list[int] = field(default_factory=list)
+
+
+class MemberRebalancer:
+    """Move a deactivated member's open work to the remaining members in one transaction.
+
+    All active assignments of the member in the project are closed with one bulk update.
+    Those still representing pending work (annotations not yet submitted, reviews not yet
+    recorded) are redistributed through ``AssignmentEngine.plan_bulk`` keeping their role and
+    blind flag. Sentences nobody can take over and that no one else still holds are requeued
+    (ASSIGNED to NEW, IN_REVIEW to SUBMITTED) so auto-assignment and claims can pick them up
+    again. Callers own the commit.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def rebalance(
+        self,
+        *,
+        project_id: int,
+        user_id: int,
+        actor_id: Optional[int],
+        actor_role: Optional[Role],
+        membership_id: Optional[int] = None,
+    ) -> RebalanceResult:
+        result = RebalanceResult()
+        has_annotation = exists().where(Annotation.assignment_id == Assignment.id).label("has_annotation")
+        rows = self.session.exec(
+            select(Assignment, Sentence.status, has_annotation)
+            .join(Sentence, Sentence.id == Assignment.sentence_id)
+            .where(
+                Sentence.project_id == project_id,
+                Assignment.user_id == user_id,
+                Assignment.is_active.is_(True),
+            )
+            .order_by(Assignment.id)
+        ).all()
+        if not rows:
+            return result
+
+        pending: dict[tuple[Role, bool], list[int]] = defaultdict(list)
+        closed: Counter[Role] = Counter()
+        for assignment, sentence_status, submitted in rows:
+            result.deactivated_assignment_ids.append(assignment.id)
+            closed[assignment.role] += 1
+            if not submitted and sentence_status in _OPEN_WORK.get(assignment.role, set()):
+                pending[(assignment.role, assignment.is_blind)].append(assignment.sentence_id)
+
+        now = datetime.utcnow()
+        for chunk in chunked(result.deactivated_assignment_ids):
+            self.session.execute(
+                update(Assignment)
+                .where(Assignment.id.in_(chunk))
+                .values(is_active=False, updated_at=now)
+            )
+        for role, count in closed.items():
+            adjust_assignment_load(self.session, project_id=project_id, role=role, deltas={user_id: -count})
+
+        stranded: dict[Role, list[int]] = defaultdict(list)
+        for (role, is_blind), sentence_ids in pending.items():
+            stranded[role].extend(self._redistribute(project_id, role, is_blind, sentence_ids, result, now))
+        for role, sentence_ids in stranded.items():
+            self._requeue(project_id, role, sentence_ids, result, actor_id, actor_role, now)
+
+        log_action(
+            self.session,
+            actor_id=actor_id,
+            actor_role=actor_role,
+            action="project_member_assignments_rebalanced",
+            entity_type="project_membership",
+            entity_id=membership_id,
+            project_id=project_id,
+            metadata={
+                "target_user_id": user_id,
+                "deactivated_assignment_ids": result.deactivated_assignment_ids,
+                "reassigned": [[sentence_id, assignee] for sentence_id, assignee in result.reassigned.items()],
+                "unassigned_sentence_ids": result.unassigned_sentence_ids,
+                "requeued_sentence_ids": result.requeued_sentence_ids,
+            },
+        )
+        return result
+
+    def _redistribute(
+        self,
+        project_id: int,
+        role: Role,
+        is_blind: bool,
+        sentence_ids: list[int],
+        result: RebalanceResult,
+        now: datetime,
+    ) -> list[int]:
+        """Reassign ``sentence_ids``; returns the ones no eligible member could take."""
+
+        existing: dict[int, set[int]] = defaultdict(set)
+        for chunk in chunked(sentence_ids):
+            for sentence_id, assignee_id in self.session.exec(
+                select(Assignment.sentence_id, Assignment.user_id).where(
+                    Assignment.sentence_id.in_(chunk), Assignment.is_active.is_(True)
+                )
+            ).all():
+                existing[sentence_id].add(assignee_id)
+        try:
+            plan = AssignmentEngine(self.session).plan_bulk(
+                project_id=project_id,
+                strategy=AssignmentStrategy.ROUND_ROBIN,
+                role=role,
+                sentence_ids=sentence_ids,
+                count=1,
+                required_skills=None,
+                existing_assignees=existing,
+            )
+        except HTTPException:
+            # No eligible member left for this role; the sentences wait for a manual assignment.
+            plan = {}
+
+        rows = [
+            {
+                "sentence_id": sentence_id,
+                "user_id": plan[sentence_id][0],
+                "role": role,
+                "is_blind": is_blind,
+                "is_active": True,
+                "lease_expires_at": lease_deadline(now),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for sentence_id in sentence_ids
+            if sentence_id in plan
+        ]
+        if rows:
+            self.session.execute(insert(Assignment), rows)
+            adjust_assignment_load(
+                self.session, project_id=project_id, role=role, deltas=Counter(row["user_id"] for row in rows)
+            )
+        unassigned = [sentence_id for sentence_id in sentence_ids if sentence_id not in plan]
+        result.reassigned.update(
+            (sentence_id, plan[sentence_id][0]) for sentence_id in sentence_ids if sentence_id in plan
+        )
+        result.unassigned_sentence_ids.extend(unassigned)
+        return unassigned
+
+    def _requeue(
+        self,
+        project_id: int,
+        role: Role,
+        sentence_ids: list[int],
+        result: RebalanceResult,
+        actor_id: Optional[int],
+        actor_role: Optional[Role],
+        now: datetime,
+    ) -> None:
+        held, released = REQUEUE_TRANSITIONS[role]
+        sentences: list[Sentence] = []
+        for chunk in chunked(sentence_ids):
+            sentences.extend(
+                self.session.exec(
+                    select(Sentence).where(
+                        Sentence.id.in_(chunk),
+                        Sentence.status == held,
+                        ~exists().where(
+                            Assignment.sentence_id == Sentence.id,
+                            Assignment.role == role,
+                            Assignment.is_active.is_(True),
+                        ),
+                    )
+                )
+            )
+        if not sentences:
+            return
+        WorkflowGuard().ensure_transition(held, released, Role.ASSIGNMENT_ENGINE)
+        transition_many(self.session, sentences, released, now)
+        log_actions_bulk(
+            self.session,
+            actor_id=actor_id,
+            actor_role=actor_role,
+            action="sentence_requeued",
+            entity_type="sentence",
+            project_id=project_id,
+            entries=(
+                {
+                    "entity_id": sentence.id,
+                    "before_status": held,
+                    "after_status": released,
+                    "metadata": {"reason": "member_deactivated", "role": role.value},
+                }
+                for sentence in sentences
+            ),
+        )
+        result.requeued_sentence_ids.extend(sentence.id for sentence in sentences)
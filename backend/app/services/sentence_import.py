@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import json
+import re
+import unicodedata
+from datetime import datetime
+from typing import Any, BinaryIO, Callable, Iterator, Optional, TextIO
+
+from sqlalchemy import insert, update
+from sqlmodel import Session, select
+
+from ..enums import NearDuplicateMode, Role, SentenceImportFormat, SentenceStatus
+from ..models import Project, Sentence
+from ..schemas import SentenceImportNearDuplicate, SentenceImportResult, SentenceImportRowError
+from .audit import log_action
+from .batching import chunked
+from .near_duplicates import BucketKey, NearDuplicateIndex, band_buckets, estimate_similarity, minhash_signature
+
+IMPORT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 100
+_READ_CHUNK = 64 * 1024
+_WHITESPACE = re.compile(r"\s+")
+
+
+class SentenceImportError(ValueError):
+    """The uploaded file cannot be parsed as a whole."""
+
+
+def normalize_sentence_text(text: str) -> str:
+    """NFC-normalize and collapse whitespace so equal sentences hash equally."""
+
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(normalize_sentence_text(text).encode("utf-8")).hexdigest()
+
+
+def backfill_content_hashes(session: Session, project_id: int, *, batch_size: int = IMPORT_BATCH_SIZE) -> int:
+    """Hash sentences stored before ``content_hash`` existed; returns the number updated."""
+
+    updated = 0
+    last_id = 0
+    while True:
+        rows = session.exec(
+            select(Sentence.id, Sentence.text, Sentence.updated_at, Sentence.version)
+            .where(Sentence.project_id == project_id, Sentence.content_hash.is_(None), Sentence.id > last_id)
+            .order_by(Sentence.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return updated
+        session.execute(
+            update(Sentence),
+            [
+                {"id": sentence_id, "content_hash": content_hash(text), "updated_at": updated_at, "version": version}
+                for sentence_id, text, updated_at, version in rows
+            ],
+        )
+        updated += len(rows)
+        last_id = rows[-1][0]
+
+
+def _iter_txt(reader: TextIO) -> Iterator[tuple[int, Any]]:
+    for line, raw in enumerate(reader, start=1):
+        if raw.strip():
+            yield line, raw
+
+
+def _iter_csv(reader: TextIO) -> Iterator[tuple[int, Any]]:
+    rows = csv.DictReader(reader)
+    if not rows.fieldnames or "text" not in rows.fieldnames:
+        raise SentenceImportError("CSV başlığında 'text' sütunu bulunamadı")
+    for row in rows:
+        yield rows.line_num, row
+
+
+def _iter_json(reader: TextIO) -> Iterator[tuple[int, Any]]:
+    """Yield the items of a top-level JSON array, or of JSON Lines, without loading the file."""
+
+    decoder = json.JSONDecoder()
+    buffer, pos, line = "", 0, 1
+    eof = in_array = closed = started = False
+    while True:
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            line += buffer[pos] == "\n"
+            pos += 1
+        if pos == len(buffer):
+            if eof:
+                break
+            buffer, pos = reader.read(_READ_CHUNK), 0
+            eof = not buffer
+            continue
+        if closed:
+            raise SentenceImportError(f"JSON dizisinden sonra beklenmeyen içerik (satır {line})")
+        if buffer[pos] == "[" and not started:
+            in_array = started = True
+            pos += 1
+            continue
+        if buffer[pos] == "]" and in_array:
+            closed = True
+            pos += 1
+            continue
+        started = True
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as exc:
+            if eof:
+                raise SentenceImportError(f"Geçersiz JSON (satır {line})") from exc
+            end = None
+        if end is None or (end == len(buffer) and not eof):
+            # The value may continue in the next chunk; retry with more input.
+            more = reader.read(_READ_CHUNK)
+            buffer, pos = buffer[pos:] + more, 0
+            eof = not more
+            continue
+        yield line, value
+        line += buffer.count("\n", pos, end)
+        pos = end
+    if in_array and not closed:
+        raise SentenceImportError("JSON dizisi kapatılmamış")
+
+
+_READERS: dict[SentenceImportFormat, Callable[[TextIO], Iterator[tuple[int, Any]]]] = {
+    SentenceImportFormat.CSV: _iter_csv,
+    SentenceImportFormat.JSON: _iter_json,
+    SentenceImportFormat.TXT: _iter_txt,
+}
+
+
+def _optional_text(value: Any, field: str, max_length: int) -> Optional[str]:
+    if value is None:
+        return None
+    value = str(value).strip()
+    if len(value) > max_length:
+        raise ValueError(f"'{field}' en fazla {max_length} karakter olabilir")
+    return value or None
+
+
+def _coerce_row(raw: Any, default_source: Optional[str]) -> dict[str, Any]:
+    if isinstance(raw, str):
+        raw = {"text": raw}
+    if not isinstance(raw, dict):
+        raise ValueError("Satır bir metin veya nesne olmalı")
+    text = raw.get("text")
+    if not isinstance(text, str) or not normalize_sentence_text(text):
+        raise ValueError("Cümle metni boş")
+    priority = raw.get("priority")
+    try:
+        priority = int(priority) if priority not in (None, "") else 0
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Geçersiz öncelik") from exc
+    return {
+        "text": normalize_sentence_text(text),
+        "source": _optional_text(raw.get("source"), "source", 128) or default_source,
+        "difficulty_tag": _optional_text(raw.get("difficulty_tag"), "difficulty_tag", 64),
+        "priority": priority,
+    }
+
+
+class SentenceImporter:
+    """Import a corpus file into a project in batched inserts.
+
+    Rows are read incrementally, normalized and deduplicated by ``content_hash`` against both
+    the file itself and the project's existing sentences. Near-duplicates found through the
+    MinHash/LSH index are flagged or skipped according to ``near_duplicates``, and every new
+    sentence is added to the index. Each batch takes the project row lock, which serializes
+    concurrent imports into the project, and is committed on its own, so a large file holds
+    neither one long transaction nor the lock between batches. If the file turns out to be
+    broken part-way, the batches before it stay committed; uploading the fixed file again
+    counts them as ``duplicates_existing`` and continues with the rest. One summary audit
+    entry is committed at the end, also for a failed run.
+    """
+
+    def __init__(self, session: Session, *, batch_size: int = IMPORT_BATCH_SIZE) -> None:
+        self.session = session
+        self.batch_size = batch_size
+
+    def run(
+        self,
+        *,
+        project_id: int,
+        stream: BinaryIO,
+        import_format: SentenceImportFormat,
+        actor_id: Optional[int],
+        actor_role: Optional[Role],
+        source: Optional[str] = None,
+        near_duplicates: NearDuplicateMode = NearDuplicateMode.FLAG,
+    ) -> SentenceImportResult:
+        self._lock_project(project_id)
+        backfill_content_hashes(self.session, project_id)
+        index = NearDuplicateIndex(self.session)
+        index.backfill(project_id)
+        self.session.commit()
+
+        result = SentenceImportResult(
+            project_id=project_id,
+            format=import_format,
+            total_rows=0,
+            created=0,
+            duplicates_in_file=0,
+            duplicates_existing=0,
+            invalid=0,
+            errors=[],
+            near_duplicate_mode=near_duplicates,
+            near_duplicates=0,
+            near_duplicate_matches=[],
+        )
+        seen: set[str] = set()
+        batch: list[tuple[int, dict[str, Any]]] = []
+        reader = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        failure: Optional[SentenceImportError] = None
+        try:
+            for line, raw in _READERS[import_format](reader):
+                result.total_rows += 1
+                try:
+                    row = _coerce_row(raw, source)
+                except ValueError as exc:
+                    result.invalid += 1
+                    if len(result.errors) < MAX_REPORTED_ERRORS:
+                        result.errors.append(SentenceImportRowError(line=line, reason=str(exc)))
+                    continue
+                row["content_hash"] = content_hash(row["text"])
+                if row["content_hash"] in seen:
+                    result.duplicates_in_file += 1
+                    continue
+                seen.add(row["content_hash"])
+                batch.append((line, row))
+                if len(batch) >= self.batch_size:
+                    self._write(project_id, batch, result, index)
+                    batch = []
+            self._write(project_id, batch, result, index)
+        except SentenceImportError as exc:
+            failure = exc
+        except UnicodeDecodeError as exc:
+            failure = SentenceImportError("Dosya UTF-8 olarak çözülemedi")
+            failure.__cause__ = exc
+        except csv.Error as exc:
+            failure = SentenceImportError(f"Geçersiz CSV: {exc}")
+            failure.__cause__ = exc
+        finally:
+            reader.detach()
+
+        if failure is not None:
+            self.session.rollback()
+        log_action(
+            self.session,
+            actor_id=actor_id,
+            actor_role=actor_role,
+            action="sentences_imported",
+            entity_type="project",
+            entity_id=project_id,
+            project_id=project_id,
+            metadata={
+                "format": import_format,
+                "source": source,
+                "total_rows": result.total_rows,
+                "created": result.created,
+                "duplicates_in_file": result.duplicates_in_file,
+                "duplicates_existing": result.duplicates_existing,
+                "invalid": result.invalid,
+                "near_duplicate_mode": near_duplicates,
+                "near_duplicates": result.near_duplicates,
+                "error": str(failure) if failure is not None else None,
+            },
+        )
+        self.session.commit()
+        if failure is not None:
+            if result.created:
+                raise SentenceImportError(f"{failure} ({result.created} cümle kaydedildi)") from failure
+            raise failure
+        return result
+
+    def _lock_project(self, project_id: int) -> None:
+        self.session.exec(select(Project.id).where(Project.id == project_id).with_for_update()).one()
+
+    def _write(
+        self,
+        project_id: int,
+        batch: list[tuple[int, dict[str, Any]]],
+        result: SentenceImportResult,
+        index: NearDuplicateIndex,
+    ) -> None:
+        if not batch:
+            return
+        self._lock_project(project_id)
+        existing: set[str] = set()
+        for chunk in chunked([row["content_hash"] for _, row in batch]):
+            existing.update(
+                self.session.exec(
+                    select(Sentence.content_hash).where(
+                        Sentence.project_id == project_id, Sentence.content_hash.in_(chunk)
+                    )
+                ).all()
+            )
+        fresh = [(line, row) for line, row in batch if row["content_hash"] not in existing]
+        result.duplicates_existing += len(batch) - len(fresh)
+        signatures = [minhash_signature(row["text"]) for _, row in fresh]
+        kept = self._screen_near_duplicates(project_id, fresh, signatures, result, index)
+        if not kept:
+            self.session.commit()
+            return
+
+        now = datetime.utcnow()
+        inserted = self.session.execute(
+            insert(Sentence).returning(Sentence.id, Sentence.content_hash),
+            [
+                {
+                    **fresh[position][1],
+                    "project_id": project_id,
+                    "status": SentenceStatus.NEW,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for position in kept
+            ],
+        ).all()
+        signature_by_hash = {fresh[position][1]["content_hash"]: signatures[position] for position in kept}
+        index.add(project_id, {sentence_id: signature_by_hash[digest] for sentence_id, digest in inserted})
+        self.session.commit()
+        result.created += len(inserted)
+
+    def _screen_near_duplicates(
+        self,
+        project_id: int,
+        fresh: list[tuple[int, dict[str, Any]]],
+        signatures: list[Optional[list[int]]],
+        result: SentenceImportResult,
+        index: NearDuplicateIndex,
+    ) -> list[int]:
+        """Positions in ``fresh`` to insert; near-duplicates are reported and, in skip mode, dropped."""
+
+        if result.near_duplicate_mode is NearDuplicateMode.IGNORE:
+            return list(range(len(fresh)))
+        matches = index.match_many(project_id, signatures)
+        # Rows of this batch are not indexed yet, so they are matched against each other here.
+        batch_buckets: dict[BucketKey, list[int]] = {}
+        kept: list[int] = []
+        for position, ((line, _), signature, match) in enumerate(zip(fresh, signatures, matches)):
+            report = None
+            if match:
+                report = SentenceImportNearDuplicate(
+                    line=line, similarity=match.similarity, sentence_id=match.sentence_id
+                )
+            elif signature:
+                candidates = {other for key in band_buckets(signature) for other in batch_buckets.get(key, ())}
+                scored = sorted((-estimate_similarity(signature, signatures[other]), other) for other in candidates)
+                if scored and -scored[0][0] >= index.threshold:
+                    report = SentenceImportNearDuplicate(
+                        line=line, similarity=-scored[0][0], duplicate_of_line=fresh[scored[0][1]][0]
+                    )
+            if report:
+                result.near_duplicates += 1
+                if len(result.near_duplicate_matches) < MAX_REPORTED_ERRORS:
+                    result.near_duplicate_matches.append(report)
+                if result.near_duplicate_mode is NearDuplicateMode.SKIP:
+                    continue
+            kept.append(position)
+            for key in band_buckets(signature) if signature else ():
+                batch_buckets.setdefault(key, []).append(position)
+        return kept
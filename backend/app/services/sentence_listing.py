@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, exists, or_
+from sqlmodel import Session, select
+
+from ..enums import SentenceOrder, SentenceStatus
+from ..models import Assignment, Sentence
+from ..schemas import SentencePage
+from .pagination import decode_cursor, encode_cursor
+from .sentence_search import search_condition
+
+SENTENCE_FIELDS = tuple(Sentence.__table__.columns.keys())
+
+
+def parse_fields(fields: Optional[str]) -> tuple[str, ...]:
+    """Resolve a comma separated ``fields`` parameter; ``id`` is always included."""
+
+    if not fields:
+        return SENTENCE_FIELDS
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = sorted(set(requested) - set(SENTENCE_FIELDS))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Bilinmeyen alan(lar): {', '.join(unknown)}"
+        )
+    return tuple(name for name in SENTENCE_FIELDS if name == "id" or name in requested)
+
+
+@dataclass
+class SentenceFilters:
+    statuses: Sequence[SentenceStatus] = field(default_factory=tuple)
+    difficulty_tag: Optional[str] = None
+    source: Optional[str] = None
+    assignee_id: Optional[int] = None
+    search: Optional[str] = None
+
+    def conditions(self, session: Session) -> list[Any]:
+        conditions: list[Any] = []
+        if self.search is not None:
+            conditions.append(search_condition(session, self.search))
+        if self.statuses:
+            conditions.append(Sentence.status.in_(list(self.statuses)))
+        if self.difficulty_tag is not None:
+            conditions.append(Sentence.difficulty_tag == self.difficulty_tag)
+        if self.source is not None:
+            conditions.append(Sentence.source == self.source)
+        if self.assignee_id is not None:
+            conditions.append(
+                exists().where(
+                    Assignment.sentence_id == Sentence.id,
+                    Assignment.user_id == self.assignee_id,
+                    Assignment.is_active.is_(True),
+                )
+            )
+        return conditions
+
+
+def _beyond(column: Any, value: Any, descending: bool) -> Any:
+    return column < value if descending else column > value
+
+
+class SentenceLister:
+    """Keyset pagination over a project's sentences.
+
+    Pages continue from the sort key of the previous page's last row, so each request reads
+    at most ``limit + 1`` rows through the ``(project_id, ...)`` indexes regardless of how far
+    into the project it is. No total is computed for the same reason.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def page(
+        self,
+        project_id: int,
+        *,
+        limit: int,
+        cursor: Optional[str] = None,
+        order_by: SentenceOrder = SentenceOrder.ID,
+        descending: bool = False,
+        filters: Optional[SentenceFilters] = None,
+        fields: Sequence[str] = SENTENCE_FIELDS,
+    ) -> SentencePage:
+        conditions = [Sentence.project_id == project_id, *(filters or SentenceFilters()).conditions(self.session)]
+        columns = [getattr(Sentence, name) for name in fields]
+        if order_by is SentenceOrder.UPDATED_AT:
+            sort_columns = [Sentence.updated_at, Sentence.id]
+            after = decode_cursor(cursor, {"updated_at": datetime, "id": int})
+            if after:
+                conditions.append(
+                    or_(
+                        _beyond(Sentence.updated_at, after["updated_at"], descending),
+                        and_(Sentence.updated_at == after["updated_at"], _beyond(Sentence.id, after["id"], descending)),
+                    )
+                )
+        else:
+            sort_columns = [Sentence.id]
+            after = decode_cursor(cursor, {"id": int})
+            if after:
+                conditions.append(_beyond(Sentence.id, after["id"], descending))
+
+        extra = [column for column in sort_columns if column.key not in fields]
+        # ``execute`` keeps single-column selections as rows rather than scalars.
+        rows = self.session.execute(
+            select(*columns, *extra)
+            .where(*conditions)
+            .order_by(*(column.desc() if descending else column.asc() for column in sort_columns))
+            .limit(limit + 1)
+        ).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = dict(zip([*fields, *(column.key for column in extra)], rows[-1]))
+            next_cursor = encode_cursor({column.key: last[column.key] for column in sort_columns})
+        return SentencePage(
+            limit=limit,
+            order_by=order_by,
+            next_cursor=next_cursor,
+            items=[dict(zip(fields, row)) for row in rows],
+        )
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import unicodedata
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import text
+from sqlmodel import Session
+
+from ..migrations import POSTGRES_SEARCH_VECTOR
+from ..models import Sentence
+from .near_duplicates import fold_turkish
+
+
+def fold_search_text(value: str) -> str:
+    """Turkish-aware case folding plus removal of diacritics, matching what the index stores."""
+
+    decomposed = unicodedata.normalize("NFKD", fold_turkish(value).replace("ı", "i"))
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def search_condition(session: Session, query: str) -> Any:
+    """WHERE clause restricting ``Sentence`` rows to those containing the phrase ``query``."""
+
+    folded = fold_search_text(query)
+    if not folded:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Arama ifadesi boş olamaz")
+    dialect = session.get_bind().dialect.name
+    if dialect == "sqlite":
+        phrase = '"' + folded.replace('"', '""') + '"'
+        return text(
+            "sentence.id IN (SELECT rowid FROM sentence_fts WHERE sentence_fts MATCH :search_phrase)"
+        ).bindparams(search_phrase=phrase)
+    if dialect == "postgresql":
+        return text(f"{POSTGRES_SEARCH_VECTOR} @@ phraseto_tsquery('simple', :search_phrase)").bindparams(
+            search_phrase=folded
+        )
+    return Sentence.text.ilike(f"%{query}%")
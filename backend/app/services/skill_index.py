@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from itertools import chain
+from typing import Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+
+from ..config import get_settings
+from ..models import ProjectMembership, UserProfile
+
+
+@dataclass(frozen=True)
+class SkillIndex:
+    """Lower-cased skill -> user ids of a project's members with an active profile."""
+
+    users_by_skill: dict[str, frozenset[int]]
+    profiled_user_ids: frozenset[int]
+
+    def overlaps(self, required_skills: Iterable[str], user_ids: set[int]) -> Counter:
+        """Count, per user in ``user_ids``, how many of ``required_skills`` they hold."""
+
+        overlaps: Counter[int] = Counter()
+        for skill in {skill.lower() for skill in required_skills}:
+            holders = self.users_by_skill.get(skill)
+            if holders:
+                overlaps.update(holders & user_ids)
+        return overlaps
+
+
+def build_skill_index(session: Session, project_id: int) -> SkillIndex:
+    member_ids = select(ProjectMembership.user_id).where(ProjectMembership.project_id == project_id)
+    rows = session.exec(
+        select(UserProfile.user_id, UserProfile.skills).where(
+            UserProfile.user_id.in_(member_ids),
+            UserProfile.is_active.is_(True),
+        )
+    ).all()
+    users_by_skill: dict[str, set[int]] = {}
+    for user_id, skills in rows:
+        for skill in {skill.lower() for skill in skills or []}:
+            users_by_skill.setdefault(skill, set()).add(user_id)
+    return SkillIndex(
+        users_by_skill={skill: frozenset(user_ids) for skill, user_ids in users_by_skill.items()},
+        profiled_user_ids=frozenset(user_id for user_id, _ in rows),
+    )
+
+
+class SkillIndexCache:
+    """Per-project skill indexes shared by all sessions of the process.
+
+    Commits that touch ``UserProfile`` or ``ProjectMembership`` rows bump a generation and
+    drop every entry; the TTL bounds staleness for changes made by other processes or by
+    bulk statements that bypass the ORM.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._entries: dict[int, tuple[int, float, SkillIndex]] = {}
+
+    def get(self, session: Session, project_id: int) -> SkillIndex:
+        with self._lock:
+            generation = self._generation
+            entry = self._entries.get(project_id)
+        if entry is not None:
+            entry_generation, built_at, index = entry
+            if entry_generation == generation and time.monotonic() - built_at < self.ttl_seconds:
+                return index
+        index = build_skill_index(session, project_id)
+        with self._lock:
+            # A rebuild that raced with an invalidation is returned but not cached.
+            if generation == self._generation:
+                self._entries[project_id] = (generation, time.monotonic(), index)
+        return index
+
+    def invalidate(self, project_id: Optional[int] = None) -> None:
+        with self._lock:
+            self._generation += 1
+            if project_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(project_id, None)
+
+
+skill_index_cache = SkillIndexCache(ttl_seconds=get_settings().skill_index_ttl_seconds)
+
+_DIRTY_FLAG = "skill_index_dirty"
+
+
+@event.listens_for(OrmSession, "after_flush")
+def _mark_skill_index_dirty(session: OrmSession, flush_context) -> None:
+    if any(
+        isinstance(obj, (UserProfile, ProjectMembership))
+        for obj in chain(session.new, session.dirty, session.deleted)
+    ):
+        session.info[_DIRTY_FLAG] = True
+
+
+@event.listens_for(OrmSession, "after_commit")
+def _invalidate_skill_index(session: OrmSession) -> None:
+    if session.info.pop(_DIRTY_FLAG, False):
+        skill_index_cache.invalidate()
+
+
+@event.listens_for(OrmSession, "after_rollback")
+def _discard_skill_index_flag(session: OrmSession) -> None:
+    session.info.pop(_DIRTY_FLAG, None)
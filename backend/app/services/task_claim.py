@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, exists, func, or_, update
+from sqlmodel import Session, select
+
+from ..enums import Role, SentenceStatus
+from ..models import Annotation, Assignment, Project, Sentence, UserProfile
+from ..schemas import TaskClaim
+from .audit import log_action
+from .leases import lease_deadline
+from .workflow import WorkflowGuard
+from .workload import adjust_assignment_load
+
+CLAIMABLE_ROLES = {Role.ANNOTATOR, Role.REVIEWER}
+# Candidates fetched per round; claimers that lose a race move on to the next row.
+CANDIDATE_BATCH = 20
+
+
+class TaskClaimer:
+    """Let annotators and reviewers pull their next sentence.
+
+    Candidates are read with ``FOR UPDATE SKIP LOCKED`` where the database supports it so
+    concurrent claimers spread over different rows, and every claim is confirmed by a
+    conditional UPDATE that re-checks status and quota. A claim therefore never exceeds the
+    project's ``annotators_per_sentence`` and a submitted sentence goes to one reviewer only.
+    Quota and blindness come from the project, never from the claimer.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def claim(self, *, project: Project, user_id: int, role: Role) -> TaskClaim:
+        if role not in CLAIMABLE_ROLES:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Yalnızca anotatör ve gözden geçiren kullanıcılar görev alabilir.",
+            )
+        project_id = project.id
+        per_sentence = max(project.annotators_per_sentence, 1)
+        is_blind = project.blind_annotation
+        skills = self._user_skills(user_id)
+        seen: set[int] = set()
+        while True:
+            candidates = self._candidates(
+                project_id=project_id,
+                user_id=user_id,
+                role=role,
+                per_sentence=per_sentence,
+                is_blind=is_blind,
+                skills=skills,
+                exclude_ids=seen,
+            )
+            if not candidates:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Alınabilecek görev bulunamadı.")
+            for sentence_id, before_status in candidates:
+                seen.add(sentence_id)
+                target_status = SentenceStatus.ASSIGNED if role == Role.ANNOTATOR else SentenceStatus.IN_REVIEW
+                # Annotator claims are engine-mediated assignments; reviewer claims start the review.
+                WorkflowGuard().ensure_transition(
+                    before_status, target_status, Role.ASSIGNMENT_ENGINE if role == Role.ANNOTATOR else role
+                )
+                if self._take(sentence_id, user_id=user_id, role=role, per_sentence=per_sentence, target=target_status):
+                    return self._record(
+                        project_id=project_id,
+                        sentence_id=sentence_id,
+                        user_id=user_id,
+                        role=role,
+                        is_blind=is_blind,
+                        before_status=before_status,
+                        target_status=target_status,
+                    )
+
+    def _user_skills(self, user_id: int) -> set[str]:
+        """Lower-cased skills of the user's active profile; empty without one."""
+
+        profile = self.session.exec(
+            select(UserProfile).where(UserProfile.user_id == user_id, UserProfile.is_active.is_(True))
+        ).first()
+        if profile is None:
+            return set()
+        return {skill.lower() for skill in profile.skills or []}
+
+    def _active_annotators(self):
+        return (
+            select(func.count(Assignment.id))
+            .where(
+                Assignment.sentence_id == Sentence.id,
+                Assignment.role == Role.ANNOTATOR,
+                Assignment.is_active.is_(True),
+            )
+            .scalar_subquery()
+        )
+
+    def _eligibility(self, *, user_id: int, role: Role, per_sentence: int) -> list:
+        own_assignment = exists().where(
+            Assignment.sentence_id == Sentence.id,
+            Assignment.user_id == user_id,
+            Assignment.is_active.is_(True),
+        )
+        if role == Role.ANNOTATOR:
+            return [
+                Sentence.status.in_([SentenceStatus.NEW, SentenceStatus.ASSIGNED]),
+                self._active_annotators() < per_sentence,
+                ~own_assignment,
+            ]
+        own_annotation = exists().where(Annotation.sentence_id == Sentence.id, Annotation.author_id == user_id)
+        return [Sentence.status == SentenceStatus.SUBMITTED, ~own_assignment, ~own_annotation]
+
+    def _candidates(
+        self,
+        *,
+        project_id: int,
+        user_id: int,
+        role: Role,
+        per_sentence: int,
+        is_blind: bool,
+        skills: set[str],
+        exclude_ids: set[int],
+    ) -> list[tuple[int, SentenceStatus]]:
+        conditions = [
+            Sentence.project_id == project_id,
+            *self._eligibility(user_id=user_id, role=role, per_sentence=per_sentence),
+        ]
+        if role == Role.ANNOTATOR:
+            # Blind and open annotators are never mixed on the same sentence.
+            conditions.append(
+                ~exists().where(
+                    Assignment.sentence_id == Sentence.id,
+                    Assignment.is_active.is_(True),
+                    Assignment.is_blind.is_not(is_blind),
+                )
+            )
+        # Tagged sentences only go to users whose profile lists the tag as a skill.
+        tag_filter = Sentence.difficulty_tag.is_(None)
+        if skills:
+            tag_filter = or_(tag_filter, func.lower(Sentence.difficulty_tag).in_(skills))
+        conditions.append(tag_filter)
+        if exclude_ids:
+            conditions.append(Sentence.id.not_in(exclude_ids))
+        rows = self.session.exec(
+            select(Sentence.id, Sentence.status)
+            .where(*conditions)
+            .order_by(Sentence.id)
+            .limit(CANDIDATE_BATCH)
+            .with_for_update(skip_locked=True, of=Sentence)
+        ).all()
+        return [(sentence_id, sentence_status) for sentence_id, sentence_status in rows]
+
+    def _take(self, sentence_id: int, *, user_id: int, role: Role, per_sentence: int, target: SentenceStatus) -> bool:
+        result = self.session.execute(
+            update(Sentence)
+            .where(
+                and_(
+                    Sentence.id == sentence_id,
+                    *self._eligibility(user_id=user_id, role=role, per_sentence=per_sentence),
+                )
+            )
+            .values(status=target, updated_at=datetime.utcnow(), version=Sentence.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    def _record(
+        self,
+        *,
+        project_id: int,
+        sentence_id: int,
+        user_id: int,
+        role: Role,
+        is_blind: bool,
+        before_status: SentenceStatus,
+        target_status: SentenceStatus,
+    ) -> TaskClaim:
+        assignment = Assignment(
+            sentence_id=sentence_id,
+            user_id=user_id,
+            role=role,
+            is_blind=is_blind,
+            lease_expires_at=lease_deadline(),
+        )
+        self.session.add(assignment)
+        adjust_assignment_load(self.session, project_id=project_id, role=role, deltas={user_id: 1})
+        self.session.flush()
+        log_action(
+            self.session,
+            actor_id=user_id,
+            actor_role=role,
+            action="sentence_claimed",
+            entity_type="sentence",
+            entity_id=sentence_id,
+            before_status=before_status,
+            after_status=target_status,
+            project_id=project_id,
+            metadata={"assignment_id": assignment.id, "role": role.value, "is_blind": is_blind},
+        )
+        sentence = self.session.get(Sentence, sentence_id)
+        self.session.refresh(sentence)
+        return TaskClaim(sentence=sentence, assignment=assignment)
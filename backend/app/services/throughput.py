@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from itertools import takewhile
+from typing import Iterable, Optional
+
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from ..config import Settings, get_settings
+from ..database import session_scope
+from ..enums import ReviewDecision
+from ..models import Annotation, AnnotatorThroughput, AuditLog, Project, ThroughputCursor
+from .batching import chunked
+
+logger = logging.getLogger(__name__)
+
+ASSIGN_ACTIONS = ("sentence_assigned", "sentence_auto_assigned", "sentence_claimed")
+SUBMIT_ACTION = "annotation_submitted"
+REVIEW_ACTION = "review_recorded"
+
+# Pseudo-observations blending a user's history with the project mean, so newcomers and
+# users with a couple of lucky tasks are not ranked on noise.
+PRIOR_WEIGHT = 3
+DEFAULT_LATENCY_SECONDS = 3600.0
+
+
+def _assignees(entry: AuditLog) -> list[int]:
+    if entry.action == "sentence_claimed":
+        return [entry.actor_id] if entry.actor_id is not None else []
+    return list((entry.meta or {}).get("assignee_ids") or [])
+
+
+class ThroughputTracker:
+    """Fold audit log entries into per-annotator latency and acceptance totals.
+
+    Only entries after the project's ``ThroughputCursor`` are read, so each refresh costs
+    O(new audit rows). Entries younger than ``lag_seconds`` are left for a later refresh: audit
+    ids are handed out before commit, so a slow transaction can still commit an id below ones
+    already visible, and the cursor must not pass it. Latency runs from the latest assignment
+    of the author on the sentence to the submission; acceptance counts approvals among reviews
+    of the author's annotations. ``refresh`` writes and runs in the background refresher;
+    ``rates`` only reads.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def refresh(self, project_id: int, *, batch_size: int = 1000, lag_seconds: Optional[int] = None) -> int:
+        """Fold new audit entries and return how many were read.
+
+        Each batch advances the cursor with a compare-and-set inside a savepoint, so
+        concurrent refreshes never count the same entries twice; the loser stops early.
+        """
+
+        if lag_seconds is None:
+            lag_seconds = get_settings().throughput_refresh_lag_seconds
+        cutoff = datetime.utcnow() - timedelta(seconds=lag_seconds)
+        last_id = self.session.exec(
+            select(ThroughputCursor.last_audit_id).where(ThroughputCursor.project_id == project_id)
+        ).first() or 0
+        processed = 0
+        while True:
+            entries = self.session.exec(
+                select(AuditLog)
+                .where(
+                    AuditLog.project_id == project_id,
+                    AuditLog.id > last_id,
+                    AuditLog.action.in_([SUBMIT_ACTION, REVIEW_ACTION]),
+                )
+                .order_by(AuditLog.id)
+                .limit(batch_size)
+            ).all()
+            settled = list(takewhile(lambda entry: entry.created_at <= cutoff, entries))
+            if not settled:
+                break
+            try:
+                with self.session.begin_nested():
+                    if not self._advance(project_id, last_id, settled[-1].id):
+                        break
+                    self._fold(project_id, settled)
+            except IntegrityError:
+                break
+            last_id = settled[-1].id
+            processed += len(settled)
+            if len(settled) < len(entries):
+                break
+        return processed
+
+    def _advance(self, project_id: int, expected: int, new: int) -> bool:
+        result = self.session.execute(
+            update(ThroughputCursor)
+            .where(ThroughputCursor.project_id == project_id, ThroughputCursor.last_audit_id == expected)
+            .values(last_audit_id=new)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            return True
+        if expected:
+            return False
+        self.session.add(ThroughputCursor(project_id=project_id, last_audit_id=new))
+        self.session.flush()
+        return True
+
+    def rates(self, project_id: int, user_ids: Iterable[int]) -> dict[int, float]:
+        """Expected accepted annotations per hour for each user."""
+
+        user_ids = set(user_ids)
+        rows = {
+            row.user_id: row
+            for row in self.session.exec(
+                select(AnnotatorThroughput).where(AnnotatorThroughput.project_id == project_id)
+            )
+        }
+        submitted = sum(row.submitted_count for row in rows.values())
+        prior_latency = DEFAULT_LATENCY_SECONDS
+        if submitted:
+            prior_latency = sum(row.total_latency_seconds for row in rows.values()) / submitted
+        rates: dict[int, float] = {}
+        for user_id in user_ids:
+            row = rows.get(user_id) or AnnotatorThroughput(project_id=project_id, user_id=user_id)
+            latency = (row.total_latency_seconds + prior_latency * PRIOR_WEIGHT) / (row.submitted_count + PRIOR_WEIGHT)
+            acceptance = (row.approved_count + 1) / (row.reviewed_count + 2)
+            rates[user_id] = acceptance * 3600.0 / max(latency, 1.0)
+        return rates
+
+    def _fold(self, project_id: int, entries: list[AuditLog]) -> None:
+        submits = [entry for entry in entries if entry.action == SUBMIT_ACTION and entry.actor_id is not None]
+        reviews = [entry for entry in entries if entry.action == REVIEW_ACTION]
+        starts = self._assignment_starts(project_id, submits)
+        authors = self._annotation_authors({(entry.meta or {}).get("annotation_id") for entry in reviews})
+
+        submitted: Counter[int] = Counter()
+        latency: defaultdict[int, float] = defaultdict(float)
+        reviewed: Counter[int] = Counter()
+        approved: Counter[int] = Counter()
+        for entry in submits:
+            started = self._latest_start(starts.get((entry.entity_id, entry.actor_id), []), entry.id)
+            if started is None:
+                continue
+            submitted[entry.actor_id] += 1
+            latency[entry.actor_id] += max((entry.created_at - started).total_seconds(), 0.0)
+        for entry in reviews:
+            meta = entry.meta or {}
+            author_id = authors.get(meta.get("annotation_id"))
+            if author_id is None:
+                continue
+            reviewed[author_id] += 1
+            if meta.get("decision") == ReviewDecision.APPROVE.value:
+                approved[author_id] += 1
+
+        user_ids = set(submitted) | set(reviewed)
+        if not user_ids:
+            return
+        rows = {
+            row.user_id: row
+            for row in self.session.exec(
+                select(AnnotatorThroughput).where(
+                    AnnotatorThroughput.project_id == project_id, AnnotatorThroughput.user_id.in_(user_ids)
+                )
+            )
+        }
+        for user_id in user_ids:
+            row = rows.get(user_id) or AnnotatorThroughput(project_id=project_id, user_id=user_id)
+            row.submitted_count += submitted[user_id]
+            row.total_latency_seconds += latency[user_id]
+            row.reviewed_count += reviewed[user_id]
+            row.approved_count += approved[user_id]
+            self.session.add(row)
+        self.session.flush()
+
+    def _assignment_starts(
+        self, project_id: int, submits: list[AuditLog]
+    ) -> dict[tuple[int, int], list[tuple[int, datetime]]]:
+        starts: dict[tuple[int, int], list[tuple[int, datetime]]] = defaultdict(list)
+        sentence_ids = list({entry.entity_id for entry in submits})
+        for chunk in chunked(sentence_ids):
+            for entry in self.session.exec(
+                select(AuditLog).where(
+                    AuditLog.project_id == project_id,
+                    AuditLog.entity_type == "sentence",
+                    AuditLog.entity_id.in_(chunk),
+                    AuditLog.action.in_(ASSIGN_ACTIONS),
+                )
+            ):
+                for user_id in _assignees(entry):
+                    starts[(entry.entity_id, user_id)].append((entry.id, entry.created_at))
+        return starts
+
+    @staticmethod
+    def _latest_start(starts: list[tuple[int, datetime]], before_id: int) -> Optional[datetime]:
+        earlier = [(audit_id, created_at) for audit_id, created_at in starts if audit_id < before_id]
+        return max(earlier)[1] if earlier else None
+
+    def _annotation_authors(self, annotation_ids: set[Optional[int]]) -> dict[int, int]:
+        ids = [annotation_id for annotation_id in annotation_ids if annotation_id is not None]
+        authors: dict[int, int] = {}
+        for chunk in chunked(ids):
+            rows = self.session.exec(select(Annotation.id, Annotation.author_id).where(Annotation.id.in_(chunk))).all()
+            authors.update(rows)
+        return authors
+
+
+class ThroughputCache:
+    """Per-project rates kept in process for ``ttl_seconds``; reading never refreshes totals."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: dict[int, tuple[float, dict[int, float]]] = {}
+
+    def rates(self, session: Session, project_id: int, user_ids: Iterable[int]) -> dict[int, float]:
+        user_ids = set(user_ids)
+        with self._lock:
+            entry = self._entries.get(project_id)
+        if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds and user_ids <= entry[1].keys():
+            return {user_id: entry[1][user_id] for user_id in user_ids}
+        rates = ThroughputTracker(session).rates(project_id, user_ids)
+        with self._lock:
+            self._entries[project_id] = (time.monotonic(), rates)
+        return rates
+
+    def invalidate(self, project_id: Optional[int] = None) -> None:
+        with self._lock:
+            if project_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(project_id, None)
+
+
+throughput_cache = ThroughputCache(ttl_seconds=get_settings().throughput_cache_seconds)
+
+
+def start_throughput_refresher(settings: Settings, stop_event: threading.Event) -> threading.Thread | None:
+    """Fold new audit entries of every project periodically in a daemon thread until ``stop_event`` is set."""
+
+    interval = settings.throughput_refresh_interval_seconds
+    if interval <= 0:
+        return None
+
+    def _loop() -> None:
+        while not stop_event.wait(interval):
+            try:
+                with session_scope() as session:
+                    project_ids = list(session.exec(select(Project.id)))
+                for project_id in project_ids:
+                    with session_scope() as session:
+                        if ThroughputTracker(session).refresh(project_id):
+                            session.commit()
+                            throughput_cache.invalidate(project_id)
+            except Exception:  # noqa: BLE001
+                logger.exception("Throughput refresh failed")
+
+    thread = threading.Thread(target=_loop, name="throughput-refresher", daemon=True)
+    thread.start()
+    return thread
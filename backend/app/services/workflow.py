@@ -1,9 +1,18 @@
-from typing import Iterable, Set
+from collections import defaultdict
+from datetime import datetime
+from typing import Iterable, Optional, Sequence, Set
 
 from fastapi import HTTPException, status
+from sqlalchemy import update
+from sqlalchemy.orm.attributes import flag_modified
+from sqlmodel import Session
 
 from ..dependencies import CurrentUser
 from ..enums import ReviewDecision, Role, SentenceStatus
+from ..models import Sentence
+from .batching import chunked
+
+STALE_SENTENCE_DETAIL = "Cümle başka bir işlem tarafından güncellendi; yeniden yükleyip tekrar deneyin."
 
 
 class WorkflowGuard:
@@ -14,12 +23,13 @@ class WorkflowGuard:
         SentenceStatus.ASSIGNED: {
             SentenceStatus.ASSIGNED: {Role.ADMIN, Role.ASSIGNMENT_ENGINE, Role.CURATOR},
             SentenceStatus.SUBMITTED: {Role.ANNOTATOR},
+            SentenceStatus.NEW: {Role.ASSIGNMENT_ENGINE},
         },
         SentenceStatus.SUBMITTED: {SentenceStatus.IN_REVIEW: {Role.ADMIN, Role.REVIEWER, Role.CURATOR}},
         SentenceStatus.IN_REVIEW: {
             SentenceStatus.IN_REVIEW: {Role.REVIEWER, Role.ADMIN, Role.CURATOR},
             SentenceStatus.ADJUDICATED: {Role.REVIEWER, Role.ADMIN, Role.CURATOR},
-            SentenceStatus.SUBMITTED: {Role.REVIEWER},
+            SentenceStatus.SUBMITTED: {Role.REVIEWER, Role.ASSIGNMENT_ENGINE},
             SentenceStatus.ASSIGNED: {Role.REVIEWER, Role.ADMIN, Role.CURATOR},
         },
         SentenceStatus.ADJUDICATED: {
@@ -103,3 +113,38 @@ def require_roles(user: CurrentUser, allowed: Iterable[Role], *, use_project_rol
         status_code=status.HTTP_403_FORBIDDEN,
         detail=f"{user.acting_role} rolü bu işlem için yetkili değil.",
     )
+
+
+def apply_transition(sentence: Sentence, target: SentenceStatus) -> None:
+    """Set ``target`` so the next flush is a compare-and-set on ``Sentence.version``.
+
+    The UPDATE is emitted even when the status does not change, so a concurrent transition
+    of the same sentence fails with ``StaleDataError`` instead of being silently overwritten.
+    """
+
+    sentence.status = target
+    flag_modified(sentence, "status")
+
+
+def transition_many(
+    session: Session, sentences: Sequence[Sentence], target: SentenceStatus, now: Optional[datetime] = None
+) -> None:
+    """Bulk counterpart of ``apply_transition``; 409 if any sentence changed since it was loaded."""
+
+    now = now or datetime.utcnow()
+    for chunk in chunked(sentences):
+        # One primary-key IN per loaded version; a row-value IN makes SQLite scan the table.
+        by_version: dict[int, list[int]] = defaultdict(list)
+        for sentence in chunk:
+            by_version[sentence.version].append(sentence.id)
+        for version, ids in by_version.items():
+            result = session.execute(
+                update(Sentence)
+                .where(Sentence.id.in_(ids), Sentence.version == version)
+                .values(status=target, updated_at=now, version=Sentence.version + 1)
+                .execution_options(synchronize_session=False)
+            )
+            if result.rowcount != len(ids):
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=STALE_SENTENCE_DETAIL)
+        for sentence in chunk:
+            session.expire(sentence, ["status", "updated_at", "version"])
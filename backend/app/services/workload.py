@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Iterable, Mapping
+
+from sqlalchemy import delete, exists, func
+from sqlmodel import Session, select
+
+from ..enums import Role
+from ..models import Assignment, AssignmentLoad, Sentence
+from .counters import increment_counter
+
+
+def adjust_assignment_load(session: Session, *, project_id: int, role: Role, deltas: Mapping[int, int]) -> None:
+    """Apply per-user changes in active assignment counts without committing."""
+
+    for user_id, delta in deltas.items():
+        if delta:
+            increment_counter(
+                session,
+                AssignmentLoad,
+                {"project_id": project_id, "role": role, "user_id": user_id},
+                field="active_count",
+                delta=delta,
+            )
+
+
+def track_deactivated(session: Session, project_id: int, assignments: Iterable[Assignment]) -> None:
+    """Decrement counters for assignments that were just switched to inactive."""
+
+    deltas: dict[Role, Counter[int]] = {}
+    for assignment in assignments:
+        deltas.setdefault(assignment.role, Counter())[assignment.user_id] -= 1
+    for role, role_deltas in deltas.items():
+        adjust_assignment_load(session, project_id=project_id, role=role, deltas=role_deltas)
+
+
+def read_assignment_load(session: Session, *, project_id: int, role: Role, user_ids: Iterable[int]) -> Counter:
+    user_ids = set(user_ids)
+    if not user_ids:
+        return Counter()
+    rows = session.exec(
+        select(AssignmentLoad.user_id, AssignmentLoad.active_count).where(
+            AssignmentLoad.project_id == project_id,
+            AssignmentLoad.role == role,
+            AssignmentLoad.user_id.in_(user_ids),
+        )
+    ).all()
+    return Counter({user_id: count for user_id, count in rows if count > 0})
+
+
+def rebuild_assignment_load(session: Session, project_id: int) -> int:
+    """Recompute a project's counters from Assignment and return the active assignment total."""
+
+    rows = session.exec(
+        select(Assignment.role, Assignment.user_id, func.count())
+        .join(Sentence, Sentence.id == Assignment.sentence_id)
+        .where(Sentence.project_id == project_id, Assignment.is_active.is_(True))
+        .group_by(Assignment.role, Assignment.user_id)
+    ).all()
+    session.execute(delete(AssignmentLoad).where(AssignmentLoad.project_id == project_id))
+    session.add_all(
+        AssignmentLoad(project_id=project_id, role=role, user_id=user_id, active_count=count)
+        for role, user_id, count in rows
+    )
+    session.flush()
+    return sum(count for _, _, count in rows)
+
+
+def backfill_assignment_load(session: Session) -> list[int]:
+    """Build counters for projects whose active assignments predate ``AssignmentLoad``.
+
+    Tracking always leaves a row behind (counts drop to 0 but rows stay), so a project with
+    active assignments and no rows has never been counted. Run before anything writes
+    counters; returns the backfilled project ids.
+    """
+
+    project_ids = session.exec(
+        select(Sentence.project_id)
+        .join(Assignment, Assignment.sentence_id == Sentence.id)
+        .where(
+            Assignment.is_active.is_(True),
+            ~exists().where(AssignmentLoad.project_id == Sentence.project_id),
+        )
+        .distinct()
+    ).all()
+    for project_id in project_ids:
+        rebuild_assignment_load(session, project_id)
+    return list(project_ids)
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from sqlmodel import Session, select
+
+from ..dependencies import CurrentUser
+from ..enums import Role
+from ..models import Adjudication, Annotation, Assignment, Project, Review, Sentence
+from ..schemas import SentenceWorkspace
+from .batching import chunked
+
+_REVIEW_ROLES = {Role.ADMIN, Role.CURATOR, Role.REVIEWER}
+_CURATION_ROLES = {Role.ADMIN, Role.CURATOR}
+
+
+def load_sentence_workspace(session: Session, sentence: Sentence, user: CurrentUser, role: Role) -> SentenceWorkspace:
+    """Everything a workspace page shows for ``sentence``, one query per section.
+
+    ``role`` is the caller's effective role. Sections the role cannot read through the
+    individual endpoints come back empty. A blind annotator assignment limits annotations
+    to the caller's own, as does ``Project.blind_annotation`` for annotators; a blind reviewer
+    assignment does the same for reviews. Curators
+    and admins always see everything, including every active assignment.
+    """
+
+    assignments = list(
+        session.exec(
+            select(Assignment)
+            .where(Assignment.sentence_id == sentence.id, Assignment.is_active.is_(True))
+            .order_by(Assignment.id)
+        )
+    )
+    blind_roles: set[Role] = set()
+    if role not in _CURATION_ROLES:
+        assignments = [assignment for assignment in assignments if assignment.user_id == user.user_id]
+        blind_roles = {assignment.role for assignment in assignments if assignment.is_blind}
+        project = session.get(Project, sentence.project_id)
+        if role == Role.ANNOTATOR and project is not None and project.blind_annotation:
+            blind_roles.add(Role.ANNOTATOR)
+
+    annotation_query = select(Annotation).where(Annotation.sentence_id == sentence.id)
+    if Role.ANNOTATOR in blind_roles:
+        annotation_query = annotation_query.where(Annotation.author_id == user.user_id)
+    annotations = list(
+        session.exec(annotation_query.order_by(Annotation.created_at.desc(), Annotation.id.desc()))
+    )
+
+    reviews: list[Review] = []
+    if role in _REVIEW_ROLES:
+        for chunk in chunked([annotation.id for annotation in annotations]):
+            review_query = select(Review).where(Review.annotation_id.in_(chunk))
+            if Role.REVIEWER in blind_roles:
+                review_query = review_query.where(Review.reviewer_id == user.user_id)
+            reviews.extend(session.exec(review_query))
+        reviews.sort(key=lambda review: (review.created_at, review.id), reverse=True)
+
+    adjudication = None
+    if role in _CURATION_ROLES:
+        adjudication = session.exec(
+            select(Adjudication)
+            .where(Adjudication.sentence_id == sentence.id)
+            .order_by(Adjudication.created_at.desc(), Adjudication.id.desc())
+            .limit(1)
+        ).first()
+
+    return SentenceWorkspace(
+        sentence=sentence,
+        annotations=annotations,
+        reviews=reviews,
+        adjudication=adjudication,
+        assignments=assignments,
+        is_blind=bool(blind_roles),
+    )
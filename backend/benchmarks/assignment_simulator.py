@@ -0,0 +1,395 @@
+"""Simulate the assignment paths against an in-memory database and report their cost.
+
+Run from ``backend/``::
+
+    python -m benchmarks.assignment_simulator --annotators 500 --sentences 20000
+
+Every strategy runs on a freshly seeded database so results are comparable. For each
+operation the report lists latency percentiles, SQL statements per call and the Gini
+coefficient of the resulting active-assignment load across annotators (0 is perfectly even).
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import event, insert
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.enums import AssignmentStrategy, Role
+from app.models import Assignment, AssignmentLoad, AuditLog, Project, ProjectMembership, Sentence, User, UserProfile
+from app.services.assignment_engine import AssignmentEngine
+from app.services.bulk_assignment import BulkAssigner
+from app.services.skill_index import skill_index_cache
+from app.services.task_claim import TaskClaimer
+from app.services.throughput import ThroughputTracker, throughput_cache
+from app.services.workload import adjust_assignment_load
+
+SKILLS = ("ner", "srl", "coref", "temporal", "modality", "negation")
+
+
+@dataclass
+class SimulationConfig:
+    annotators: int = 50
+    sentences: int = 2000
+    skills_per_user: int = 2
+    per_sentence: int = 1
+    select_calls: int = 200
+    bulk_batch: int = 500
+    bulk_calls: int = 2
+    claims: int = 200
+    history_per_user: int = 3
+    strategies: Sequence[AssignmentStrategy] = tuple(AssignmentStrategy)
+    seed: int = 7
+
+
+@dataclass
+class OperationReport:
+    strategy: str
+    operation: str
+    calls: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    queries_per_call: float
+    gini: float
+
+
+@dataclass
+class _Run:
+    latencies: list[float] = field(default_factory=list)
+    queries: int = 0
+
+
+def gini(values: Sequence[float]) -> float:
+    """Gini coefficient of non-negative ``values``; 0 for empty or all-zero input."""
+
+    ordered = sorted(values)
+    total = sum(ordered)
+    if not ordered or total == 0:
+        return 0.0
+    weighted = sum((index + 1) * value for index, value in enumerate(ordered))
+    return (2 * weighted) / (len(ordered) * total) - (len(ordered) + 1) / len(ordered)
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)]
+
+
+class QueryCounter:
+    def __init__(self, engine) -> None:
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args) -> None:
+        self.count += 1
+
+
+def seed_database(session: Session, config: SimulationConfig, rng: random.Random) -> int:
+    """Create one project with annotators, skill profiles, sentences and submission history."""
+
+    project = Project(name="simulation", annotators_per_sentence=config.per_sentence)
+    session.add(project)
+    session.flush()
+    now = datetime.utcnow()
+    session.execute(
+        insert(User),
+        [
+            {"username": f"sim-{index}", "role": Role.ANNOTATOR, "hashed_password": "x", "created_at": now}
+            for index in range(config.annotators)
+        ],
+    )
+    user_ids = list(session.exec(select(User.id).order_by(User.id)))
+    session.execute(
+        insert(ProjectMembership),
+        [
+            {
+                "user_id": user_id,
+                "project_id": project.id,
+                "role": Role.ANNOTATOR,
+                "is_active": True,
+                "approved_at": now,
+                "created_at": now,
+            }
+            for user_id in user_ids
+        ],
+    )
+    session.execute(
+        insert(UserProfile),
+        [
+            {
+                "user_id": user_id,
+                "skills": rng.sample(SKILLS, min(config.skills_per_user, len(SKILLS))),
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for user_id in user_ids
+        ],
+    )
+    session.execute(
+        insert(Sentence),
+        [
+            {
+                "project_id": project.id,
+                "text": f"simülasyon cümlesi {index}",
+                "priority": rng.randint(0, 3),
+                "created_at": now,
+                "updated_at": now,
+            }
+            for index in range(config.sentences)
+        ],
+    )
+    _seed_history(session, project.id, user_ids, config, rng, now)
+    ThroughputTracker(session).refresh(project.id)
+    session.commit()
+    return project.id
+
+
+def _seed_history(
+    session: Session,
+    project_id: int,
+    user_ids: Sequence[int],
+    config: SimulationConfig,
+    rng: random.Random,
+    now: datetime,
+) -> None:
+    """Write assigned/submitted audit pairs with per-user speed so throughput has data."""
+
+    rows = []
+    for user_id in user_ids:
+        mean_minutes = rng.lognormvariate(3.5, 0.6)
+        for _ in range(config.history_per_user):
+            started = now - timedelta(days=1, minutes=rng.randint(0, 600))
+            # History points at sentence ids that do not exist; only timestamps matter.
+            entity_id = -rng.randint(1, 10**9)
+            rows.append(
+                {
+                    "action": "sentence_assigned",
+                    "entity_type": "sentence",
+                    "entity_id": entity_id,
+                    "project_id": project_id,
+                    "meta": {"assignee_ids": [user_id]},
+                    "created_at": started,
+                }
+            )
+            rows.append(
+                {
+                    "actor_id": user_id,
+                    "action": "annotation_submitted",
+                    "entity_type": "sentence",
+                    "entity_id": entity_id,
+                    "project_id": project_id,
+                    "created_at": started + timedelta(minutes=rng.expovariate(1 / mean_minutes)),
+                }
+            )
+    if rows:
+        session.execute(insert(AuditLog), rows)
+
+
+def _timed(run: _Run, counter: QueryCounter, action: Callable[[], object]) -> None:
+    before = counter.count
+    started = time.perf_counter()
+    action()
+    run.latencies.append((time.perf_counter() - started) * 1000)
+    run.queries += counter.count - before
+
+
+def _load_gini(session: Session, project_id: int, annotators: int) -> float:
+    counts = list(
+        session.exec(
+            select(AssignmentLoad.active_count).where(
+                AssignmentLoad.project_id == project_id, AssignmentLoad.role == Role.ANNOTATOR
+            )
+        )
+    )
+    return gini(counts + [0] * (annotators - len(counts)))
+
+
+def _report(strategy: str, operation: str, run: _Run, gini_value: float) -> OperationReport:
+    calls = len(run.latencies)
+    return OperationReport(
+        strategy=strategy,
+        operation=operation,
+        calls=calls,
+        p50_ms=percentile(run.latencies, 0.50),
+        p95_ms=percentile(run.latencies, 0.95),
+        p99_ms=percentile(run.latencies, 0.99),
+        max_ms=max(run.latencies, default=0.0),
+        queries_per_call=run.queries / calls if calls else 0.0,
+        gini=gini_value,
+    )
+
+
+class _Environment:
+    def __init__(self, config: SimulationConfig) -> None:
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(self.engine)
+        skill_index_cache.invalidate()
+        throughput_cache.invalidate()
+        with Session(self.engine) as session:
+            self.project_id = seed_database(session, config, self.rng)
+        self.counter = QueryCounter(self.engine)
+
+    def required_skills(self, strategy: AssignmentStrategy) -> Optional[list[str]]:
+        if strategy != AssignmentStrategy.SKILL_BASED:
+            return None
+        return self.rng.sample(SKILLS, 2)
+
+
+def run_select(config: SimulationConfig, strategy: AssignmentStrategy) -> OperationReport:
+    env = _Environment(config)
+    run = _Run()
+    with Session(env.engine) as session:
+        sentence_ids = list(session.exec(select(Sentence.id).order_by(Sentence.id).limit(config.select_calls)))
+        for sentence_id in sentence_ids:
+
+            def assign_one() -> None:
+                try:
+                    user_ids = AssignmentEngine(session).select_assignees(
+                        project_id=env.project_id,
+                        strategy=strategy,
+                        role=Role.ANNOTATOR,
+                        count=config.per_sentence,
+                        required_skills=env.required_skills(strategy),
+                        provided_assignees=None,
+                        exclude_user_ids=set(),
+                    )
+                except HTTPException:
+                    return
+                session.add_all(Assignment(sentence_id=sentence_id, user_id=user_id) for user_id in user_ids)
+                adjust_assignment_load(
+                    session, project_id=env.project_id, role=Role.ANNOTATOR, deltas=Counter(user_ids)
+                )
+                session.commit()
+
+            _timed(run, env.counter, assign_one)
+        return _report(strategy.value, "select_assignees", run, _load_gini(session, env.project_id, config.annotators))
+
+
+def run_bulk(config: SimulationConfig, strategy: AssignmentStrategy) -> OperationReport:
+    env = _Environment(config)
+    run = _Run()
+    with Session(env.engine) as session:
+        for _ in range(config.bulk_calls):
+
+            def assign_batch() -> None:
+                try:
+                    BulkAssigner(session).assign(
+                        project_id=env.project_id,
+                        actor_id=None,
+                        actor_role=Role.ASSIGNMENT_ENGINE,
+                        limit=config.bulk_batch,
+                        strategy=strategy,
+                        count=config.per_sentence,
+                        required_skills=env.required_skills(strategy),
+                    )
+                except HTTPException:
+                    session.rollback()
+                    return
+                session.commit()
+
+            _timed(run, env.counter, assign_batch)
+        return _report(strategy.value, "bulk_assign", run, _load_gini(session, env.project_id, config.annotators))
+
+
+def run_claims(config: SimulationConfig) -> OperationReport:
+    env = _Environment(config)
+    run = _Run()
+    with Session(env.engine) as session:
+        user_ids = list(session.exec(select(ProjectMembership.user_id).order_by(ProjectMembership.user_id)))
+        project = session.get(Project, env.project_id)
+        for index in range(config.claims):
+            user_id = user_ids[index % len(user_ids)]
+
+            def claim() -> None:
+                try:
+                    TaskClaimer(session).claim(project=project, user_id=user_id, role=Role.ANNOTATOR)
+                except HTTPException:
+                    session.rollback()
+                    return
+                session.commit()
+
+            _timed(run, env.counter, claim)
+        return _report("pull", "claim", run, _load_gini(session, env.project_id, config.annotators))
+
+
+def simulate(config: SimulationConfig) -> list[OperationReport]:
+    reports: list[OperationReport] = []
+    for strategy in config.strategies:
+        reports.append(run_select(config, strategy))
+        reports.append(run_bulk(config, strategy))
+    if config.claims:
+        reports.append(run_claims(config))
+    return reports
+
+
+def format_reports(reports: Sequence[OperationReport]) -> str:
+    header = (
+        f"{'strategy':<12} {'operation':<17} {'calls':>6} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'p99 ms':>8} {'max ms':>8} {'sql/call':>9} {'gini':>6}"
+    )
+    lines = [header, "-" * len(header)]
+    for report in reports:
+        lines.append(
+            f"{report.strategy:<12} {report.operation:<17} {report.calls:>6} {report.p50_ms:>8.2f} "
+            f"{report.p95_ms:>8.2f} {report.p99_ms:>8.2f} {report.max_ms:>8.2f} "
+            f"{report.queries_per_call:>9.1f} {report.gini:>6.3f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    defaults = SimulationConfig()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--annotators", type=int, default=defaults.annotators)
+    parser.add_argument("--sentences", type=int, default=defaults.sentences)
+    parser.add_argument("--skills-per-user", type=int, default=defaults.skills_per_user)
+    parser.add_argument("--per-sentence", type=int, default=defaults.per_sentence)
+    parser.add_argument("--select-calls", type=int, default=defaults.select_calls)
+    parser.add_argument("--bulk-batch", type=int, default=defaults.bulk_batch)
+    parser.add_argument("--bulk-calls", type=int, default=defaults.bulk_calls)
+    parser.add_argument("--claims", type=int, default=defaults.claims)
+    parser.add_argument("--history-per-user", type=int, default=defaults.history_per_user)
+    parser.add_argument(
+        "--strategy",
+        action="append",
+        choices=[strategy.value for strategy in AssignmentStrategy],
+        help="Strategy to simulate; repeat for several (default: all).",
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    args = parser.parse_args(argv)
+    config = SimulationConfig(
+        annotators=args.annotators,
+        sentences=args.sentences,
+        skills_per_user=args.skills_per_user,
+        per_sentence=args.per_sentence,
+        select_calls=args.select_calls,
+        bulk_batch=args.bulk_batch,
+        bulk_calls=args.bulk_calls,
+        claims=args.claims,
+        history_per_user=args.history_per_user,
+        strategies=(
+            [AssignmentStrategy(value) for value in args.strategy] if args.strategy else tuple(AssignmentStrategy)
+        ),
+        seed=args.seed,
+    )
+    print(format_reports(simulate(config)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.database import get_session  # noqa: E402
+from app.dependencies import CurrentUser, get_current_user  # noqa: E402
+from app.enums import Role  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Project, ProjectMembership, Sentence, User, UserProfile  # noqa: E402
+from app.services.membership_cache import membership_cache  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def clear_membership_cache():
+    # Every test starts from a fresh database whose project ids repeat.
+    membership_cache.invalidate()
+    yield
+    membership_cache.invalidate()
+
+
+@pytest.fixture()
+def engine():
+    """In-memory database shared by every connection, so the app's threads see the test's rows."""
+
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    SQLModel.metadata.create_all(engine)
+    return engine
+
+
+@pytest.fixture()
+def client(engine):
+    """TestClient whose requests use ``engine``; pair with ``act_as`` to pick the caller."""
+
+    def override_get_session():
+        with Session(engine) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = override_get_session
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture()
+def act_as() -> Callable[[CurrentUser], None]:
+    def _act_as(user: CurrentUser) -> None:
+        app.dependency_overrides[get_current_user] = lambda: user
+
+    return _act_as
+
+
+@pytest.fixture()
+def session(engine):
+    with Session(engine) as session:
+        yield session
+
+
+def _seed_project(session: Session, *, annotators: int = 3, sentences: int = 6) -> Project:
+    project = Project(name="Assignments")
+    session.add(project)
+    session.flush()
+    for index in range(annotators):
+        user = User(username=f"ann-{index}", role=Role.ANNOTATOR, hashed_password="x")
+        session.add(user)
+        session.flush()
+        session.add(
+            ProjectMembership(
+                user_id=user.id,
+                project_id=project.id,
+                role=Role.ANNOTATOR,
+                is_active=True,
+                approved_at=datetime.utcnow(),
+            )
+        )
+        session.add(UserProfile(user_id=user.id, skills=["ner"] if index == 0 else ["srl"]))
+    session.add_all(Sentence(project_id=project.id, text=f"cümle {index}") for index in range(sentences))
+    session.commit()
+    session.refresh(project)
+    return project
+
+
+@pytest.fixture()
+def seed_project() -> Callable[..., Project]:
+    """Project with approved annotators ``ann-0`` (skills ner) and ``ann-1``.. (srl) and NEW sentences."""
+
+    return _seed_project
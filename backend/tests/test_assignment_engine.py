@@ -0,0 +1,95 @@
+import sys
+from pathlib import Path
+
+from sqlmodel import Session, select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.enums import AssignmentStrategy, Role, SentenceStatus  # noqa: E402
+from app.models import Assignment, AuditLog, ProjectMembership, Sentence, User, UserProfile  # noqa: E402
+from app.services.assignment_engine import AssignmentEngine  # noqa: E402
+from app.services.bulk_assignment import BulkAssigner  # noqa: E402
+
+
+def test_plan_bulk_balances_load_and_respects_exclusions(session: Session, seed_project):
+    project = seed_project(session, annotators=3, sentences=6)
+    sentence_ids = list(session.exec(select(Sentence.id).order_by(Sentence.id)))
+    member_ids = sorted(session.exec(select(ProjectMembership.user_id)))
+    plan = AssignmentEngine(session).plan_bulk(
+        project_id=project.id,
+        strategy=AssignmentStrategy.ROUND_ROBIN,
+        role=Role.ANNOTATOR,
+        sentence_ids=sentence_ids,
+        count=2,
+        required_skills=None,
+        existing_assignees={sentence_ids[0]: {member_ids[0]}},
+    )
+    assert set(plan) == set(sentence_ids)
+    assert all(len(set(users)) == 2 for users in plan.values())
+    assert member_ids[0] not in plan[sentence_ids[0]]
+    loads = sorted(sum(user in users for users in plan.values()) for user in member_ids)
+    assert loads == [4, 4, 4]
+
+
+def test_bulk_assigner_writes_assignments_statuses_and_audit(session: Session, seed_project):
+    project = seed_project(session, annotators=2, sentences=5)
+    sentences = list(session.exec(select(Sentence).order_by(Sentence.id)))
+    sentences[0].status = SentenceStatus.SUBMITTED
+    session.add(sentences[0])
+    session.add(Assignment(sentence_id=sentences[1].id, user_id=99))
+    session.commit()
+
+    result = BulkAssigner(session).assign(
+        project_id=project.id,
+        actor_id=1,
+        actor_role=Role.ADMIN,
+        sentence_ids=[sentence.id for sentence in sentences] + [12345],
+    )
+    session.commit()
+
+    assert result.assigned_sentence_ids == [sentence.id for sentence in sentences[2:]]
+    assert result.assignment_count == 3
+    assert sorted(result.assignments_per_user.values()) == [1, 2]
+    assert {(skip.sentence_id, skip.reason) for skip in result.skipped} == {
+        (12345, "not_found"),
+        (sentences[0].id, "invalid_status"),
+        (sentences[1].id, "active_assignments"),
+    }
+    statuses = dict(session.exec(select(Sentence.id, Sentence.status)).all())
+    assert all(statuses[sentence.id] == SentenceStatus.ASSIGNED for sentence in sentences[2:])
+    audit_rows = list(session.exec(select(AuditLog).where(AuditLog.action == "sentence_assigned")))
+    assert len(audit_rows) == 3
+    assert audit_rows[0].meta["bulk"] is True
+
+
+def test_bulk_skill_based_prefers_matching_profiles(session: Session, seed_project):
+    project = seed_project(session, annotators=3, sentences=4)
+    ner_user = session.exec(select(User.id).where(User.username == "ann-0")).one()
+    result = BulkAssigner(session).assign(
+        project_id=project.id,
+        actor_id=1,
+        actor_role=Role.CURATOR,
+        strategy=AssignmentStrategy.SKILL_BASED,
+        required_skills=["NER"],
+    )
+    assert result.assignments_per_user == {ner_user: 4}
+
+
+def test_bulk_skill_based_spreads_load_across_skilled_users(session: Session, seed_project):
+    project = seed_project(session, annotators=3, sentences=6)
+    srl_users = session.exec(select(User.id).where(User.username.in_(["ann-1", "ann-2"]))).all()
+    # A higher overlap only breaks ties; it must not pull the whole batch to one user.
+    profile = session.exec(select(UserProfile).where(UserProfile.user_id == srl_users[0])).one()
+    profile.skills = ["srl", "coref"]
+    session.add(profile)
+    session.commit()
+    result = BulkAssigner(session).assign(
+        project_id=project.id,
+        actor_id=1,
+        actor_role=Role.CURATOR,
+        strategy=AssignmentStrategy.SKILL_BASED,
+        required_skills=["srl", "coref"],
+    )
+    assert result.assignments_per_user == {user_id: 3 for user_id in srl_users}
@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.enums import AssignmentStrategy  # noqa: E402
+from benchmarks.assignment_simulator import SimulationConfig, format_reports, gini, simulate  # noqa: E402
+
+
+def test_gini_bounds():
+    assert gini([]) == 0.0
+    assert gini([3, 3, 3]) == 0.0
+    assert gini([0, 0, 0, 8]) == pytest.approx(0.75)
+
+
+def test_simulation_reports_every_operation():
+    config = SimulationConfig(
+        annotators=6,
+        sentences=40,
+        select_calls=5,
+        bulk_batch=10,
+        bulk_calls=1,
+        claims=5,
+        strategies=(AssignmentStrategy.ROUND_ROBIN, AssignmentStrategy.THROUGHPUT),
+    )
+    reports = simulate(config)
+    assert [(report.strategy, report.operation) for report in reports] == [
+        ("round_robin", "select_assignees"),
+        ("round_robin", "bulk_assign"),
+        ("throughput", "select_assignees"),
+        ("throughput", "bulk_assign"),
+        ("pull", "claim"),
+    ]
+    round_robin = reports[0]
+    assert round_robin.calls == 5
+    assert round_robin.queries_per_call > 0
+    assert round_robin.gini < 0.2
+    assert "bulk_assign" in format_reports(reports)
@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+from sqlalchemy.orm.exc import StaleDataError
+from sqlmodel import Session, select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.enums import Role  # noqa: E402
+from app.models import AuditLog, Project, Sentence  # noqa: E402
+from app.services.auto_assign import AutoAssignPolicy, AutoAssignScheduler  # noqa: E402
+
+
+def test_auto_assign_scheduler_tops_up_to_caps_in_priority_order(session: Session, seed_project):
+    project = seed_project(session, annotators=2, sentences=6)
+    project.auto_assign_enabled = True
+    project.annotators_per_sentence = 2
+    session.add(project)
+    urgent = session.exec(select(Sentence).order_by(Sentence.id.desc())).first()
+    urgent.priority = 10
+    session.add(urgent)
+    session.commit()
+    scheduler = AutoAssignScheduler(session, AutoAssignPolicy(max_active_per_user=3, batch_size=100))
+
+    result = scheduler.run_once()[project.id]
+    assert result.assigned_sentence_ids[0] == urgent.id
+    assert result.assignments_per_user and set(result.assignments_per_user.values()) == {3}
+    audit = session.exec(select(AuditLog).where(AuditLog.action == "sentence_auto_assigned")).first()
+    assert audit.actor_role == Role.ASSIGNMENT_ENGINE
+
+    # Queues are full, so the next run assigns nothing until work is finished.
+    assert scheduler.run_once() == {}
+
+
+def test_a_failing_project_does_not_stop_the_rest_of_the_run(session: Session, seed_project, monkeypatch):
+    broken = Project(name="Bozuk", auto_assign_enabled=True)
+    session.add(broken)
+    session.commit()
+    project = seed_project(session, annotators=2, sentences=4)
+    project.auto_assign_enabled = True
+    session.add(project)
+    session.commit()
+    scheduler = AutoAssignScheduler(session, AutoAssignPolicy(max_active_per_user=5, batch_size=100))
+    top_up = scheduler.top_up
+
+    def conflicting_top_up(project_id: int):
+        if project_id == broken.id:
+            raise StaleDataError("sentence changed concurrently")
+        return top_up(project_id)
+
+    monkeypatch.setattr(scheduler, "top_up", conflicting_top_up)
+    results = scheduler.run_once()
+
+    assert list(results) == [project.id]
+    assert len(results[project.id].assigned_sentence_ids) == 4
@@ -0,0 +1,122 @@
+import sys
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.dependencies import CurrentUser  # noqa: E402
+from app.enums import Role, SentenceStatus  # noqa: E402
+from app.models import Annotation, Assignment, AuditLog, FailedSubmission, Project, Review, Sentence  # noqa: E402
+
+
+def call(client: TestClient, url: str, payload: dict) -> dict:
+    response = client.post(url, json=payload)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def seed(session: Session, statuses: list[SentenceStatus]) -> tuple[int, list[int], list[int]]:
+    project = Project(name="Toplu")
+    session.add(project)
+    session.commit()
+    sentences = [
+        Sentence(project_id=project.id, text=f"Cümle {index}", status=status) for index, status in enumerate(statuses)
+    ]
+    session.add_all(sentences)
+    session.commit()
+    annotations = []
+    for sentence in sentences:
+        assignment = Assignment(sentence_id=sentence.id, user_id=10, role=Role.ANNOTATOR)
+        session.add(assignment)
+        session.commit()
+        session.add(Assignment(sentence_id=sentence.id, user_id=20, role=Role.REVIEWER))
+        annotation = Annotation(
+            sentence_id=sentence.id, assignment_id=assignment.id, author_id=10, penman_text="(k / kedi)"
+        )
+        session.add(annotation)
+        session.commit()
+        annotations.append(annotation.id)
+    return project.id, [sentence.id for sentence in sentences], annotations
+
+
+def test_batch_review_validates_every_item_and_writes_in_bulk(engine, client, act_as):
+    with Session(engine) as session:
+        project_id, sentence_ids, annotation_ids = seed(
+            session, [SentenceStatus.SUBMITTED, SentenceStatus.IN_REVIEW, SentenceStatus.SUBMITTED, SentenceStatus.NEW]
+        )
+
+    act_as(CurrentUser(user_id=20, role=Role.REVIEWER, project_id=project_id, project_role=Role.REVIEWER))
+    body = call(
+        client,
+        f"/sentences/project/{project_id}/review-batch",
+        {
+            "items": [
+                {"sentence_id": sentence_ids[0], "annotation_id": annotation_ids[0], "decision": "approve"},
+                {"sentence_id": sentence_ids[1], "annotation_id": annotation_ids[0], "decision": "approve"},
+                {"sentence_id": sentence_ids[2], "annotation_id": annotation_ids[2], "decision": "reject"},
+                {"sentence_id": sentence_ids[3], "annotation_id": annotation_ids[3], "decision": "approve"},
+                {"sentence_id": sentence_ids[0], "annotation_id": annotation_ids[0], "decision": "approve"},
+                {"sentence_id": 999, "annotation_id": annotation_ids[0], "decision": "approve"},
+            ]
+        },
+    )
+
+    assert (body["applied"], body["failed"]) == (2, 4)
+    assert [(item["applied"], item["error_code"]) for item in body["items"]] == [
+        (True, None),
+        (False, 400),
+        (True, None),
+        (False, 400),
+        (False, 409),
+        (False, 404),
+    ]
+    with Session(engine) as session:
+        statuses = [session.get(Sentence, sentence_id).status for sentence_id in sentence_ids]
+        assert statuses == [
+            SentenceStatus.ADJUDICATED,
+            SentenceStatus.IN_REVIEW,
+            SentenceStatus.ASSIGNED,
+            SentenceStatus.NEW,
+        ]
+        reviews = session.exec(select(Review).order_by(Review.id)).all()
+        assert [review.id for review in reviews] == [body["items"][0]["review_id"], body["items"][2]["review_id"]]
+        active = session.exec(
+            select(Assignment.sentence_id, Assignment.role).where(Assignment.is_active.is_(True))
+        ).all()
+        assert sorted(active) == [
+            (sentence_ids[1], Role.ANNOTATOR),
+            (sentence_ids[1], Role.REVIEWER),
+            (sentence_ids[3], Role.ANNOTATOR),
+            (sentence_ids[3], Role.REVIEWER),
+        ]
+        assert session.exec(select(FailedSubmission)).one().sentence_id == sentence_ids[2]
+        audits = session.exec(select(AuditLog).where(AuditLog.action == "review_recorded")).all()
+        assert sorted(audit.entity_id for audit in audits) == [sentence_ids[0], sentence_ids[2]]
+
+
+def test_batch_accept_skips_sentences_that_are_not_adjudicated(engine, client, act_as):
+    with Session(engine) as session:
+        project_id, sentence_ids, _ = seed(
+            session, [SentenceStatus.ADJUDICATED, SentenceStatus.IN_REVIEW, SentenceStatus.ADJUDICATED]
+        )
+
+    act_as(CurrentUser(user_id=30, role=Role.CURATOR, project_id=project_id, project_role=Role.CURATOR))
+    url = f"/sentences/project/{project_id}/accept-batch"
+    body = call(client, url, {"sentence_ids": sentence_ids + [sentence_ids[0]]})
+
+    assert (body["applied"], body["failed"]) == (2, 1)
+    assert body["items"][1]["before_status"] == "IN_REVIEW" and body["items"][1]["error_code"] == 400
+    with Session(engine) as session:
+        assert [session.get(Sentence, sentence_id).status for sentence_id in sentence_ids] == [
+            SentenceStatus.ACCEPTED,
+            SentenceStatus.IN_REVIEW,
+            SentenceStatus.ACCEPTED,
+        ]
+        still_active = session.exec(select(Assignment.sentence_id).where(Assignment.is_active.is_(True))).all()
+        assert sorted(still_active) == [sentence_ids[1], sentence_ids[1]]
+        audits = session.exec(select(AuditLog).where(AuditLog.action == "sentence_accepted")).all()
+        assert all(audit.meta["batch"] for audit in audits) and len(audits) == 2
@@ -0,0 +1,189 @@
+import sys
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session, SQLModel
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.config import Settings  # noqa: E402
+from app.database import engine, get_session  # noqa: E402
+from app.dependencies import CurrentUser, get_current_user  # noqa: E402
+from app.enums import JobStatus, Role  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import ExportJob, Project  # noqa: E402
+from app.services.export_download import (  # noqa: E402
+    ByteRange,
+    RangeNotSatisfiableError,
+    download_tracker,
+    file_checksum,
+    iter_leased_file,
+    parse_range,
+)
+from app.services.export_retention import RetentionPolicy, start_retention_sweeper  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _reset_db():
+    SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)
+    yield
+    SQLModel.metadata.drop_all(engine)
+
+
+@pytest.fixture(autouse=True)
+def _clear_overrides():
+    yield
+    app.dependency_overrides.clear()
+
+
+def override_get_session():
+    with Session(engine) as session:
+        yield session
+
+
+def setup_client() -> TestClient:
+    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_current_user] = lambda: CurrentUser(user_id=1, role=Role.ADMIN)
+    return TestClient(app)
+
+
+def seed_job(tmp_path: Path, content: bytes, *, checksum: bool = True) -> tuple[int, str]:
+    artifact = tmp_path / "export.json"
+    artifact.write_bytes(content)
+    digest = file_checksum(artifact)
+    with Session(engine) as session:
+        project = Project(name="Download")
+        session.add(project)
+        session.flush()
+        job = ExportJob(
+            project_id=project.id,
+            created_by=1,
+            status=JobStatus.COMPLETED,
+            result_path=str(artifact),
+            checksum=digest if checksum else None,
+        )
+        session.add(job)
+        session.commit()
+        session.refresh(job)
+        return job.id, digest
+
+
+def test_parse_range_variants():
+    assert parse_range(None, 100) is None
+    assert parse_range("bytes=0-9", 100) == ByteRange(0, 9)
+    assert parse_range("bytes=90-", 100) == ByteRange(90, 99)
+    assert parse_range("bytes=-10", 100) == ByteRange(90, 99)
+    assert parse_range("bytes=95-500", 100) == ByteRange(95, 99)
+    assert parse_range("bytes=0-1,5-6", 100) is None
+    assert parse_range("items=0-1", 100) is None
+    # Syntactically invalid ranges are ignored and the whole file is served.
+    for invalid in ("bytes=abc", "bytes=-", "bytes=5-3", "bytes=+5-9", "bytes=1-x"):
+        assert parse_range(invalid, 100) is None
+    for unsatisfiable in ("bytes=100-", "bytes=-0"):
+        with pytest.raises(RangeNotSatisfiableError):
+            parse_range(unsatisfiable, 100)
+
+
+def test_full_download_sets_strong_etag(tmp_path: Path):
+    content = b"0123456789" * 10
+    job_id, digest = seed_job(tmp_path, content)
+    client = setup_client()
+
+    response = client.get(f"/exports/jobs/{job_id}/download")
+    assert response.status_code == 200
+    assert response.content == content
+    assert response.headers["etag"] == f'"{digest}"'
+    assert response.headers["accept-ranges"] == "bytes"
+
+    cached = client.get(f"/exports/jobs/{job_id}/download", headers={"If-None-Match": f'"{digest}"'})
+    assert cached.status_code == 304
+
+
+def test_range_and_if_range(tmp_path: Path):
+    content = bytes(range(256))
+    job_id, digest = seed_job(tmp_path, content, checksum=False)
+    client = setup_client()
+
+    # A legacy job without a checksum is served unvalidated and hashed after the response.
+    partial = client.get(f"/exports/jobs/{job_id}/download", headers={"Range": "bytes=200-"})
+    assert partial.status_code == 206
+    assert partial.content == content[200:]
+    assert partial.headers["content-range"] == "bytes 200-255/256"
+    assert "etag" not in partial.headers
+    with Session(engine) as session:
+        assert session.get(ExportJob, job_id).checksum == digest
+
+    ignored = client.get(f"/exports/jobs/{job_id}/download", headers={"Range": "bytes=abc"})
+    assert ignored.status_code == 200
+    assert ignored.headers["etag"] == f'"{digest}"'
+
+    resumed = client.get(
+        f"/exports/jobs/{job_id}/download",
+        headers={"Range": "bytes=10-19", "If-Range": f'"{digest}"'},
+    )
+    assert resumed.status_code == 206
+    assert resumed.content == content[10:20]
+
+    stale = client.get(
+        f"/exports/jobs/{job_id}/download",
+        headers={"Range": "bytes=10-19", "If-Range": '"outdated"'},
+    )
+    assert stale.status_code == 200
+    assert stale.content == content
+
+    unsatisfiable = client.get(f"/exports/jobs/{job_id}/download", headers={"Range": "bytes=500-600"})
+    assert unsatisfiable.status_code == 416
+    assert unsatisfiable.headers["content-range"] == "bytes */256"
+
+
+def test_only_served_bodies_stamp_the_download_time_and_stamps_are_throttled(tmp_path: Path):
+    job_id, digest = seed_job(tmp_path, b"0123456789")
+    client = setup_client()
+
+    def stamp() -> datetime | None:
+        with Session(engine) as session:
+            return session.get(ExportJob, job_id).last_downloaded_at
+
+    assert client.get(f"/exports/jobs/{job_id}/download", headers={"If-None-Match": f'"{digest}"'}).status_code == 304
+    assert client.get(f"/exports/jobs/{job_id}/download", headers={"Range": "bytes=50-"}).status_code == 416
+    assert stamp() is None
+
+    assert client.get(f"/exports/jobs/{job_id}/download").status_code == 200
+    first = stamp()
+    assert first is not None
+    assert client.get(f"/exports/jobs/{job_id}/download", headers={"Range": "bytes=2-"}).status_code == 206
+    assert stamp() == first
+
+    # Older than half the grace period: the next served body refreshes it.
+    with Session(engine) as session:
+        job = session.get(ExportJob, job_id)
+        job.last_downloaded_at = first - timedelta(hours=1)
+        session.add(job)
+        session.commit()
+    assert client.get(f"/exports/jobs/{job_id}/download", headers={"Range": "bytes=2-"}).status_code == 206
+    assert stamp() >= first
+
+
+def test_open_lease_blocks_the_sweeper_until_the_stream_ends(tmp_path: Path):
+    content = b"x" * 64
+    job_id, _ = seed_job(tmp_path, content)
+    artifact = tmp_path / "export.json"
+
+    lease = download_tracker.open(artifact)
+    assert download_tracker.unlink_if_idle(artifact) is False
+    assert b"".join(iter_leased_file(lease, ByteRange(0, 3))) == b"xxxx"
+    assert download_tracker.unlink_if_idle(artifact) is True
+
+    missing = setup_client().get(f"/exports/jobs/{job_id}/download")
+    assert missing.status_code == 404
+
+
+def test_retention_is_opt_in():
+    assert RetentionPolicy.from_settings(Settings()).enabled is False
+    assert start_retention_sweeper(Settings(), threading.Event()) is None
@@ -1,5 +1,6 @@
 import json
 import sys
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -9,16 +10,29 @@ ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from app.enums import ExportFormat, ExportLevel, PiiStrategy, ReviewDecision, Role, SentenceStatus  # noqa: E402
+from app.enums import (  # noqa: E402
+    ExportFormat,
+    ExportLevel,
+    JobStatus,
+    PiiStrategy,
+    ReviewDecision,
+    Role,
+    SentenceStatus,
+)
 from app.models import (  # noqa: E402
+    Adjudication,
     Annotation,
+    ExportJob,
     FailedSubmission,
     Project,
     Review,
     Sentence,
 )
 from app.services.export import ExportRequest, ExportService  # noqa: E402
+from app.services.export_download import DownloadTracker  # noqa: E402
+from app.services.export_retention import ExportRetentionSweeper, RetentionPolicy  # noqa: E402
 from app.services.export_worker import ExportWorker  # noqa: E402
+from app.services.preference_pairs import PreferencePairBuilder, PreferencePairRequest  # noqa: E402
 from app.services.job_queue import ExportJobQueue  # noqa: E402
 
 
@@ -206,3 +220,114 @@ def test_worker_creates_result_file_with_manifest(session: Session, tmp_path: Pa
     assert data["records"]
     assert manifest["export"]["include_failed"] is True
     assert manifest["export"]["include_rejected"] is True
+
+
+def seed_completed_job(session: Session, project: Project, path: Path, *, created_at: datetime) -> ExportJob:
+    path.write_bytes(b"x" * 100)
+    job = ExportJob(
+        project_id=project.id,
+        created_by=1,
+        status=JobStatus.COMPLETED,
+        result_path=str(path),
+        size_bytes=100,
+        created_at=created_at,
+    )
+    session.add(job)
+    session.commit()
+    session.refresh(job)
+    return job
+
+
+def test_retention_sweeper_expires_old_and_surplus_artifacts(session: Session, tmp_path: Path):
+    project = seed_project(session)
+    now = datetime.utcnow()
+    stale = seed_completed_job(session, project, tmp_path / "stale.json", created_at=now - timedelta(days=40))
+    older = seed_completed_job(session, project, tmp_path / "older.json", created_at=now - timedelta(days=3))
+    recent = seed_completed_job(session, project, tmp_path / "recent.json", created_at=now - timedelta(days=2))
+    newest = seed_completed_job(session, project, tmp_path / "newest.json", created_at=now - timedelta(days=1))
+
+    tracker = DownloadTracker()
+    lease = tracker.acquire(tmp_path / "older.json")
+    policy = RetentionPolicy(max_age=timedelta(days=30), max_total_bytes=150, keep_last=3)
+    result = ExportRetentionSweeper(session, policy, tracker=tracker).sweep(now=now)
+
+    assert set(result.expired_job_ids) == {stale.id, recent.id}
+    assert result.skipped_in_use_job_ids == [older.id]
+    assert result.freed_bytes == 200
+    assert not (tmp_path / "stale.json").exists()
+    assert (tmp_path / "older.json").exists()
+    assert (tmp_path / "newest.json").exists()
+    session.refresh(stale)
+    assert stale.status == JobStatus.EXPIRED
+    assert stale.result_path is None
+    assert stale.expired_at is not None
+    session.refresh(newest)
+    assert newest.status == JobStatus.COMPLETED
+
+    lease.release()
+    second = ExportRetentionSweeper(session, policy, tracker=tracker).sweep(now=now)
+    assert second.expired_job_ids == [older.id]
+
+
+def test_preference_pairs_join_failures_with_final_penman(session: Session):
+    project = seed_project(session)
+    sentences = seed_sentences(session, project)
+    seed_annotations(session, sentences)
+    seed_failures(session, project, sentences)
+    adjudicated = Sentence(project_id=project.id, text="Karar cümlesi", status=SentenceStatus.ADJUDICATED)
+    session.add(adjudicated)
+    session.commit()
+    session.refresh(adjudicated)
+    session.add(Adjudication(sentence_id=adjudicated.id, curator_id=3, final_penman="(k / karar)"))
+    session.add(
+        FailedSubmission(
+            project_id=project.id,
+            sentence_id=adjudicated.id,
+            user_id=21,
+            failure_type="validation",
+            reason="parse error",
+            submitted_penman="(k / karar",
+        )
+    )
+    session.add(
+        FailedSubmission(
+            project_id=project.id,
+            sentence_id=sentences["gold"].id,
+            user_id=22,
+            reviewer_id=7,
+            failure_type="review_reject",
+            reason="wrong concept",
+            submitted_penman="(a / wrong)",
+        )
+    )
+    session.commit()
+
+    builder = PreferencePairBuilder(session)
+    pairs = list(
+        builder.iter_pairs(PreferencePairRequest(project_id=project.id, pii_strategy=PiiStrategy.STRIP, batch_size=1))
+    )
+    by_prompt = {pair["prompt"]: pair for pair in pairs}
+    # Failures on sentences without a final PENMAN (draft, in-review) are skipped.
+    assert set(by_prompt) == {"Karar cümlesi", "Altın cümle"}
+    assert by_prompt["Karar cümlesi"]["chosen"] == "(k / karar)"
+    assert by_prompt["Karar cümlesi"]["rejected"] == "(k / karar"
+    assert by_prompt["Karar cümlesi"]["meta"]["chosen_source"] == "adjudication"
+    assert by_prompt["Altın cümle"]["chosen"] == "(a / annotate)"
+    assert by_prompt["Altın cümle"]["meta"]["chosen_source"] == "approved_annotation"
+    assert by_prompt["Altın cümle"]["meta"]["user_id"] is None
+    assert by_prompt["Altın cümle"]["meta"]["reason"] is None
+
+    rejected_only = list(
+        builder.iter_jsonl(PreferencePairRequest(project_id=project.id, include_failed=False))
+    )
+    assert len(rejected_only) == 1
+    assert json.loads(rejected_only[0])["meta"]["failure_type"] == "review_reject"
+    # Reviewer comments end up in ``reason``; anonymizing cannot scrub free text, so it is dropped too.
+    assert json.loads(rejected_only[0])["meta"]["reason"] is None
+
+    included = list(
+        builder.iter_pairs(
+            PreferencePairRequest(project_id=project.id, pii_strategy=PiiStrategy.INCLUDE, include_failed=False)
+        )
+    )
+    assert included[0]["meta"]["reason"] == "wrong concept"
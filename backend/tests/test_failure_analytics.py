@@ -0,0 +1,119 @@
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.models import FailedSubmission, FailureRollup, Project, Sentence  # noqa: E402
+from app.services.failed_submissions import FailedSubmissionStore  # noqa: E402
+from app.services.failure_analytics import FailureAnalyticsService, rebuild_failure_rollups  # noqa: E402
+
+
+@pytest.fixture()
+def session():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+def _report(*codes: str) -> dict:
+    return {"is_valid": False, "errors": [{"code": code, "message": code, "severity": "error"} for code in codes]}
+
+
+def seed(session: Session) -> tuple[Project, Sentence]:
+    project = Project(name="Analytics")
+    session.add(project)
+    session.flush()
+    sentence = Sentence(project_id=project.id, text="analiz")
+    session.add(sentence)
+    session.commit()
+    return project, sentence
+
+
+def test_rollups_are_maintained_on_write(session: Session):
+    project, sentence = seed(session)
+    store = FailedSubmissionStore(session)
+
+    def record(failure_type: str, user_id: int, penman_text: str, report: dict | None = None) -> None:
+        store.record(
+            project=project,
+            sentence=sentence,
+            failure_type=failure_type,
+            reason="x",
+            report=report,
+            user_id=user_id,
+            penman_text=penman_text,
+        )
+
+    record("validation", 1, "(a", _report("parse_error"))
+    record("validation", 1, "(a / b :ARG9 c)", _report("role_mismatch", "dangling_variable"))
+    record("validation", 2, "(b", _report("parse_error"))
+    record("review_reject", 2, "(c / c)")
+    session.commit()
+
+    summary = FailureAnalyticsService(session).summarize(project_id=project.id)
+    assert summary.total == 4
+    assert summary.by_failure_type == {"review_reject": 1, "validation": 3}
+    assert summary.by_error_code == {"dangling_variable": 1, "parse_error": 2, "role_mismatch": 1}
+    assert [(row.user_id, row.failure_type, row.count) for row in summary.by_user] == [
+        (1, "validation", 2),
+        (2, "review_reject", 1),
+        (2, "validation", 1),
+    ]
+    assert sum(row.count for row in summary.by_day) == 4
+
+    only_user = FailureAnalyticsService(session).summarize(project_id=project.id, user_id=2)
+    assert only_user.total == 2
+
+    future = FailureAnalyticsService(session).summarize(project_id=project.id, start=date.today() + timedelta(days=1))
+    assert future.total == 0
+
+
+def test_rebuild_includes_legacy_rows(session: Session):
+    project, sentence = seed(session)
+    session.add(
+        FailedSubmission(
+            project_id=project.id,
+            sentence_id=sentence.id,
+            user_id=5,
+            failure_type="validation",
+            reason="legacy",
+            details={"error_codes": ["parse_error"]},
+            created_at=datetime(2024, 1, 2, 10, 0),
+        )
+    )
+    session.commit()
+
+    assert rebuild_failure_rollups(session, project.id) == 1
+    session.commit()
+    rows = list(session.exec(select(FailureRollup).where(FailureRollup.project_id == project.id)))
+    assert {(row.error_code, row.count) for row in rows} == {("*", 1), ("parse_error", 1)}
+
+    summary = FailureAnalyticsService(session).summarize(
+        project_id=project.id, start=date(2024, 1, 1), end=date(2024, 1, 31)
+    )
+    assert summary.by_error_code == {"parse_error": 1}
+    assert summary.by_day[0].day == date(2024, 1, 2)
+
+
+def test_repeated_codes_are_stored_once_in_report_order(session: Session):
+    project, sentence = seed(session)
+    report = _report(*["dangling_variable", "role_mismatch"] * 60, "parse_error")
+    report["warnings"] = [{"code": "unknown_role", "message": "w", "severity": "warning"}] * 80
+    failure = FailedSubmissionStore(session).record(
+        project=project, sentence=sentence, failure_type="validation", reason="x", report=report, user_id=1
+    )
+    session.commit()
+
+    max_length = FailedSubmission.model_fields["error_codes"].metadata[0].max_length
+    assert failure.error_codes == "dangling_variable,role_mismatch,parse_error"
+    assert failure.warning_codes == "unknown_role"
+    assert len(failure.error_codes) <= max_length
+    summary = FailureAnalyticsService(session).summarize(project_id=project.id)
+    assert summary.by_error_code == {"dangling_variable": 1, "parse_error": 1, "role_mismatch": 1}
@@ -0,0 +1,120 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlmodel import Session, func, select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.dependencies import CurrentUser  # noqa: E402
+from app.enums import Role, SentenceStatus  # noqa: E402
+from app.models import Annotation, Assignment, AuditLog, IdempotencyRecord, Project, Review, Sentence  # noqa: E402
+from app.services import idempotency  # noqa: E402
+from app.services.idempotency import IdempotencyStore  # noqa: E402
+
+PENMAN = "(u / uyu-01 :ARG0 (k / kedi))"
+
+
+def seed(engine) -> tuple[int, int]:
+    with Session(engine) as session:
+        project = Project(name="Tekrar")
+        session.add(project)
+        session.commit()
+        sentence = Sentence(project_id=project.id, text="Kedi uyudu.", status=SentenceStatus.ASSIGNED)
+        session.add(sentence)
+        session.commit()
+        session.add(Assignment(sentence_id=sentence.id, user_id=7, role=Role.ANNOTATOR))
+        session.commit()
+        return project.id, sentence.id
+
+
+def member(user_id: int, role: Role, project_id: int) -> CurrentUser:
+    return CurrentUser(user_id=user_id, role=role, project_id=project_id, project_role=role)
+
+
+def count(engine, model) -> int:
+    with Session(engine) as session:
+        return session.exec(select(func.count()).select_from(model)).one()
+
+
+def test_retried_submit_replays_the_stored_response(engine, client, act_as):
+    project_id, sentence_id = seed(engine)
+    act_as(member(7, Role.ANNOTATOR, project_id))
+    url = f"/sentences/{sentence_id}/submit"
+    headers = {"Idempotency-Key": "submit-1"}
+
+    first = client.post(url, json={"penman_text": PENMAN}, headers=headers)
+    assert first.status_code == 201
+    assert "Idempotent-Replayed" not in first.headers
+
+    retry = client.post(url, json={"penman_text": PENMAN}, headers=headers)
+    assert retry.status_code == 201
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.json() == first.json()
+    assert count(engine, Annotation) == 1
+    assert count(engine, AuditLog) == 1
+
+    reused = client.post(url, json={"penman_text": "(k / kedi)"}, headers=headers)
+    assert reused.status_code == 422
+    # Without a key the retry runs again and fails the state transition.
+    assert client.post(url, json={"penman_text": PENMAN}).status_code == 400
+
+
+def expire_records(engine, *conditions) -> None:
+    with Session(engine) as session:
+        for record in session.exec(select(IdempotencyRecord).where(*conditions)):
+            record.expires_at = datetime.utcnow() - timedelta(seconds=1)
+            session.add(record)
+        session.commit()
+
+
+def test_keys_are_scoped_per_user_and_expire(engine, client, act_as):
+    project_id, sentence_id = seed(engine)
+    act_as(member(7, Role.ANNOTATOR, project_id))
+    assert client.post(
+        f"/sentences/{sentence_id}/submit", json={"penman_text": PENMAN}, headers={"Idempotency-Key": "k"}
+    ).status_code == 201
+    with Session(engine) as session:
+        annotation_id = session.exec(select(Annotation.id)).one()
+
+    act_as(member(3, Role.REVIEWER, project_id))
+    review = {"annotation_id": annotation_id, "decision": "approve"}
+    first = client.post(f"/sentences/{sentence_id}/review", json=review, headers={"Idempotency-Key": "k"})
+    assert first.status_code == 200
+    assert first.json()["status"] == SentenceStatus.ADJUDICATED
+    assert count(engine, Review) == 1
+
+    expire_records(engine, IdempotencyRecord.user_id == 3)
+    again = client.post(f"/sentences/{sentence_id}/review", json=review, headers={"Idempotency-Key": "k"})
+    assert again.status_code == 200
+    assert "Idempotent-Replayed" not in again.headers
+    assert count(engine, Review) == 2
+    assert count(engine, IdempotencyRecord) == 2
+
+    expire_records(engine)
+    with Session(engine) as session:
+        assert IdempotencyStore(session).purge_expired() == 2
+        session.commit()
+    assert count(engine, IdempotencyRecord) == 0
+
+
+def test_adjudicate_replays_and_rejects_malformed_keys(engine, client, act_as, monkeypatch):
+    monkeypatch.setattr(idempotency, "MAX_KEY_LENGTH", 8)
+    project_id, sentence_id = seed(engine)
+    with Session(engine) as session:
+        sentence = session.get(Sentence, sentence_id)
+        sentence.status = SentenceStatus.IN_REVIEW
+        session.add(sentence)
+        session.commit()
+
+    act_as(member(1, Role.CURATOR, project_id))
+    url = f"/sentences/{sentence_id}/adjudicate"
+    body = {"final_penman": PENMAN}
+    assert client.post(url, json=body, headers={"Idempotency-Key": "x" * 9}).status_code == 400
+
+    first = client.post(url, json=body, headers={"Idempotency-Key": "adj"})
+    retry = client.post(url, json=body, headers={"Idempotency-Key": "adj"})
+    assert (first.status_code, retry.status_code) == (201, 201)
+    assert retry.json() == first.json()
@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.enums import Role  # noqa: E402
+from app.models import MembershipVersion, ProjectMembership  # noqa: E402
+from app.services.counters import increment_counter  # noqa: E402
+from app.services.membership_cache import MembershipCache, membership_cache  # noqa: E402
+
+
+def test_membership_cache_serves_snapshots_until_memberships_change(session: Session, seed_project):
+    project = seed_project(session, annotators=2, sentences=1)
+    first, second = sorted(session.exec(select(ProjectMembership.user_id)))
+    members = membership_cache.get(session, project.id)
+    assert members.active_ids(Role.ANNOTATOR) == {first, second}
+    assert membership_cache.get(session, project.id) is members
+
+    membership = session.exec(select(ProjectMembership).where(ProjectMembership.user_id == second)).one()
+    membership.is_active = False
+    session.add(membership)
+    assert membership_cache.get(session, project.id).active_ids(Role.ANNOTATOR) == {first}
+    session.commit()
+
+    refreshed = membership_cache.get(session, project.id)
+    assert refreshed is not members
+    assert refreshed.get(second).is_active is False
+    assert membership_cache.get(session, project.id) is refreshed
+
+
+def test_membership_cache_polls_db_version_for_external_writes(session: Session, seed_project):
+    project = seed_project(session, annotators=2, sentences=1)
+    first, second = sorted(session.exec(select(ProjectMembership.user_id)))
+    polling = MembershipCache(ttl_seconds=300, version_poll_seconds=0)
+    ttl_only = MembershipCache(ttl_seconds=300)
+    polling.get(session, project.id)
+    ttl_only.get(session, project.id)
+
+    # Another process: a bulk update that never goes through this process's ORM events.
+    session.execute(update(ProjectMembership).where(ProjectMembership.user_id == first).values(role=Role.REVIEWER))
+    increment_counter(session, MembershipVersion, {"project_id": project.id}, field="version")
+    session.commit()
+
+    assert polling.get(session, project.id).active_ids(Role.REVIEWER) == {first}
+    assert ttl_only.get(session, project.id).active_ids(Role.ANNOTATOR) == {first, second}
@@ -0,0 +1,63 @@
+import sys
+from pathlib import Path
+
+from sqlmodel import Session
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.dependencies import CurrentUser  # noqa: E402
+from app.enums import Role, SentenceStatus  # noqa: E402
+from app.models import Assignment, Project, Sentence  # noqa: E402
+
+
+def test_my_tasks_pages_active_assignments_with_status_counts(engine, client, act_as):
+    with Session(engine) as session:
+        first, second = Project(name="Bir"), Project(name="İki")
+        session.add_all([first, second])
+        session.commit()
+        statuses = [
+            SentenceStatus.ASSIGNED,
+            SentenceStatus.ASSIGNED,
+            SentenceStatus.SUBMITTED,
+            SentenceStatus.IN_REVIEW,
+        ]
+        sentences = [
+            Sentence(project_id=first.id, text=f"Cümle {index}", status=status)
+            for index, status in enumerate(statuses)
+        ]
+        sentences.append(Sentence(project_id=second.id, text="Başka proje", status=SentenceStatus.ASSIGNED))
+        session.add_all(sentences)
+        session.commit()
+        session.add_all(
+            [
+                Assignment(sentence_id=sentences[0].id, user_id=5),
+                Assignment(sentence_id=sentences[1].id, user_id=5, is_blind=True),
+                Assignment(sentence_id=sentences[2].id, user_id=5),
+                Assignment(sentence_id=sentences[3].id, user_id=5, role=Role.REVIEWER),
+                Assignment(sentence_id=sentences[4].id, user_id=5),
+                Assignment(sentence_id=sentences[0].id, user_id=6),
+                Assignment(sentence_id=sentences[2].id, user_id=5, is_active=False),
+            ]
+        )
+        session.commit()
+        project_id = first.id
+
+    act_as(CurrentUser(user_id=5, role=Role.ANNOTATOR))
+    url = "/sentences/tasks/mine"
+    page = client.get(url, params={"project_id": project_id, "limit": 2}).json()
+    assert [item["text"] for item in page["items"]] == ["Cümle 0", "Cümle 1"]
+    assert page["items"][1]["is_blind"] is True
+    assert page["status_counts"] == {"ASSIGNED": 2, "SUBMITTED": 1, "IN_REVIEW": 1}
+
+    page = client.get(url, params={"project_id": project_id, "limit": 2, "cursor": page["next_cursor"]}).json()
+    assert [(item["text"], item["role"]) for item in page["items"]] == [
+        ("Cümle 2", "annotator"),
+        ("Cümle 3", "reviewer"),
+    ]
+    assert page["next_cursor"] is None
+
+    page = client.get(url, params={"status": "ASSIGNED", "role": "annotator"}).json()
+    assert [item["text"] for item in page["items"]] == ["Cümle 0", "Cümle 1", "Başka proje"]
+    assert page["status_counts"] == {"ASSIGNED": 3, "SUBMITTED": 1}
@@ -0,0 +1,139 @@
+import sys
+from pathlib import Path
+
+import pytest
+from sqlmodel import Session, SQLModel, create_engine, select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.enums import CorpusImportMode, JobStatus, SentenceStatus  # noqa: E402
+from app.models import (  # noqa: E402
+    Adjudication,
+    Annotation,
+    AuditLog,
+    CorpusImportCheckpoint,
+    Project,
+    Sentence,
+    SentenceMinHash,
+)
+from app.services.penman_import import PenmanCorpusImporter, parse_metadata  # noqa: E402
+
+CORPUS = """# AMR release; Türkçe AMR 0.1
+
+# ::id tr.1 ::date 2021-05-01
+# ::snt Ali eve geldi.
+(g / gel-01
+   :ARG1 (k / kişi :name (n / name :op1 "Ali"))
+   :ARG4 (e / ev))
+
+# ::id tr.2
+(y / yağ-01)
+
+# ::id tr.3
+# ::snt Yağmur yağdı.
+(y / yağ-01
+   :ARG1 (y2 / yağmur)
+
+# ::id tr.4
+# ::snt Kedi uyudu.
+(u / uyu-01 :ARG0 (k / kedi))
+
+# ::id tr.5
+# ::snt Ali  eve geldi.
+(g / gel-01 :ARG1 (a / Ali))
+
+# ::id tr.6
+# ::snt Çocuk okula gitti.
+(g / git-01 :ARG0 (c / çocuk) :ARG4 (o / okul))
+"""
+
+
+@pytest.fixture()
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'corpus.db'}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture()
+def corpus(tmp_path) -> Path:
+    path = tmp_path / "tr-amr-0.1.txt"
+    path.write_text(CORPUS, encoding="utf-8")
+    return path
+
+
+def make_project(session: Session) -> Project:
+    project = Project(name="Derlem")
+    session.add(project)
+    session.commit()
+    session.refresh(project)
+    return project
+
+
+def test_parse_metadata_reads_several_keys_per_line():
+    assert parse_metadata(["# ::id tr.1 ::date 2021-05-01", "# ::snt Ali eve geldi.", "(g / gel-01)"]) == {
+        "id": "tr.1",
+        "date": "2021-05-01",
+        "snt": "Ali eve geldi.",
+    }
+
+
+def test_gold_import_creates_adjudicated_sentences_with_provenance(session: Session, corpus: Path):
+    project = make_project(session)
+    checkpoint = PenmanCorpusImporter(session, workers=2, batch_size=2).run(
+        project_id=project.id, path=corpus, mode=CorpusImportMode.GOLD, actor_id=7
+    )
+
+    assert checkpoint.status == JobStatus.COMPLETED
+    assert (checkpoint.graphs_read, checkpoint.sentences_created, checkpoint.duplicates, checkpoint.invalid) == (
+        6,
+        3,
+        1,
+        2,
+    )
+    assert [error["id"] for error in checkpoint.errors] == ["tr.2", "tr.3"]
+    sentences = session.exec(select(Sentence).order_by(Sentence.id)).all()
+    assert [(s.external_id, s.source, s.status) for s in sentences] == [
+        ("tr.1", "tr-amr-0.1", SentenceStatus.ACCEPTED),
+        ("tr.4", "tr-amr-0.1", SentenceStatus.ACCEPTED),
+        ("tr.6", "tr-amr-0.1", SentenceStatus.ACCEPTED),
+    ]
+    annotations = session.exec(select(Annotation).order_by(Annotation.id)).all()
+    adjudications = session.exec(select(Adjudication).order_by(Adjudication.id)).all()
+    assert [a.author_id for a in annotations] == [7, 7, 7]
+    assert [a.source_annotation_ids for a in adjudications] == [[a.id] for a in annotations]
+    assert adjudications[0].final_penman == annotations[0].penman_text
+    assert len(session.exec(select(SentenceMinHash)).all()) == 3
+    assert session.exec(select(AuditLog).where(AuditLog.action == "corpus_imported")).one().meta["invalid"] == 2
+
+
+def test_interrupted_import_resumes_from_checkpoint(session: Session, corpus: Path, monkeypatch):
+    project = make_project(session)
+    importer = PenmanCorpusImporter(session, batch_size=2)
+    original_write = importer._write
+    calls = []
+
+    def crash_on_third_batch(*args):
+        calls.append(1)
+        if len(calls) == 3:
+            raise KeyboardInterrupt
+        original_write(*args)
+
+    monkeypatch.setattr(importer, "_write", crash_on_third_batch)
+    with pytest.raises(KeyboardInterrupt):
+        importer.run(project_id=project.id, path=corpus, mode=CorpusImportMode.ANNOTATED, actor_id=1)
+    session.rollback()
+    checkpoint = session.exec(select(CorpusImportCheckpoint)).one()
+    assert checkpoint.status == JobStatus.RUNNING
+    assert checkpoint.graphs_read == 3
+
+    checkpoint = PenmanCorpusImporter(session, batch_size=2).run(
+        project_id=project.id, path=corpus, mode=CorpusImportMode.ANNOTATED, actor_id=1
+    )
+    assert (checkpoint.status, checkpoint.graphs_read, checkpoint.sentences_created) == (JobStatus.COMPLETED, 6, 3)
+    statuses = session.exec(select(Sentence.status)).all()
+    assert statuses == [SentenceStatus.SUBMITTED] * 3
+    assert session.exec(select(Adjudication)).all() == []
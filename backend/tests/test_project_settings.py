@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+from sqlmodel import Session, select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.dependencies import CurrentUser  # noqa: E402
+from app.enums import Role  # noqa: E402
+from app.models import AuditLog, Project  # noqa: E402
+
+
+def seed(engine) -> int:
+    with Session(engine) as session:
+        session.add(Project(name="Diğer"))
+        project = Project(name="Ayarlar", description="eski")
+        session.add(project)
+        session.commit()
+        return project.id
+
+
+def test_patch_updates_assignment_settings_and_audits_the_change(engine, client, act_as):
+    project_id = seed(engine)
+    act_as(CurrentUser(user_id=1, role=Role.ADMIN))
+
+    response = client.patch(
+        f"/projects/{project_id}",
+        json={"annotators_per_sentence": 3, "auto_assign_enabled": True, "blind_annotation": True, "name": None},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["name"], body["annotators_per_sentence"], body["auto_assign_enabled"], body["blind_annotation"]) == (
+        "Ayarlar",
+        3,
+        True,
+        True,
+    )
+    assert client.patch(f"/projects/{project_id}", json={"description": None}).json()["description"] is None
+
+    with Session(engine) as session:
+        audits = session.exec(select(AuditLog).where(AuditLog.action == "project_updated").order_by(AuditLog.id)).all()
+    assert audits[0].meta["changes"]["annotators_per_sentence"] == {"before": 1, "after": 3}
+    assert set(audits[0].meta["changes"]) == {"annotators_per_sentence", "auto_assign_enabled", "blind_annotation"}
+    assert audits[1].meta["changes"] == {"description": {"before": "eski", "after": None}}
+
+
+def test_patch_rejects_invalid_updates(engine, client, act_as):
+    project_id = seed(engine)
+    act_as(CurrentUser(user_id=1, role=Role.ADMIN))
+    assert client.patch(f"/projects/{project_id}", json={"annotators_per_sentence": 0}).status_code == 422
+    assert client.patch(f"/projects/{project_id}", json={"name": "Diğer"}).status_code == 400
+    assert client.patch("/projects/999", json={"auto_assign_enabled": True}).status_code == 404
+
+    act_as(CurrentUser(user_id=1, role=Role.CURATOR))
+    assert client.patch(f"/projects/{project_id}", json={"auto_assign_enabled": True}).status_code == 403
@@ -0,0 +1,75 @@
+import sys
+from pathlib import Path
+
+from sqlmodel import Session, select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.enums import Role, SentenceStatus  # noqa: E402
+from app.models import Annotation, Assignment, AssignmentLoad, AuditLog, ProjectMembership, Sentence  # noqa: E402
+from app.services.bulk_assignment import BulkAssigner  # noqa: E402
+from app.services.rebalance import MemberRebalancer  # noqa: E402
+
+
+def test_rebalance_moves_open_work_of_deactivated_member(session: Session, seed_project):
+    project = seed_project(session, annotators=3, sentences=6)
+    BulkAssigner(session).assign(project_id=project.id, actor_id=1, actor_role=Role.ADMIN)
+    session.commit()
+    leaving = session.exec(select(ProjectMembership).order_by(ProjectMembership.user_id)).first()
+    submitted = session.exec(select(Assignment).where(Assignment.user_id == leaving.user_id)).first()
+    session.add(
+        Annotation(
+            sentence_id=submitted.sentence_id,
+            assignment_id=submitted.id,
+            author_id=leaving.user_id,
+            penman_text="(a / a)",
+        )
+    )
+    leaving.is_active = False
+    session.add(leaving)
+    session.commit()
+
+    result = MemberRebalancer(session).rebalance(
+        project_id=project.id, user_id=leaving.user_id, actor_id=1, actor_role=Role.ADMIN, membership_id=leaving.id
+    )
+    session.commit()
+
+    assert len(result.deactivated_assignment_ids) == 2
+    assert len(result.reassigned) == 1
+    assert submitted.sentence_id not in result.reassigned
+    assert leaving.user_id not in result.reassigned.values()
+    remaining = session.exec(
+        select(Assignment).where(Assignment.user_id == leaving.user_id, Assignment.is_active.is_(True))
+    ).all()
+    assert remaining == []
+    loads = dict(session.exec(select(AssignmentLoad.user_id, AssignmentLoad.active_count)).all())
+    assert loads[leaving.user_id] == 0
+    assert sum(loads.values()) == 5
+    audit = session.exec(select(AuditLog).where(AuditLog.action == "project_member_assignments_rebalanced")).one()
+    assert audit.meta["unassigned_sentence_ids"] == []
+
+
+def test_rebalance_requeues_sentences_nobody_can_take_over(session: Session, seed_project):
+    project = seed_project(session, annotators=1, sentences=2)
+    BulkAssigner(session).assign(project_id=project.id, actor_id=1, actor_role=Role.ADMIN)
+    session.commit()
+    leaving = session.exec(select(ProjectMembership)).one()
+    leaving.is_active = False
+    session.add(leaving)
+    session.commit()
+
+    result = MemberRebalancer(session).rebalance(
+        project_id=project.id, user_id=leaving.user_id, actor_id=1, actor_role=Role.ADMIN, membership_id=leaving.id
+    )
+    session.commit()
+
+    assert result.reassigned == {}
+    assert sorted(result.requeued_sentence_ids) == sorted(result.unassigned_sentence_ids)
+    assert len(result.requeued_sentence_ids) == 2
+    statuses = session.exec(select(Sentence.status)).all()
+    assert statuses == [SentenceStatus.NEW, SentenceStatus.NEW]
+    requeued = session.exec(select(AuditLog).where(AuditLog.action == "sentence_requeued")).all()
+    assert sorted(entry.entity_id for entry in requeued) == sorted(result.requeued_sentence_ids)
+    assert {entry.meta["reason"] for entry in requeued} == {"member_deactivated"}
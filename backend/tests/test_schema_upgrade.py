@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+from sqlalchemy import inspect, text
+from sqlmodel import SQLModel, create_engine
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.migrations import add_missing_columns  # noqa: E402
+
+
+def test_missing_columns_and_indexes_are_added_once():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                """
+                INSERT INTO project (name, language, amr_version, role_set_version, validation_rule_version,
+                    version_tag, annotators_per_sentence, auto_assign_enabled, blind_annotation, created_at, updated_at)
+                VALUES ('Eski', 'tr', '1.0', 'tr-propbank', 'v1', 'v1', 1, 0, 0, '2024-01-01', '2024-01-01')
+                """
+            )
+        )
+        # Simulate a database created before these columns and indexes existed.
+        connection.execute(text("DROP INDEX ix_sentence_project_status_id"))
+        connection.execute(text("ALTER TABLE project DROP COLUMN blind_annotation"))
+        connection.execute(text("ALTER TABLE sentence DROP COLUMN version"))
+        connection.execute(text("ALTER TABLE exportjob DROP COLUMN checksum"))
+
+    with engine.begin() as connection:
+        added = add_missing_columns(connection)
+    assert sorted(added) == ["exportjob.checksum", "project.blind_annotation", "sentence.version"]
+
+    with engine.begin() as connection:
+        assert add_missing_columns(connection) == []
+        assert connection.execute(text("SELECT blind_annotation FROM project")).scalar_one() == 0
+        connection.execute(
+            text(
+                """
+                INSERT INTO sentence (project_id, text, status, priority, created_at, updated_at)
+                VALUES (1, 'Kedi uyudu.', 'new', 0, '2024-01-01', '2024-01-01')
+                """
+            )
+        )
+        assert connection.execute(text("SELECT version FROM sentence")).scalar_one() == 1
+    index_names = {index["name"] for index in inspect(engine).get_indexes("sentence")}
+    assert "ix_sentence_project_status_id" in index_names
@@ -0,0 +1,159 @@
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from sqlmodel import Session, select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.dependencies import CurrentUser  # noqa: E402
+from app.enums import NearDuplicateMode, Role, SentenceImportFormat, SentenceStatus  # noqa: E402
+from app.models import AuditLog, Project, Sentence  # noqa: E402
+from app.services import sentence_import  # noqa: E402
+from app.services.near_duplicates import (  # noqa: E402
+    NearDuplicateIndex,
+    estimate_similarity,
+    fold_turkish,
+    minhash_signature,
+)
+from app.services.sentence_import import SentenceImporter, SentenceImportError, content_hash  # noqa: E402
+
+
+def make_project(session: Session) -> Project:
+    project = Project(name="Import")
+    session.add(project)
+    session.commit()
+    session.refresh(project)
+    return project
+
+
+def run_import(session: Session, project: Project, payload: str, import_format: SentenceImportFormat, **kwargs):
+    result = SentenceImporter(session, batch_size=2).run(
+        project_id=project.id,
+        stream=io.BytesIO(payload.encode("utf-8")),
+        import_format=import_format,
+        actor_id=1,
+        actor_role=Role.ADMIN,
+        **kwargs,
+    )
+    session.commit()
+    return result
+
+
+def test_csv_import_dedupes_against_file_and_existing_sentences(session: Session):
+    project = make_project(session)
+    # Stored before content hashes existed; picked up by the backfill.
+    session.add(Sentence(project_id=project.id, text="Ali eve geldi."))
+    session.commit()
+
+    payload = (
+        "text,source,priority,difficulty_tag\n"
+        "Ali  eve geldi.,web,1,\n"
+        '"Kedi\nuyudu.",web,5,ner\n'
+        "Kedi uyudu.,,,\n"
+        ",web,1,\n"
+        "Yağmur yağdı.,,yüksek,\n"
+        "Kuşlar uçtu.,,,\n"
+    )
+    result = run_import(session, project, payload, SentenceImportFormat.CSV, source="korpus")
+
+    assert (result.total_rows, result.created, result.duplicates_in_file, result.duplicates_existing) == (6, 2, 1, 1)
+    assert result.invalid == 2
+    assert [error.line for error in result.errors] == [6, 7]
+    rows = session.exec(select(Sentence).order_by(Sentence.id)).all()
+    assert all(row.content_hash == content_hash(row.text) for row in rows)
+    cat = next(row for row in rows if row.text == "Kedi uyudu.")
+    assert (cat.source, cat.priority, cat.difficulty_tag, cat.status) == ("web", 5, "ner", SentenceStatus.NEW)
+    assert next(row for row in rows if row.text == "Kuşlar uçtu.").source == "korpus"
+    audit = session.exec(select(AuditLog).where(AuditLog.action == "sentences_imported")).one()
+    assert audit.meta["created"] == 2
+
+
+def test_json_import_streams_arrays_and_json_lines(session: Session, monkeypatch):
+    monkeypatch.setattr(sentence_import, "_READ_CHUNK", 7)
+    project = make_project(session)
+    items = ["Bir.", {"text": "İki.", "priority": 2}, {"text": "Üç \\\" tırnak."}, 4]
+    result = run_import(session, project, json.dumps(items, ensure_ascii=False, indent=2), SentenceImportFormat.JSON)
+    assert (result.created, result.invalid) == (3, 1)
+
+    lines = '{"text": "Bir."}\n{"text": "Dört."}\n'
+    result = run_import(session, project, lines, SentenceImportFormat.JSON)
+    assert (result.created, result.duplicates_existing) == (1, 1)
+
+    with pytest.raises(SentenceImportError):
+        run_import(session, project, '["Beş.", {"text": ', SentenceImportFormat.JSON)
+
+
+def test_import_commits_each_batch_and_resumes_after_a_broken_file(session: Session):
+    project = make_project(session)
+    broken = '["Bir.", "İki.", "Üç.", {"text": '
+    with pytest.raises(SentenceImportError) as exc_info:
+        run_import(session, project, broken, SentenceImportFormat.JSON)
+    # The first batch of two was committed before the parser hit the truncated item.
+    assert "2 cümle kaydedildi" in str(exc_info.value)
+    session.rollback()
+    assert len(session.exec(select(Sentence.id)).all()) == 2
+    failed = session.exec(select(AuditLog).where(AuditLog.action == "sentences_imported")).one()
+    assert (failed.meta["created"], failed.meta["error"] is not None) == (2, True)
+
+    fixed = json.dumps(["Bir.", "İki.", "Üç.", "Dört."], ensure_ascii=False)
+    result = run_import(session, project, fixed, SentenceImportFormat.JSON)
+    assert (result.created, result.duplicates_existing) == (2, 2)
+
+
+def test_import_endpoint_reads_raw_body(engine, client, act_as):
+    with Session(engine) as session:
+        project = make_project(session)
+    act_as(CurrentUser(user_id=1, role=Role.ADMIN))
+    response = client.post(
+        f"/sentences/project/{project.id}/import",
+        content="Birinci cümle.\n\nİkinci cümle.\nBirinci   cümle.\n".encode("utf-8"),
+        headers={"Content-Type": "text/plain; charset=utf-8"},
+    )
+    assert response.status_code == 201
+    assert response.json()["created"] == 2
+    assert response.json()["duplicates_in_file"] == 1
+
+    response = client.post(f"/sentences/project/{project.id}/import?format=csv", content=b"metin\nx\n")
+    assert response.status_code == 400
+
+
+def test_turkish_folding_makes_casing_and_punctuation_variants_identical():
+    assert fold_turkish("İSTANBUL'DA, IŞIKLAR yandı!") == fold_turkish("istanbul'da ışıklar yandı")
+    assert fold_turkish("Işık") != fold_turkish("işik")
+    assert minhash_signature("İZMİR'E GİTTİ.") == minhash_signature("İzmir'e gitti")
+    close = estimate_similarity(
+        minhash_signature("Çocuklar bahçede top oynuyordu."), minhash_signature("Çocuklar bahçede top oynuyorlardı.")
+    )
+    far = estimate_similarity(
+        minhash_signature("Çocuklar bahçede top oynuyordu."), minhash_signature("Toplantı yarın saat onda.")
+    )
+    assert close > 0.6 > 0.2 > far
+
+
+def test_import_flags_or_skips_near_duplicates_and_indexes_new_sentences(session: Session):
+    project = make_project(session)
+    session.add(Sentence(project_id=project.id, text="Ankara Türkiye'nin başkentidir."))
+    session.commit()
+
+    payload = "Kediler süt içer.\nkediler süt içer!\nANKARA, TÜRKİYE'NİN BAŞKENTİDİR\nYarın yağmur yağacak.\n"
+    result = run_import(
+        session, project, payload, SentenceImportFormat.TXT, near_duplicates=NearDuplicateMode.SKIP
+    )
+    assert (result.created, result.near_duplicates) == (2, 2)
+    in_file_match, existing_match = result.near_duplicate_matches
+    assert (in_file_match.line, in_file_match.duplicate_of_line) == (2, 1)
+    assert (existing_match.line, existing_match.sentence_id) == (3, 1)
+
+    result = run_import(session, project, "Yarın yağmur yağacak!!\n", SentenceImportFormat.TXT)
+    assert (result.created, result.near_duplicates) == (1, 1)
+
+    rain = session.exec(select(Sentence).where(Sentence.text == "Yarın yağmur yağacak.")).one()
+    index = NearDuplicateIndex(session)
+    similar = index.similar(project.id, index.signature_of(rain), exclude_id=rain.id)
+    assert [session.get(Sentence, match.sentence_id).text for match in similar] == ["Yarın yağmur yağacak!!"]
+    assert index.rebuild(project.id) == 4
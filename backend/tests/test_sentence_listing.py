@@ -0,0 +1,88 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.dependencies import CurrentUser  # noqa: E402
+from app.enums import Role, SentenceStatus  # noqa: E402
+from app.models import Assignment, Project, Sentence  # noqa: E402
+
+
+@pytest.fixture()
+def client_and_project(engine, client, act_as):
+    base = datetime(2024, 1, 1)
+    with Session(engine) as session:
+        project = Project(name="Listing")
+        session.add(project)
+        session.commit()
+        for index in range(7):
+            session.add(
+                Sentence(
+                    project_id=project.id,
+                    text=f"Cümle {index}",
+                    source="web" if index % 2 else "kitap",
+                    status=SentenceStatus.ASSIGNED if index < 3 else SentenceStatus.NEW,
+                    # Two pairs share an updated_at to exercise the id tie-breaker.
+                    updated_at=base + timedelta(minutes=index // 2),
+                )
+            )
+        session.commit()
+        session.add(Assignment(sentence_id=2, user_id=9))
+        session.add(Assignment(sentence_id=3, user_id=9, is_active=False))
+        session.commit()
+        project_id = project.id
+
+    act_as(CurrentUser(user_id=1, role=Role.ADMIN))
+    return client, project_id
+
+
+def collect(client: TestClient, url: str, **params) -> list[dict]:
+    items, cursor = [], None
+    while True:
+        response = client.get(url, params={**params, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200, response.text
+        page = response.json()
+        assert len(page["items"]) <= page["limit"]
+        items.extend(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items
+
+
+def test_keyset_pages_cover_every_sentence_once(client_and_project):
+    client, project_id = client_and_project
+    url = f"/sentences/project/{project_id}"
+
+    by_id = collect(client, url, limit=3)
+    assert [item["id"] for item in by_id] == list(range(1, 8))
+
+    by_updated = collect(client, url, limit=2, order_by="updated_at", descending=True)
+    assert [item["id"] for item in by_updated] == [7, 6, 5, 4, 3, 2, 1]
+
+    first = client.get(url, params={"limit": 3}).json()
+    assert client.get(url, params={"cursor": first["next_cursor"], "order_by": "updated_at"}).status_code == 400
+    assert client.get(url, params={"cursor": "bozuk"}).status_code == 400
+
+
+def test_filters_and_sparse_fields(client_and_project):
+    client, project_id = client_and_project
+    url = f"/sentences/project/{project_id}"
+
+    items = collect(client, url, limit=2, status="ASSIGNED", source="web", fields="text")
+    assert items == [{"id": 2, "text": "Cümle 1"}]
+
+    items = collect(client, url, status=["ASSIGNED", "NEW"], difficulty_tag="ner")
+    assert items == []
+
+    assert [item["id"] for item in collect(client, url, assignee_id=9, fields="id")] == [2]
+
+    response = client.get(url, params={"fields": "text,sifre"})
+    assert response.status_code == 400
+    assert "sifre" in response.json()["detail"]
@@ -0,0 +1,82 @@
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+from sqlmodel import Session, text
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.dependencies import CurrentUser  # noqa: E402
+from app.enums import Role  # noqa: E402
+from app.migrations import install_search_index  # noqa: E402
+from app.models import Project, Sentence  # noqa: E402
+from app.services.sentence_search import fold_search_text  # noqa: E402
+
+
+@pytest.fixture()
+def client(client, act_as):
+    act_as(CurrentUser(user_id=1, role=Role.ADMIN))
+    return client
+
+
+def search(client: TestClient, project_id: int, query: str, **params) -> list[str]:
+    response = client.get(f"/sentences/project/{project_id}/search", params={"q": query, "fields": "text", **params})
+    assert response.status_code == 200, response.text
+    return [item["text"] for item in response.json()["items"]]
+
+
+def test_search_folds_turkish_case_and_diacritics(engine, client):
+    with Session(engine) as session:
+        project, other = Project(name="Arama"), Project(name="Diğer")
+        session.add_all([project, other])
+        session.commit()
+        session.add_all(
+            [
+                Sentence(project_id=project.id, text="IŞIKLAR İstanbul'da söndü."),
+                Sentence(project_id=project.id, text="Çiçekler açtı."),
+                Sentence(project_id=other.id, text="İstanbul'da yağmur var."),
+            ]
+        )
+        session.commit()
+        # Bulk inserts bypass the ORM and are indexed by the triggers.
+        session.execute(insert(Sentence), [{"project_id": project.id, "text": "Ağaçta kuşlar ötüyor."}])
+        session.commit()
+        project_id = project.id
+
+    assert search(client, project_id, "ışıklar istanbulda") == []
+    assert search(client, project_id, "isiklar ISTANBUL'DA") == ["IŞIKLAR İstanbul'da söndü."]
+    assert search(client, project_id, "CICEKLER") == ["Çiçekler açtı."]
+    assert search(client, project_id, "agacta kuslar") == ["Ağaçta kuşlar ötüyor."]
+    assert search(client, project_id, "kuşlar ağaçta") == []
+
+    with Session(engine) as session:
+        sentence = session.get(Sentence, 2)
+        sentence.text = "Güller açtı."
+        session.add(sentence)
+        session.commit()
+    assert search(client, project_id, "çiçekler") == []
+    assert search(client, project_id, "guller") == ["Güller açtı."]
+
+    assert client.get(f"/sentences/project/{project_id}/search", params={"q": "?!"}).status_code == 400
+
+
+def test_index_is_backfilled_for_existing_databases(engine):
+    with Session(engine) as session:
+        session.exec(text("DROP TABLE sentence_fts"))
+        session.exec(text("DROP TRIGGER sentence_fts_insert"))
+        project = Project(name="Eski")
+        session.add(project)
+        session.commit()
+        session.add(Sentence(project_id=project.id, text="Öğrenciler sınava çalışıyor."))
+        session.commit()
+
+    with engine.begin() as connection:
+        install_search_index(connection)
+        install_search_index(connection)
+        rows = connection.execute(text("SELECT rowid FROM sentence_fts WHERE sentence_fts MATCH 'sinava'")).all()
+    assert rows == [(1,)]
+    assert fold_search_text("ÖĞRENCİLER Sınava") == "ogrenciler sinava"
@@ -0,0 +1,136 @@
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.orm.exc import StaleDataError
+from sqlmodel import Session
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.database import get_session  # noqa: E402
+from app.dependencies import CurrentUser, get_current_user  # noqa: E402
+from app.enums import Role, SentenceStatus  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Project, Sentence  # noqa: E402
+from app.services.workflow import apply_transition, transition_many  # noqa: E402
+
+
+def seed(engine, status: SentenceStatus) -> tuple[int, int]:
+    with Session(engine) as session:
+        project = Project(name="Sürüm")
+        session.add(project)
+        session.commit()
+        sentence = Sentence(project_id=project.id, text="Kedi uyudu.", status=status)
+        session.add(sentence)
+        session.commit()
+        return project.id, sentence.id
+
+
+def test_concurrent_transitions_of_the_same_version_conflict(engine):
+    _, sentence_id = seed(engine, SentenceStatus.IN_REVIEW)
+    with Session(engine) as first, Session(engine) as second:
+        winner = first.get(Sentence, sentence_id)
+        loser = second.get(Sentence, sentence_id)
+        assert winner.version == loser.version == 1
+
+        # Same-status transitions still write, so they are compared too.
+        apply_transition(winner, SentenceStatus.IN_REVIEW)
+        first.commit()
+        assert winner.version == 2
+
+        apply_transition(loser, SentenceStatus.ADJUDICATED)
+        with pytest.raises(StaleDataError):
+            second.commit()
+
+
+def test_bulk_transition_rejects_sentences_changed_since_loaded(engine):
+    _, sentence_id = seed(engine, SentenceStatus.ADJUDICATED)
+    with Session(engine) as session, Session(engine) as other:
+        sentence = session.get(Sentence, sentence_id)
+        apply_transition(other.get(Sentence, sentence_id), SentenceStatus.IN_REVIEW)
+        other.commit()
+
+        with pytest.raises(HTTPException) as exc_info:
+            transition_many(session, [sentence], SentenceStatus.ACCEPTED)
+        assert exc_info.value.status_code == 409
+
+        session.rollback()
+        fresh = session.get(Sentence, sentence_id)
+        transition_many(session, [fresh], SentenceStatus.ADJUDICATED)
+        session.commit()
+        assert (fresh.status, fresh.version) == (SentenceStatus.ADJUDICATED, 3)
+
+
+def test_accept_returns_409_when_the_sentence_changed_after_it_was_read(engine):
+    project_id, sentence_id = seed(engine, SentenceStatus.ADJUDICATED)
+    stale = Session(engine)
+    # The request session already holds version 1 when another writer touches the sentence.
+    loaded = stale.get(Sentence, sentence_id)
+    assert loaded.version == 1
+    with Session(engine) as other:
+        apply_transition(other.get(Sentence, sentence_id), SentenceStatus.ADJUDICATED)
+        other.commit()
+
+    def override_get_session():
+        try:
+            yield stale
+        finally:
+            stale.close()
+
+    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_current_user] = lambda: CurrentUser(
+        user_id=1, role=Role.CURATOR, project_id=project_id, project_role=Role.CURATOR
+    )
+    try:
+        response = TestClient(app).post(f"/sentences/{sentence_id}/accept")
+    finally:
+        app.dependency_overrides.clear()
+    assert response.status_code == 409
+
+    with Session(engine) as session:
+        sentence = session.get(Sentence, sentence_id)
+        assert (sentence.status, sentence.version) == (SentenceStatus.ADJUDICATED, 2)
+
+
+def test_batch_accept_returns_409_when_one_sentence_changed_after_it_was_read(engine, client, act_as):
+    with Session(engine) as session:
+        project = Project(name="Toplu sürüm")
+        session.add(project)
+        session.commit()
+        sentences = [
+            Sentence(project_id=project.id, text=f"Cümle {index}", status=SentenceStatus.ADJUDICATED)
+            for index in range(4)
+        ]
+        session.add_all(sentences)
+        session.commit()
+        # Mixed loaded versions, so the chunk is written in more than one version group.
+        apply_transition(sentences[0], SentenceStatus.ADJUDICATED)
+        session.commit()
+        project_id, sentence_ids = project.id, [sentence.id for sentence in sentences]
+
+    stale = Session(engine)
+    loaded = [stale.get(Sentence, sentence_id) for sentence_id in sentence_ids]
+    assert [sentence.version for sentence in loaded] == [2, 1, 1, 1]
+    with Session(engine) as other:
+        apply_transition(other.get(Sentence, sentence_ids[2]), SentenceStatus.ADJUDICATED)
+        other.commit()
+
+    def override_get_session():
+        try:
+            yield stale
+        finally:
+            stale.close()
+
+    app.dependency_overrides[get_session] = override_get_session
+    act_as(CurrentUser(user_id=30, role=Role.CURATOR, project_id=project_id, project_role=Role.CURATOR))
+    response = client.post(f"/sentences/project/{project_id}/accept-batch", json={"sentence_ids": sentence_ids})
+    assert response.status_code == 409
+
+    with Session(engine) as session:
+        fresh = [session.get(Sentence, sentence_id) for sentence_id in sentence_ids]
+        assert [sentence.status for sentence in fresh] == [SentenceStatus.ADJUDICATED] * 4
+        assert [sentence.version for sentence in fresh] == [2, 1, 2, 1]
@@ -0,0 +1,101 @@
+import sys
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.dependencies import CurrentUser  # noqa: E402
+from app.enums import ReviewDecision, Role, SentenceStatus  # noqa: E402
+from app.models import Adjudication, Annotation, Assignment, Project, Review, Sentence  # noqa: E402
+
+
+@pytest.fixture()
+def engine(engine):
+    with Session(engine) as session:
+        project = Project(name="Workspace")
+        session.add(project)
+        session.commit()
+        sentence = Sentence(project_id=project.id, text="Kedi uyudu.", status=SentenceStatus.IN_REVIEW)
+        session.add(sentence)
+        session.commit()
+        session.add_all(
+            [
+                Assignment(sentence_id=sentence.id, user_id=10, role=Role.ANNOTATOR, is_blind=True),
+                Assignment(sentence_id=sentence.id, user_id=11, role=Role.ANNOTATOR, is_blind=True),
+                Assignment(sentence_id=sentence.id, user_id=20, role=Role.REVIEWER, is_blind=True),
+                Assignment(sentence_id=sentence.id, user_id=21, role=Role.REVIEWER),
+                Assignment(sentence_id=sentence.id, user_id=12, role=Role.ANNOTATOR, is_active=False),
+            ]
+        )
+        first = Annotation(sentence_id=sentence.id, author_id=10, penman_text="(u / uyu-01)")
+        second = Annotation(sentence_id=sentence.id, author_id=11, penman_text="(u / uyu-02)")
+        session.add_all([first, second])
+        session.commit()
+        session.add_all(
+            [
+                Review(annotation_id=first.id, reviewer_id=20, decision=ReviewDecision.APPROVE),
+                Review(annotation_id=second.id, reviewer_id=21, decision=ReviewDecision.REJECT),
+                Adjudication(sentence_id=sentence.id, curator_id=30, final_penman="(u / uyu-01)"),
+            ]
+        )
+        session.commit()
+    return engine
+
+
+@pytest.fixture()
+def fetch(engine, client, act_as) -> Callable[[CurrentUser], tuple[dict, int]]:
+    """Load the workspace as ``user``; returns the body and the number of SQL statements run."""
+
+    def _fetch(user: CurrentUser) -> tuple[dict, int]:
+        statements = []
+
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        act_as(user)
+        event.listen(engine, "before_cursor_execute", count)
+        try:
+            response = client.get("/sentences/1/workspace")
+        finally:
+            event.remove(engine, "before_cursor_execute", count)
+        assert response.status_code == 200, response.text
+        return response.json(), len(statements)
+
+    return _fetch
+
+
+def test_curator_workspace_loads_everything_in_a_fixed_number_of_queries(fetch):
+    body, queries = fetch(CurrentUser(user_id=30, role=Role.CURATOR, project_id=1, project_role=Role.CURATOR))
+    assert body["sentence"]["text"] == "Kedi uyudu."
+    assert [annotation["author_id"] for annotation in body["annotations"]] == [11, 10]
+    assert sorted(review["reviewer_id"] for review in body["reviews"]) == [20, 21]
+    assert body["adjudication"]["curator_id"] == 30
+    assert [assignment["user_id"] for assignment in body["assignments"]] == [10, 11, 20, 21]
+    assert body["is_blind"] is False
+    # Sentence, assignments, annotations, reviews and adjudication.
+    assert queries == 5
+
+
+def test_blind_assignments_hide_other_peoples_work(fetch):
+    annotator = CurrentUser(user_id=10, role=Role.ANNOTATOR, project_id=1, project_role=Role.ANNOTATOR)
+    body, _ = fetch(annotator)
+    assert body["is_blind"] is True
+    assert [annotation["author_id"] for annotation in body["annotations"]] == [10]
+    assert body["reviews"] == [] and body["adjudication"] is None
+    assert [assignment["user_id"] for assignment in body["assignments"]] == [10]
+
+    blind_reviewer = CurrentUser(user_id=20, role=Role.REVIEWER, project_id=1, project_role=Role.REVIEWER)
+    body, _ = fetch(blind_reviewer)
+    assert len(body["annotations"]) == 2
+    assert [review["reviewer_id"] for review in body["reviews"]] == [20]
+
+    reviewer = CurrentUser(user_id=21, role=Role.REVIEWER, project_id=1, project_role=Role.REVIEWER)
+    body, _ = fetch(reviewer)
+    assert body["is_blind"] is False
+    assert len(body["reviews"]) == 2
@@ -14,7 +14,8 @@ from app.database import engine, get_session  # noqa: E402
 from app.dependencies import CurrentUser, get_current_user  # noqa: E402
 from app.enums import Role, SentenceStatus  # noqa: E402
 from app.main import app  # noqa: E402
-from app.models import Assignment, FailedSubmission, Project, Sentence  # noqa: E402
+from app.models import Assignment, FailedSubmission, Project, Sentence, ValidationReportBlob  # noqa: E402
+from app.services.failed_submissions import FailedSubmissionStore  # noqa: E402
 
 
 @pytest.fixture(autouse=True)
@@ -103,8 +104,49 @@ def test_submit_invalid_records_failed_submission_with_versions():
         assert len(failures) == 1
         failure = failures[0]
         assert failure.reason == "Validasyon başarısız."
-        assert failure.details is not None
-        assert failure.details["error_codes"] == ["parse_error"]
-        assert failure.details["rule_version"] == project.validation_rule_version
-        assert failure.details["amr_version"] == project.amr_version
-        assert failure.details["role_set_version"] == project.role_set_version
+        assert failure.primary_error_code == "parse_error"
+        assert failure.error_codes == "parse_error"
+        assert failure.report_hash is not None
+        assert failure.rule_version == project.validation_rule_version
+        details = FailedSubmissionStore(session).expand([failure])[failure.id].details
+        assert details is not None
+        assert details["error_codes"] == ["parse_error"]
+        assert details["rule_version"] == project.validation_rule_version
+        assert details["amr_version"] == project.amr_version
+        assert details["role_set_version"] == project.role_set_version
+
+
+def test_retried_failures_share_reports_and_store_penman_deltas():
+    user_context = CurrentUser(user_id=42, role=Role.ANNOTATOR, project_id=None, project_role=None)
+    client = setup_client(user_context)
+    with Session(engine) as session:
+        project = Project(name="Retry Project", description=None)
+        session.add(project)
+        session.flush()
+        sentence = Sentence(project_id=project.id, text="retry me", status=SentenceStatus.ASSIGNED)
+        session.add(sentence)
+        session.flush()
+        session.add(Assignment(sentence_id=sentence.id, user_id=user_context.user_id))
+        session.commit()
+        session.refresh(sentence)
+        user_context.project_id = project.id
+
+    attempts = [
+        "(b / buy-01 :ARG0 (p / person :name (n / name :op1 \"Ali\")) :ARG1 (c / car)",
+        "(b / buy-01 :ARG0 (p / person :name (n / name :op1 \"Ali\")) :ARG1 (c / car :mod (r / red))",
+        "(b / buy-01 :ARG0 (p / person :name (n / name :op1 \"Ali\")) :ARG1 (c / car :mod (r / red)",
+    ]
+    for attempt in attempts:
+        response = client.post(f"/sentences/{sentence.id}/submit", json={"penman_text": attempt})
+        assert response.status_code == 400
+
+    with Session(engine) as session:
+        failures = list(session.exec(select(FailedSubmission).order_by(FailedSubmission.id)))
+        assert len(failures) == 3
+        assert len(list(session.exec(select(ValidationReportBlob)))) == 1
+        assert failures[0].submitted_penman == attempts[0]
+        assert failures[1].submitted_penman is None
+        assert failures[1].penman_base_id == failures[0].id
+        assert failures[2].penman_delta_depth == 2
+        expanded = FailedSubmissionStore(session).expand(failures[2:])
+        assert expanded[failures[2].id].submitted_penman == attempts[2]
@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+from sqlmodel import Session, select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.models import User, UserProfile  # noqa: E402
+from app.services.skill_index import skill_index_cache  # noqa: E402
+
+
+def test_skill_index_is_cached_and_refreshed_on_profile_commit(session: Session, seed_project):
+    project = seed_project(session, annotators=3, sentences=1)
+    ner_user, srl_user = session.exec(select(User.id).where(User.username.in_(["ann-0", "ann-1"])).order_by(User.id))
+    index = skill_index_cache.get(session, project.id)
+    assert index.users_by_skill["ner"] == {ner_user}
+    assert skill_index_cache.get(session, project.id) is index
+
+    profile = session.exec(select(UserProfile).where(UserProfile.user_id == srl_user)).one()
+    profile.skills = ["NER", "srl"]
+    session.add(profile)
+    session.flush()
+    assert skill_index_cache.get(session, project.id) is index
+    session.commit()
+
+    refreshed = skill_index_cache.get(session, project.id)
+    assert refreshed is not index
+    assert refreshed.overlaps(["ner", "SRL"], {ner_user, srl_user}) == {ner_user: 1, srl_user: 2}
@@ -0,0 +1,145 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from typing import Optional
+
+import pytest
+from fastapi import HTTPException
+from sqlmodel import Session, select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.config import Settings, get_settings  # noqa: E402
+from app.dependencies import CurrentUser  # noqa: E402
+from app.enums import Role, SentenceStatus  # noqa: E402
+from app.models import Annotation, Assignment, AssignmentLoad, AuditLog, Project, Sentence, UserProfile  # noqa: E402
+from app.services.leases import AssignmentLeaseReaper, renew_lease  # noqa: E402
+from app.services.task_claim import TaskClaimer  # noqa: E402
+
+
+def seed(
+    session: Session, *texts: str, project_fields: Optional[dict] = None, **fields
+) -> tuple[Project, list[Sentence]]:
+    project = Project(name="Claims", **(project_fields or {}))
+    session.add(project)
+    session.flush()
+    sentences = [Sentence(project_id=project.id, text=text, **fields) for text in texts]
+    session.add_all(sentences)
+    session.commit()
+    return project, sentences
+
+
+def test_annotators_fill_quota_before_moving_on(session: Session):
+    project, sentences = seed(session, "bir", "iki", project_fields={"annotators_per_sentence": 2})
+    claimer = TaskClaimer(session)
+
+    claims = [
+        claimer.claim(project=project, user_id=user_id, role=Role.ANNOTATOR)
+        for user_id in (1, 2, 3)
+    ]
+    session.commit()
+
+    assert [claim.sentence.id for claim in claims] == [sentences[0].id, sentences[0].id, sentences[1].id]
+    assert all(claim.sentence.status == SentenceStatus.ASSIGNED for claim in claims)
+    loads = session.exec(select(AssignmentLoad.user_id, AssignmentLoad.active_count)).all()
+    assert sorted(loads) == [(1, 1), (2, 1), (3, 1)]
+
+    # The caller never gets a second slot on the same sentence.
+    again = claimer.claim(project=project, user_id=1, role=Role.ANNOTATOR)
+    assert again.sentence.id == sentences[1].id
+    with pytest.raises(HTTPException) as exc:
+        claimer.claim(project=project, user_id=4, role=Role.ANNOTATOR)
+    assert exc.value.status_code == 404
+
+
+def test_blind_and_skill_filters(session: Session):
+    project, (open_sentence, tagged) = seed(
+        session, "açık", "etiketli", project_fields={"annotators_per_sentence": 3, "blind_annotation": True}
+    )
+    tagged.difficulty_tag = "NER"
+    session.add(Assignment(sentence_id=open_sentence.id, user_id=7, is_blind=False))
+    session.add(UserProfile(user_id=1, skills=["ner"]))
+    session.add(UserProfile(user_id=2, skills=["srl"]))
+    session.commit()
+    claimer = TaskClaimer(session)
+
+    with pytest.raises(HTTPException):
+        claimer.claim(project=project, user_id=2, role=Role.ANNOTATOR)
+    # Users without a profile are held to the same tag filter as users without the skill.
+    with pytest.raises(HTTPException):
+        claimer.claim(project=project, user_id=3, role=Role.ANNOTATOR)
+    claim = claimer.claim(project=project, user_id=1, role=Role.ANNOTATOR)
+    assert claim.sentence.id == tagged.id
+    assert claim.assignment.is_blind is True
+
+
+def test_claim_endpoint_ignores_client_quota_and_blindness(session: Session, client, act_as):
+    project, (sentence,) = seed(session, "tek")
+    session.add(Assignment(sentence_id=sentence.id, user_id=7))
+    session.commit()
+
+    act_as(CurrentUser(user_id=1, role=Role.ANNOTATOR, project_id=project.id, project_role=Role.ANNOTATOR))
+    response = client.post(f"/sentences/project/{project.id}/claim", json={"per_sentence": 50, "is_blind": False})
+    assert response.status_code == 404
+
+
+def test_reviewer_claims_submitted_sentence_once_and_skips_own_work(session: Session):
+    project, (own, other) = seed(session, "kendi", "başka", status=SentenceStatus.SUBMITTED)
+    session.add(Annotation(sentence_id=own.id, author_id=5, penman_text="(a / a)"))
+    session.commit()
+    claimer = TaskClaimer(session)
+
+    claim = claimer.claim(project=project, user_id=5, role=Role.REVIEWER)
+    assert claim.sentence.id == other.id
+    assert claim.sentence.status == SentenceStatus.IN_REVIEW
+    assert claim.assignment.role == Role.REVIEWER
+    assert claimer.claim(project=project, user_id=6, role=Role.REVIEWER).sentence.id == own.id
+    with pytest.raises(HTTPException):
+        claimer.claim(project=project, user_id=7, role=Role.REVIEWER)
+    with pytest.raises(HTTPException) as exc:
+        claimer.claim(project=project, user_id=5, role=Role.CURATOR)
+    assert exc.value.status_code == 403
+
+
+def test_leases_are_disabled_by_default(session: Session):
+    project, _ = seed(session, "bir")
+    claim = TaskClaimer(session).claim(project=project, user_id=1, role=Role.ANNOTATOR)
+    assert claim.assignment.lease_expires_at is None
+    assert Settings.model_fields["assignment_lease_minutes"].default is None
+
+
+def test_expired_leases_are_reaped_and_sentences_requeued(session: Session, monkeypatch):
+    monkeypatch.setattr(get_settings(), "assignment_lease_minutes", 4320)
+    project, (first, second) = seed(session, "bir", "iki")
+    claimer = TaskClaimer(session)
+    stale = claimer.claim(project=project, user_id=1, role=Role.ANNOTATOR)
+    active = claimer.claim(project=project, user_id=2, role=Role.ANNOTATOR)
+    session.commit()
+    assert stale.assignment.lease_expires_at is not None
+
+    later = datetime.utcnow() + timedelta(days=30)
+    active.assignment.lease_expires_at = later + timedelta(hours=1)
+    session.add(active.assignment)
+    session.commit()
+    renewed = renew_lease(session, sentence_id=first.id, user_id=1)
+    assert renewed.lease_expires_at < later
+    session.commit()
+
+    result = AssignmentLeaseReaper(session).reap(now=later)
+    session.commit()
+
+    assert result.released_assignment_ids == [stale.assignment.id]
+    assert result.requeued_sentence_ids == [first.id]
+    session.expire_all()
+    assert session.get(Sentence, first.id).status == SentenceStatus.NEW
+    assert session.get(Sentence, second.id).status == SentenceStatus.ASSIGNED
+    assert session.get(Assignment, stale.assignment.id).is_active is False
+    loads = dict(session.exec(select(AssignmentLoad.user_id, AssignmentLoad.active_count)).all())
+    assert loads == {1: 0, 2: 1}
+    audit = session.exec(select(AuditLog).where(AuditLog.action == "assignment_lease_expired")).one()
+    assert (audit.before_status, audit.after_status) == ("ASSIGNED", "NEW")
+
+    assert claimer.claim(project=project, user_id=3, role=Role.ANNOTATOR).sentence.id == first.id
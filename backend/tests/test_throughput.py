@@ -0,0 +1,116 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from sqlmodel import Session, select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.enums import AssignmentStrategy, Role  # noqa: E402
+from app.models import (  # noqa: E402
+    Annotation,
+    AnnotatorThroughput,
+    AuditLog,
+    ProjectMembership,
+    Sentence,
+    ThroughputCursor,
+)
+from app.services.assignment_engine import AssignmentEngine  # noqa: E402
+from app.services.throughput import ThroughputTracker, throughput_cache  # noqa: E402
+
+
+def test_throughput_strategy_prefers_fast_accurate_annotators(session: Session, seed_project):
+    project = seed_project(session, annotators=2, sentences=4)
+    fast, slow = sorted(session.exec(select(ProjectMembership.user_id)))
+    sentences = list(session.exec(select(Sentence).order_by(Sentence.id)))
+    start = datetime(2024, 1, 1, 9, 0)
+    for sentence, user_id, minutes in ((sentences[0], fast, 10), (sentences[1], slow, 240)):
+        annotation = Annotation(sentence_id=sentence.id, author_id=user_id, penman_text="(a / a)")
+        session.add(annotation)
+        session.flush()
+        session.add_all(
+            [
+                AuditLog(
+                    action="sentence_assigned",
+                    entity_type="sentence",
+                    entity_id=sentence.id,
+                    project_id=project.id,
+                    meta={"assignee_ids": [user_id]},
+                    created_at=start,
+                ),
+                AuditLog(
+                    actor_id=user_id,
+                    action="annotation_submitted",
+                    entity_type="sentence",
+                    entity_id=sentence.id,
+                    project_id=project.id,
+                    created_at=start + timedelta(minutes=minutes),
+                ),
+                AuditLog(
+                    action="review_recorded",
+                    entity_type="sentence",
+                    entity_id=sentence.id,
+                    project_id=project.id,
+                    meta={"annotation_id": annotation.id, "decision": "approve" if user_id == fast else "reject"},
+                    created_at=start + timedelta(minutes=minutes + 5),
+                ),
+            ]
+        )
+    session.commit()
+
+    tracker = ThroughputTracker(session)
+    assert tracker.refresh(project.id) == 4
+    assert tracker.refresh(project.id) == 0
+    rates = tracker.rates(project.id, [fast, slow])
+    assert rates[fast] > rates[slow] * 2
+
+    throughput_cache.invalidate()
+    plan = AssignmentEngine(session).plan_bulk(
+        project_id=project.id,
+        strategy=AssignmentStrategy.THROUGHPUT,
+        role=Role.ANNOTATOR,
+        sentence_ids=[sentence.id for sentence in sentences],
+        count=1,
+        required_skills=None,
+    )
+    assert sum(users == [fast] for users in plan.values()) > sum(users == [slow] for users in plan.values())
+
+
+def test_throughput_reads_do_not_write_and_refresh_waits_for_the_lag(session: Session, seed_project):
+    project = seed_project(session, annotators=1, sentences=1)
+    (user_id,) = session.exec(select(ProjectMembership.user_id))
+    sentence = session.exec(select(Sentence)).one()
+    now = datetime.utcnow()
+    session.add_all(
+        [
+            AuditLog(
+                action="sentence_assigned",
+                entity_type="sentence",
+                entity_id=sentence.id,
+                project_id=project.id,
+                meta={"assignee_ids": [user_id]},
+                created_at=now - timedelta(hours=1),
+            ),
+            AuditLog(
+                actor_id=user_id,
+                action="annotation_submitted",
+                entity_type="sentence",
+                entity_id=sentence.id,
+                project_id=project.id,
+                created_at=now,
+            ),
+        ]
+    )
+    session.commit()
+
+    throughput_cache.invalidate()
+    throughput_cache.rates(session, project.id, [user_id])
+    assert not session.new and not session.dirty
+    assert session.exec(select(ThroughputCursor)).first() is None
+
+    tracker = ThroughputTracker(session)
+    assert tracker.refresh(project.id, lag_seconds=300) == 0
+    assert tracker.refresh(project.id, lag_seconds=0) == 1
+    assert session.exec(select(AnnotatorThroughput.submitted_count)).one() == 1
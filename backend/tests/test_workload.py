@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+from sqlalchemy import delete
+from sqlmodel import Session, select
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.enums import AssignmentStrategy, Role  # noqa: E402
+from app.models import Assignment, AssignmentLoad, ProjectMembership  # noqa: E402
+from app.services.assignment_engine import AssignmentEngine  # noqa: E402
+from app.services.bulk_assignment import BulkAssigner  # noqa: E402
+from app.services.workload import (  # noqa: E402
+    backfill_assignment_load,
+    read_assignment_load,
+    rebuild_assignment_load,
+    track_deactivated,
+)
+
+
+def test_workload_counters_follow_bulk_assignment_and_deactivation(session: Session, seed_project):
+    project = seed_project(session, annotators=2, sentences=3)
+    member_ids = sorted(session.exec(select(ProjectMembership.user_id)))
+    BulkAssigner(session).assign(project_id=project.id, actor_id=1, actor_role=Role.ADMIN)
+    session.commit()
+
+    load = read_assignment_load(session, project_id=project.id, role=Role.ANNOTATOR, user_ids=member_ids)
+    assert sorted(load.values()) == [1, 2]
+
+    busiest = max(member_ids, key=lambda uid: load[uid])
+    other = next(uid for uid in member_ids if uid != busiest)
+    assignments = list(session.exec(select(Assignment).where(Assignment.user_id == busiest)))
+    for assignment in assignments:
+        assignment.is_active = False
+        session.add(assignment)
+    track_deactivated(session, project.id, assignments)
+    session.commit()
+
+    load = read_assignment_load(session, project_id=project.id, role=Role.ANNOTATOR, user_ids=member_ids)
+    assert load == {other: 1}
+    picked = AssignmentEngine(session).select_assignees(
+        project_id=project.id,
+        strategy=AssignmentStrategy.ROUND_ROBIN,
+        role=Role.ANNOTATOR,
+        count=1,
+        required_skills=None,
+        provided_assignees=None,
+        exclude_user_ids=set(),
+    )
+    assert picked == [busiest]
+
+    session.exec(select(AssignmentLoad)).first().active_count = 99
+    session.commit()
+    assert rebuild_assignment_load(session, project.id) == 1
+    session.commit()
+    rows = list(session.exec(select(AssignmentLoad)))
+    assert [(row.user_id, row.active_count) for row in rows] == [(other, 1)]
+
+
+def test_backfill_counts_assignments_created_before_load_tracking(session: Session, seed_project):
+    project = seed_project(session, annotators=2, sentences=2)
+    BulkAssigner(session).assign(project_id=project.id, actor_id=1, actor_role=Role.ADMIN)
+    session.commit()
+    # An upgraded deployment has the assignments but no counters yet.
+    session.execute(delete(AssignmentLoad))
+    session.commit()
+
+    assert backfill_assignment_load(session) == [project.id]
+    session.commit()
+    assert sum(session.exec(select(AssignmentLoad.active_count))) == 2
+    assert backfill_assignment_load(session) == []
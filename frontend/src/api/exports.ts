@@ -81,7 +81,7 @@ export const toHistoryEntry = (job: ExportJob): ExportHistoryEntry => ({
   includeFailed: job.includeFailed,
   includeRejected: job.includeRejected,
   startedAt: job.createdAt,
-  completedAt: ['completed', 'failed'].includes(job.status) ? job.updatedAt : undefined,
+  completedAt: ['completed', 'failed', 'expired'].includes(job.status) ? job.updatedAt : undefined,
   fileName: job.resultPath ?? undefined,
   resultPath: job.resultPath,
   downloadUrl: job.resultPath ? exportsApi.getDownloadUrl(job.id) : undefined,
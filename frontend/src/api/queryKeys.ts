@@ -3,5 +3,6 @@ export const queryKeys = {
   annotations: (sentenceId: number) => ['sentence', sentenceId, 'annotations'] as const,
   reviews: (sentenceId: number) => ['sentence', sentenceId, 'reviews'] as const,
   adjudication: (sentenceId: number) => ['sentence', sentenceId, 'adjudication'] as const,
+  workspace: (sentenceId: number) => ['sentence', sentenceId, 'workspace'] as const,
   validation: (sentenceId: number) => ['sentence', sentenceId, 'validation'] as const,
 }
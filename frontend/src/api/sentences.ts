@@ -1,3 +1,5 @@
+import axios from 'axios'
+
 import type { AdjudicationItem } from '@/types/adjudication'
 import type { AnnotationItem } from '@/types/annotation'
 import type { Role } from '@/types/auth'
@@ -19,6 +21,28 @@ interface RawSentence {
   assignment_role?: string | null
 }
 
+interface RawSentencePage {
+  limit: number
+  next_cursor: string | null
+  items: RawSentence[]
+}
+
+export interface SentencePage {
+  items: SentenceItem[]
+  nextCursor: string | null
+}
+
+export interface SentenceListParams {
+  cursor?: string | null
+  limit?: number
+  orderBy?: 'id' | 'updated_at'
+  descending?: boolean
+  status?: SentenceStatus[]
+  difficultyTag?: string
+  source?: string
+  assigneeId?: number
+}
+
 interface RawAssignment {
   id: number
   sentence_id: number
@@ -60,6 +84,40 @@ interface RawAdjudication {
   created_at?: string
 }
 
+interface RawMyTask {
+  assignment_id: number
+  sentence_id: number
+  project_id: number
+  role: Role
+  is_blind: boolean
+  assigned_at: string
+  lease_expires_at?: string | null
+  text: string
+  status: SentenceStatus
+  priority: number
+  difficulty_tag?: string | null
+}
+
+interface RawMyTaskPage {
+  limit: number
+  next_cursor: string | null
+  status_counts: Partial<Record<SentenceStatus, number>>
+  items: RawMyTask[]
+}
+
+export interface MyTaskPage extends SentencePage {
+  statusCounts: Partial<Record<SentenceStatus, number>>
+}
+
+interface RawSentenceWorkspace {
+  sentence: RawSentence
+  annotations: RawAnnotation[]
+  reviews: RawReview[]
+  adjudication: RawAdjudication | null
+  assignments: RawAssignment[]
+  is_blind: boolean
+}
+
 interface ValidationResponse {
   is_valid: boolean
   amr_version: string
@@ -70,7 +128,7 @@ interface ValidationResponse {
   warnings: Array<{ code: string; message: string; context?: Record<string, unknown> }>
 }
 
-export type AssignmentStrategy = 'round_robin' | 'skill_based'
+export type AssignmentStrategy = 'round_robin' | 'skill_based' | 'throughput'
 
 export interface AssignmentPayload {
   assigneeIds?: number[]
@@ -94,6 +152,15 @@ export interface AssignmentItem {
   updatedAt?: string
 }
 
+export interface SentenceWorkspace {
+  sentence: SentenceItem
+  annotations: AnnotationItem[]
+  reviews: ReviewItem[]
+  adjudication: AdjudicationItem | null
+  assignments: AssignmentItem[]
+  isBlind: boolean
+}
+
 const mapSentence = (data: RawSentence): SentenceItem => {
   const status = data.status as SentenceStatus
   const assignmentRole = (data.assignment_role as SentenceItem['assignmentRole']) ?? null
@@ -150,10 +217,91 @@ const parseValidationReport = (payload?: string | null): ValidationReport | null
   }
 }
 
+const mapAnnotation = (data: RawAnnotation): AnnotationItem => ({
+  id: data.id,
+  sentenceId: data.sentence_id,
+  assignmentId: data.assignment_id,
+  authorId: data.author_id,
+  penmanText: data.penman_text,
+  validityReport: parseValidationReport(data.validity_report),
+  createdAt: data.created_at,
+})
+
+const mapReview = (data: RawReview): ReviewItem => ({
+  id: data.id,
+  annotationId: data.annotation_id,
+  reviewerId: data.reviewer_id,
+  decision: data.decision,
+  score: data.score,
+  comment: data.comment,
+  createdAt: data.created_at,
+})
+
+const mapAdjudication = (data: RawAdjudication): AdjudicationItem => ({
+  id: data.id,
+  sentenceId: data.sentence_id,
+  curatorId: data.curator_id,
+  finalPenman: data.final_penman,
+  decisionNote: data.decision_note,
+  sourceAnnotationIds: data.source_annotation_ids ?? [],
+  createdAt: data.created_at,
+})
+
+const IDEMPOTENT_ATTEMPTS = 3
+
+const newIdempotencyKey = (): string =>
+  globalThis.crypto?.randomUUID?.() ?? `${Date.now()}-${Math.random().toString(36).slice(2)}`
+
+// Retries after a lost response reuse the key, so the server replays the first result instead of applying it twice.
+const postIdempotent = async <T>(url: string, body: unknown): Promise<T> => {
+  const headers = { 'Idempotency-Key': newIdempotencyKey() }
+  for (let attempt = 1; ; attempt += 1) {
+    try {
+      const { data } = await apiClient.post<T>(url, body, { headers })
+      return data
+    } catch (error) {
+      if (attempt >= IDEMPOTENT_ATTEMPTS || !axios.isAxiosError(error) || error.response) {
+        throw error
+      }
+    }
+  }
+}
+
 export const sentencesApi = {
-  async byProject(projectId: number): Promise<SentenceItem[]> {
-    const { data } = await apiClient.get<RawSentence[]>(`/sentences/project/${projectId}`)
-    return data.map(mapSentence)
+  async byProject(projectId: number, params: SentenceListParams = {}): Promise<SentencePage> {
+    const { data } = await apiClient.get<RawSentencePage>(`/sentences/project/${projectId}`, {
+      params: {
+        cursor: params.cursor ?? undefined,
+        limit: params.limit,
+        order_by: params.orderBy,
+        descending: params.descending,
+        status: params.status,
+        difficulty_tag: params.difficultyTag,
+        source: params.source,
+        assignee_id: params.assigneeId,
+      },
+      // FastAPI reads repeated keys (status=A&status=B) as a list.
+      paramsSerializer: { indexes: null },
+    })
+    return { items: data.items.map(mapSentence), nextCursor: data.next_cursor }
+  },
+
+  async myTasks(params: { projectId?: number; cursor?: string | null; limit?: number } = {}): Promise<MyTaskPage> {
+    const { data } = await apiClient.get<RawMyTaskPage>('/sentences/tasks/mine', {
+      params: { project_id: params.projectId, cursor: params.cursor ?? undefined, limit: params.limit },
+    })
+    return {
+      items: data.items.map((task) => ({
+        id: task.sentence_id,
+        projectId: task.project_id,
+        text: task.text,
+        status: task.status,
+        difficultyTag: task.difficulty_tag,
+        assignmentRole: task.role,
+      })),
+      nextCursor: data.next_cursor,
+      statusCounts: data.status_counts,
+    }
   },
 
   async get(sentenceId: number): Promise<SentenceItem> {
@@ -161,44 +309,31 @@ export const sentencesApi = {
     return mapSentence(data)
   },
 
+  async workspace(sentenceId: number): Promise<SentenceWorkspace> {
+    const { data } = await apiClient.get<RawSentenceWorkspace>(`/sentences/${sentenceId}/workspace`)
+    return {
+      sentence: mapSentence(data.sentence),
+      annotations: data.annotations.map(mapAnnotation),
+      reviews: data.reviews.map(mapReview),
+      adjudication: data.adjudication ? mapAdjudication(data.adjudication) : null,
+      assignments: data.assignments.map(mapAssignment),
+      isBlind: data.is_blind,
+    }
+  },
+
   async annotations(sentenceId: number): Promise<AnnotationItem[]> {
     const { data } = await apiClient.get<RawAnnotation[]>(`/sentences/${sentenceId}/annotations`)
-    return data.map((item) => ({
-      id: item.id,
-      sentenceId: item.sentence_id,
-      assignmentId: item.assignment_id,
-      authorId: item.author_id,
-      penmanText: item.penman_text,
-      validityReport: parseValidationReport(item.validity_report),
-      createdAt: item.created_at,
-    }))
+    return data.map(mapAnnotation)
   },
 
   async reviews(sentenceId: number): Promise<ReviewItem[]> {
     const { data } = await apiClient.get<RawReview[]>(`/sentences/${sentenceId}/reviews`)
-    return data.map((item) => ({
-      id: item.id,
-      annotationId: item.annotation_id,
-      reviewerId: item.reviewer_id,
-      decision: item.decision,
-      score: item.score,
-      comment: item.comment,
-      createdAt: item.created_at,
-    }))
+    return data.map(mapReview)
   },
 
   async adjudication(sentenceId: number): Promise<AdjudicationItem | null> {
     const { data } = await apiClient.get<RawAdjudication | null>(`/sentences/${sentenceId}/adjudication`)
-    if (!data) return null
-    return {
-      id: data.id,
-      sentenceId: data.sentence_id,
-      curatorId: data.curator_id,
-      finalPenman: data.final_penman,
-      decisionNote: data.decision_note,
-      sourceAnnotationIds: data.source_annotation_ids ?? [],
-      createdAt: data.created_at,
-    }
+    return data ? mapAdjudication(data) : null
   },
 
   async validate(sentenceId: number, penmanText: string): Promise<ValidationReport> {
@@ -209,25 +344,17 @@ export const sentencesApi = {
   },
 
   async submitAnnotation(sentenceId: number, penmanText: string): Promise<AnnotationItem> {
-    const { data } = await apiClient.post<RawAnnotation>(`/sentences/${sentenceId}/submit`, {
+    const data = await postIdempotent<RawAnnotation>(`/sentences/${sentenceId}/submit`, {
       penman_text: penmanText,
     })
-    return {
-      id: data.id,
-      sentenceId: data.sentence_id,
-      assignmentId: data.assignment_id,
-      authorId: data.author_id,
-      penmanText: data.penman_text,
-      validityReport: parseValidationReport(data.validity_report),
-      createdAt: data.created_at,
-    }
+    return mapAnnotation(data)
   },
 
   async submitReview(
     sentenceId: number,
     payload: { annotationId: number; decision: ReviewItem['decision']; score?: number | null; comment?: string | null; isMultiAnnotator?: boolean },
   ): Promise<SentenceItem> {
-    const { data } = await apiClient.post<RawSentence>(`/sentences/${sentenceId}/review`, {
+    const data = await postIdempotent<RawSentence>(`/sentences/${sentenceId}/review`, {
       annotation_id: payload.annotationId,
       decision: payload.decision,
       score: payload.score,
@@ -241,7 +368,7 @@ export const sentencesApi = {
     sentenceId: number,
     payload: { finalPenman: string; decisionNote?: string | null; sourceAnnotationIds?: number[] | null },
   ): Promise<AdjudicationItem> {
-    const { data } = await apiClient.post<RawAdjudication>(`/sentences/${sentenceId}/adjudicate`, {
+    const data = await postIdempotent<RawAdjudication>(`/sentences/${sentenceId}/adjudicate`, {
       final_penman: payload.finalPenman,
       decision_note: payload.decisionNote,
       source_annotation_ids: payload.sourceAnnotationIds,
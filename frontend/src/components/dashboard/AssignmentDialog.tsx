@@ -134,6 +134,9 @@ export const AssignmentDialog: React.FC<AssignmentDialogProps> = ({
                 <MenuItem value="skill_based">
                   {t('pages.dashboard.assignmentDialog.strategies.skillBased')}
                 </MenuItem>
+                <MenuItem value="throughput">
+                  {t('pages.dashboard.assignmentDialog.strategies.throughput')}
+                </MenuItem>
               </Select>
               <FormHelperText>{t('pages.dashboard.assignmentDialog.strategyHelper')}</FormHelperText>
             </FormControl>
@@ -88,6 +88,7 @@ const resources = {
             strategies: {
               roundRobin: 'Round robin',
               skillBased: 'Skill based',
+              throughput: 'Throughput aware',
             },
             strategyHelper: 'Pick how AssignmentEngine will select users.',
             requiredSkillsLabel: 'Required skills',
@@ -108,6 +109,7 @@ const resources = {
           fetchProjectsError: 'Projects could not be loaded: {{error}}',
           fetchSummaryError: 'Summary could not be loaded: {{error}}',
           fetchSentencesError: 'Tasks could not be loaded: {{error}}',
+          loadMoreTasks: 'Load more tasks',
           genericError: 'Something went wrong',
         },
         annotator: {
@@ -322,6 +324,7 @@ const resources = {
             strategies: {
               roundRobin: 'Sırayla (round robin)',
               skillBased: 'Beceri uyumlu',
+              throughput: 'Hıza göre',
             },
             strategyHelper: 'AssignmentEngine kullanıcıları nasıl seçecek?',
             requiredSkillsLabel: 'Gerekli beceriler',
@@ -342,6 +345,7 @@ const resources = {
           fetchProjectsError: 'Projeler yüklenemedi: {{error}}',
           fetchSummaryError: 'Özet yüklenemedi: {{error}}',
           fetchSentencesError: 'Görevler yüklenemedi: {{error}}',
+          loadMoreTasks: 'Daha fazla görev yükle',
           genericError: 'Bir şeyler ters gitti',
         },
         annotator: {
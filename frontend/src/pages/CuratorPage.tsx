@@ -6,14 +6,13 @@ import { useState } from 'react'
 import { useTranslation } from 'react-i18next'
 
 import { queryKeys } from '@/api/queryKeys'
-import { sentencesApi } from '@/api/sentences'
+import { type SentenceWorkspace, sentencesApi } from '@/api/sentences'
 import { Spinner } from '@/components/ui/Spinner'
 import { useToast } from '@/components/ui/ToastProvider'
 import { AdjudicationForm } from '@/components/workspace/AdjudicationForm'
 import { AnnotationCard } from '@/components/workspace/AnnotationCard'
 import { PenmanDiff } from '@/components/workspace/PenmanDiff'
 import { ValidationSummary } from '@/components/workspace/ValidationSummary'
-import type { SentenceItem } from '@/types/sentence'
 import type { ValidationReport } from '@/types/validation'
 
 export const CuratorPage = () => {
@@ -36,28 +35,36 @@ export const CuratorPage = () => {
     return 'Bilinmeyen hata'
   }
 
+  // One request feeds every section; each query below selects its part of the shared result.
+  const workspaceQueryKey = sentenceId ? queryKeys.workspace(sentenceId) : ['sentence', 'workspace', 'idle']
+  const loadWorkspace = () => sentencesApi.workspace(sentenceId!)
+
   const sentenceQuery = useQuery({
-    queryKey: sentenceId ? queryKeys.sentence(sentenceId) : ['sentence', 'idle'],
-    queryFn: () => sentencesApi.get(sentenceId!),
+    queryKey: workspaceQueryKey,
+    queryFn: loadWorkspace,
     enabled: !!sentenceId,
+    select: (workspace: SentenceWorkspace) => workspace.sentence,
   })
 
   const annotationsQuery = useQuery({
-    queryKey: sentenceId ? queryKeys.annotations(sentenceId) : ['sentence', 'annotations', 'idle'],
-    queryFn: () => sentencesApi.annotations(sentenceId!),
+    queryKey: workspaceQueryKey,
+    queryFn: loadWorkspace,
     enabled: !!sentenceId,
+    select: (workspace: SentenceWorkspace) => workspace.annotations,
   })
 
   const adjudicationQuery = useQuery({
-    queryKey: sentenceId ? queryKeys.adjudication(sentenceId) : ['sentence', 'adjudication', 'idle'],
-    queryFn: () => sentencesApi.adjudication(sentenceId!),
+    queryKey: workspaceQueryKey,
+    queryFn: loadWorkspace,
     enabled: !!sentenceId,
+    select: (workspace: SentenceWorkspace) => workspace.adjudication,
   })
 
   const reviewsQuery = useQuery({
-    queryKey: sentenceId ? queryKeys.reviews(sentenceId) : ['sentence', 'reviews', 'idle'],
-    queryFn: () => sentencesApi.reviews(sentenceId!),
+    queryKey: workspaceQueryKey,
+    queryFn: loadWorkspace,
     enabled: !!sentenceId,
+    select: (workspace: SentenceWorkspace) => workspace.reviews,
   })
 
   const adjudicationSources = adjudicationQuery.data?.sourceAnnotationIds ?? []
@@ -93,23 +100,22 @@ export const CuratorPage = () => {
       }),
     onMutate: async () => {
       if (!sentenceId) return undefined
-      await queryClient.cancelQueries({ queryKey: queryKeys.sentence(sentenceId) })
-      const previous = queryClient.getQueryData<SentenceItem>(queryKeys.sentence(sentenceId))
-      queryClient.setQueryData<SentenceItem | undefined>(queryKeys.sentence(sentenceId), (old) =>
-        old ? { ...old, status: 'ADJUDICATED' } : old,
+      await queryClient.cancelQueries({ queryKey: queryKeys.workspace(sentenceId) })
+      const previous = queryClient.getQueryData<SentenceWorkspace>(queryKeys.workspace(sentenceId))
+      queryClient.setQueryData<SentenceWorkspace | undefined>(queryKeys.workspace(sentenceId), (old) =>
+        old ? { ...old, sentence: { ...old.sentence, status: 'ADJUDICATED' } } : old,
       )
       return { previous }
     },
     onError: (error, _variables, context) => {
       if (sentenceId && context?.previous) {
-        queryClient.setQueryData(queryKeys.sentence(sentenceId), context.previous)
+        queryClient.setQueryData(queryKeys.workspace(sentenceId), context.previous)
       }
       showToast(t('pages.curator.adjudicateError', { error: parseError(error) }), { variant: 'error' })
     },
     onSuccess: () => {
       if (sentenceId) {
-        void queryClient.invalidateQueries({ queryKey: queryKeys.adjudication(sentenceId) })
-        void queryClient.invalidateQueries({ queryKey: queryKeys.sentence(sentenceId) })
+        void queryClient.invalidateQueries({ queryKey: queryKeys.workspace(sentenceId) })
       }
       showToast(t('pages.curator.adjudicateSuccess'), { variant: 'success' })
     },
@@ -119,21 +125,21 @@ export const CuratorPage = () => {
     mutationFn: () => sentencesApi.accept(sentenceId!),
     onMutate: async () => {
       if (!sentenceId) return undefined
-      await queryClient.cancelQueries({ queryKey: queryKeys.sentence(sentenceId) })
-      const previous = queryClient.getQueryData<SentenceItem>(queryKeys.sentence(sentenceId))
-      queryClient.setQueryData<SentenceItem | undefined>(queryKeys.sentence(sentenceId), (old) =>
-        old ? { ...old, status: 'ACCEPTED' } : old,
+      await queryClient.cancelQueries({ queryKey: queryKeys.workspace(sentenceId) })
+      const previous = queryClient.getQueryData<SentenceWorkspace>(queryKeys.workspace(sentenceId))
+      queryClient.setQueryData<SentenceWorkspace | undefined>(queryKeys.workspace(sentenceId), (old) =>
+        old ? { ...old, sentence: { ...old.sentence, status: 'ACCEPTED' } } : old,
       )
       return { previous }
     },
     onError: (error, _variables, context) => {
       if (sentenceId && context?.previous) {
-        queryClient.setQueryData(queryKeys.sentence(sentenceId), context.previous)
+        queryClient.setQueryData(queryKeys.workspace(sentenceId), context.previous)
       }
       showToast(t('pages.curator.acceptError', { error: parseError(error) }), { variant: 'error' })
     },
     onSuccess: () => {
-      if (sentenceId) void queryClient.invalidateQueries({ queryKey: queryKeys.sentence(sentenceId) })
+      if (sentenceId) void queryClient.invalidateQueries({ queryKey: queryKeys.workspace(sentenceId) })
       showToast(t('pages.curator.acceptSuccess'), { variant: 'success' })
     },
   })
@@ -142,21 +148,21 @@ export const CuratorPage = () => {
     mutationFn: () => sentencesApi.reopen(sentenceId!, effectiveDecisionNote),
     onMutate: async () => {
       if (!sentenceId) return undefined
-      await queryClient.cancelQueries({ queryKey: queryKeys.sentence(sentenceId) })
-      const previous = queryClient.getQueryData<SentenceItem>(queryKeys.sentence(sentenceId))
-      queryClient.setQueryData<SentenceItem | undefined>(queryKeys.sentence(sentenceId), (old) =>
-        old ? { ...old, status: 'IN_REVIEW' } : old,
+      await queryClient.cancelQueries({ queryKey: queryKeys.workspace(sentenceId) })
+      const previous = queryClient.getQueryData<SentenceWorkspace>(queryKeys.workspace(sentenceId))
+      queryClient.setQueryData<SentenceWorkspace | undefined>(queryKeys.workspace(sentenceId), (old) =>
+        old ? { ...old, sentence: { ...old.sentence, status: 'IN_REVIEW' } } : old,
       )
       return { previous }
     },
     onError: (error, _variables, context) => {
       if (sentenceId && context?.previous) {
-        queryClient.setQueryData(queryKeys.sentence(sentenceId), context.previous)
+        queryClient.setQueryData(queryKeys.workspace(sentenceId), context.previous)
       }
       showToast(t('pages.curator.reopenError', { error: parseError(error) }), { variant: 'error' })
     },
     onSuccess: () => {
-      if (sentenceId) void queryClient.invalidateQueries({ queryKey: queryKeys.sentence(sentenceId) })
+      if (sentenceId) void queryClient.invalidateQueries({ queryKey: queryKeys.workspace(sentenceId) })
       showToast(t('pages.curator.reopenSuccess'), { variant: 'info' })
     },
   })
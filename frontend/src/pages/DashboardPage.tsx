@@ -1,4 +1,4 @@
-import { Stack } from '@mui/material'
+import { Button, Stack } from '@mui/material'
 import axios from 'axios'
 import { useCallback, useEffect, useState } from 'react'
 import { useTranslation } from 'react-i18next'
@@ -15,6 +15,8 @@ import { useToast } from '@/components/ui/ToastProvider'
 import type { Project, ProjectSummary } from '@/types/project'
 import type { SentenceItem } from '@/types/sentence'
 
+const SENTENCE_PAGE_SIZE = 100
+
 export const DashboardPage = () => {
   const { t } = useTranslation()
   const { user } = useAuthContext()
@@ -24,12 +26,14 @@ export const DashboardPage = () => {
   const [selectedProjectId, setSelectedProjectId] = useState<number | null>(null)
   const [projectSummary, setProjectSummary] = useState<ProjectSummary | null>(null)
   const [sentences, setSentences] = useState<SentenceItem[]>([])
+  const [sentencesCursor, setSentencesCursor] = useState<string | null>(null)
   const [isProjectsLoading, setIsProjectsLoading] = useState<boolean>(false)
   const [isSummaryLoading, setIsSummaryLoading] = useState<boolean>(false)
   const [isSentencesLoading, setIsSentencesLoading] = useState<boolean>(false)
   const [isAssigning, setIsAssigning] = useState<boolean>(false)
   const [selectedTask, setSelectedTask] = useState<SentenceItem | null>(null)
   const [summaryError, setSummaryError] = useState<string | null>(null)
+  const isAssigneeRole = user?.role === 'annotator' || user?.role === 'reviewer'
 
   const parseErrorMessage = useCallback(
     (error: unknown): string => {
@@ -80,13 +84,20 @@ export const DashboardPage = () => {
   )
 
   const fetchSentences = useCallback(
-    async (projectId: number) => {
+    async (projectId: number, cursor: string | null = null) => {
       setIsSentencesLoading(true)
       try {
-        const data = await sentencesApi.byProject(projectId)
-        setSentences(data)
+        // Annotators and reviewers work from their own assignments rather than the whole project.
+        const page = isAssigneeRole
+          ? await sentencesApi.myTasks({ projectId, cursor, limit: SENTENCE_PAGE_SIZE })
+          : await sentencesApi.byProject(projectId, { cursor, limit: SENTENCE_PAGE_SIZE })
+        setSentences((current) => (cursor ? [...current, ...page.items] : page.items))
+        setSentencesCursor(page.nextCursor)
       } catch (error) {
-        setSentences([])
+        if (!cursor) {
+          setSentences([])
+          setSentencesCursor(null)
+        }
         showToast(t('pages.dashboard.fetchSentencesError', { error: parseErrorMessage(error) }), {
           variant: 'error',
         })
@@ -94,7 +105,7 @@ export const DashboardPage = () => {
         setIsSentencesLoading(false)
       }
     },
-    [parseErrorMessage, showToast, t],
+    [isAssigneeRole, parseErrorMessage, showToast, t],
   )
 
   useEffect(() => {
@@ -105,6 +116,7 @@ export const DashboardPage = () => {
     if (!selectedProjectId) {
       setProjectSummary(null)
       setSentences([])
+      setSentencesCursor(null)
       return
     }
     void fetchSummary(selectedProjectId)
@@ -167,6 +179,17 @@ export const DashboardPage = () => {
         onAction={handleTaskAction}
       />
 
+      {selectedProjectId && sentencesCursor && (
+        <Button
+          variant="outlined"
+          sx={{ alignSelf: 'center' }}
+          disabled={isSentencesLoading}
+          onClick={() => void fetchSentences(selectedProjectId, sentencesCursor)}
+        >
+          {t('pages.dashboard.loadMoreTasks')}
+        </Button>
+      )}
+
       {selectedTask && (
         <AssignmentDialog
           key={selectedTask.id}
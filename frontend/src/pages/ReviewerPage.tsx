@@ -21,14 +21,13 @@ import { useState } from 'react'
 import { useTranslation } from 'react-i18next'
 
 import { queryKeys } from '@/api/queryKeys'
-import { sentencesApi } from '@/api/sentences'
+import { type SentenceWorkspace, sentencesApi } from '@/api/sentences'
 import { Spinner } from '@/components/ui/Spinner'
 import { useToast } from '@/components/ui/ToastProvider'
 import { AnnotationCard } from '@/components/workspace/AnnotationCard'
 import { PenmanDiff } from '@/components/workspace/PenmanDiff'
 import { ValidationSummary } from '@/components/workspace/ValidationSummary'
 import type { ReviewDecision } from '@/types/review'
-import type { SentenceItem } from '@/types/sentence'
 
 export const ReviewerPage = () => {
   const { t } = useTranslation()
@@ -53,28 +52,36 @@ export const ReviewerPage = () => {
     return 'Bilinmeyen hata'
   }
 
+  // One request feeds every section; each query below selects its part of the shared result.
+  const workspaceQueryKey = sentenceId ? queryKeys.workspace(sentenceId) : ['sentence', 'workspace', 'idle']
+  const loadWorkspace = () => sentencesApi.workspace(sentenceId!)
+
   const sentenceQuery = useQuery({
-    queryKey: sentenceId ? queryKeys.sentence(sentenceId) : ['sentence', 'idle'],
-    queryFn: () => sentencesApi.get(sentenceId!),
+    queryKey: workspaceQueryKey,
+    queryFn: loadWorkspace,
     enabled: !!sentenceId,
+    select: (workspace: SentenceWorkspace) => workspace.sentence,
   })
 
   const annotationsQuery = useQuery({
-    queryKey: sentenceId ? queryKeys.annotations(sentenceId) : ['sentence', 'annotations', 'idle'],
-    queryFn: () => sentencesApi.annotations(sentenceId!),
+    queryKey: workspaceQueryKey,
+    queryFn: loadWorkspace,
     enabled: !!sentenceId,
+    select: (workspace: SentenceWorkspace) => workspace.annotations,
   })
 
   const reviewsQuery = useQuery({
-    queryKey: sentenceId ? queryKeys.reviews(sentenceId) : ['sentence', 'reviews', 'idle'],
-    queryFn: () => sentencesApi.reviews(sentenceId!),
+    queryKey: workspaceQueryKey,
+    queryFn: loadWorkspace,
     enabled: !!sentenceId,
+    select: (workspace: SentenceWorkspace) => workspace.reviews,
   })
 
   const adjudicationQuery = useQuery({
-    queryKey: sentenceId ? queryKeys.adjudication(sentenceId) : ['sentence', 'adjudication', 'idle'],
-    queryFn: () => sentencesApi.adjudication(sentenceId!),
+    queryKey: workspaceQueryKey,
+    queryFn: loadWorkspace,
     enabled: !!sentenceId,
+    select: (workspace: SentenceWorkspace) => workspace.adjudication,
   })
 
   const reviewMutation = useMutation({
@@ -88,23 +95,22 @@ export const ReviewerPage = () => {
       }),
     onMutate: async () => {
       if (!sentenceId) return undefined
-      await queryClient.cancelQueries({ queryKey: queryKeys.sentence(sentenceId) })
-      const previous = queryClient.getQueryData<SentenceItem>(queryKeys.sentence(sentenceId))
-      queryClient.setQueryData<SentenceItem | undefined>(queryKeys.sentence(sentenceId), (old) =>
-        old ? { ...old, status: decision === 'reject' ? 'IN_REVIEW' : 'ADJUDICATED' } : old,
+      await queryClient.cancelQueries({ queryKey: queryKeys.workspace(sentenceId) })
+      const previous = queryClient.getQueryData<SentenceWorkspace>(queryKeys.workspace(sentenceId))
+      queryClient.setQueryData<SentenceWorkspace | undefined>(queryKeys.workspace(sentenceId), (old) =>
+        old ? { ...old, sentence: { ...old.sentence, status: decision === 'reject' ? 'IN_REVIEW' : 'ADJUDICATED' } } : old,
       )
       return { previous }
     },
     onError: (error, _variables, context) => {
       if (sentenceId && context?.previous) {
-        queryClient.setQueryData(queryKeys.sentence(sentenceId), context.previous)
+        queryClient.setQueryData(queryKeys.workspace(sentenceId), context.previous)
       }
       showToast(t('pages.reviewer.reviewError', { error: parseError(error) }), { variant: 'error' })
     },
     onSuccess: () => {
       if (sentenceId) {
-        void queryClient.invalidateQueries({ queryKey: queryKeys.sentence(sentenceId) })
-        void queryClient.invalidateQueries({ queryKey: queryKeys.reviews(sentenceId) })
+        void queryClient.invalidateQueries({ queryKey: queryKeys.workspace(sentenceId) })
       }
       showToast(t('pages.reviewer.reviewSuccess'), { variant: 'success' })
     },
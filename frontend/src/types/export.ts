@@ -4,7 +4,7 @@ export type ExportFormat = 'json' | 'manifest+json'
 
 export type PiiStrategy = 'include' | 'anonymize' | 'strip'
 
-export type JobStatus = 'queued' | 'running' | 'completed' | 'failed'
+export type JobStatus = 'queued' | 'running' | 'completed' | 'failed' | 'expired'
 
 export interface ExportPayload {
   projectId: number